@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from functools import partial
+import itertools
 import signal
 import requests
 import time
@@ -9,9 +10,10 @@ import aiohttp
 import json
 import traceback
 
-from msa.core.event import Event
+from msa.core.lazy_event import LazyEvent
 from msa.server.server_request import SeverRequest
-from msa.server.url_param_parser import UrlParamParser
+from msa.server.url_param_parser import UrlParamParser, split_query
+from msa.server import wire_codec
 
 
 class ApiResponse:
@@ -29,6 +31,8 @@ class ApiRestClient:
         self.base_url = "http://{}:{}".format(self.host, self.port)
 
         self.session = None
+        # set once the server has answered with the binary codec, request payloads are then sent with it too
+        self.binary = False
 
     async def connect(self):  # pragma: no coverage
         self.session = aiohttp.ClientSession()
@@ -39,8 +43,26 @@ class ApiRestClient:
 
     async def _wrap_api_call(self, func, endpoint, payload=None):
 
-        async with func(self.base_url + endpoint, json=payload) as response:
-            data = await response.json()
+        headers = {
+            "Accept": f"{wire_codec.MSA_CONTENT_TYPE}, {wire_codec.JSON_CONTENT_TYPE}"
+        }
+        if self.binary and payload is not None:
+            headers["Content-Type"] = wire_codec.MSA_CONTENT_TYPE
+            request_args = {"data": wire_codec.encode(payload)}
+        elif payload is not None:
+            headers["Content-Type"] = wire_codec.JSON_CONTENT_TYPE
+            request_args = {"data": wire_codec.encode_json(payload)}
+        else:
+            request_args = {}
+
+        async with func(
+            self.base_url + endpoint, headers=headers, **request_args
+        ) as response:
+            if response.content_type == wire_codec.MSA_CONTENT_TYPE:
+                self.binary = True
+                data = wire_codec.decode(await response.read())
+            else:
+                data = await response.json()
             return ApiResponse(data)
 
     async def get(self, endpoint):
@@ -62,7 +84,8 @@ class ApiWebsocketClient:
 
         :param loop:
         :param interact:
-        :param propagate:
+        :param propagate: Called with a queue of the events propagated to this client, as
+            `msa.core.lazy_event.LazyEvent` instances whose data is decoded when first accessed.
         :param host:
         :param port:
         """
@@ -75,9 +98,13 @@ class ApiWebsocketClient:
 
         self.message_buffer = asyncio.Queue()
 
-        self.queue = asyncio.Queue()
+        # the futures of the requests waiting for a response, by request id
+        self.pending_requests = {}
+        self.request_ids = itertools.count()
         self.propagate_queue = asyncio.Queue()
         self.client_id = None
+        # the codec the server agreed to exchange messages with, see `msa.server.wire_codec`
+        self.codec = wire_codec.JSON_CONTENT_TYPE
 
         self.client_session = None
         self.ws = None
@@ -85,7 +112,9 @@ class ApiWebsocketClient:
     async def connect(self):
         async with aiohttp.ClientSession() as session:
             self.client_session = session
-            async with session.ws_connect(self.base_url) as ws:
+            async with session.ws_connect(
+                self.base_url, params={"codec": wire_codec.MSA_CONTENT_TYPE}
+            ) as ws:
                 self.ws = ws
 
                 self.loop.create_task(self.interact())
@@ -96,19 +125,34 @@ class ApiWebsocketClient:
                 self.loop.create_task(prop())
 
                 async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        data = json.loads(msg.data)
+                    if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                        # a message that cannot be decoded is skipped rather than dropping the connection
+                        try:
+                            if msg.type == aiohttp.WSMsgType.BINARY:
+                                data = wire_codec.decode(msg.data, lazy=True)
+                            else:
+                                data = json.loads(msg.data)
+                        except (wire_codec.WireCodecException, ValueError) as e:
+                            print(
+                                f"WARNING: skipping undecodable websocket message: {e}"
+                            )
+                            continue
 
                         if data["type"] == "response":
-                            response = ApiResponse(data["payload"])
+                            self._resolve_request(
+                                data.get("id"), result=ApiResponse(data["payload"])
+                            )
 
                         elif data["type"] == "event_propagate":
-                            new_event = Event.deserialize(data["payload"])
-                            new_event.network_propagate = False
+                            new_event = data["payload"]
+                            if not isinstance(new_event, LazyEvent):
+                                new_event = LazyEvent(new_event)
+                            # routed on metadata alone, the data is only decoded by consumers that use it
                             if (
                                 new_event.propagate_target == self.client_id
                                 or new_event.propagate_target == "all"
                             ):
+                                new_event._network_propagate = False
                                 self.propagate_queue.put_nowait(new_event)
                             continue
 
@@ -117,13 +161,24 @@ class ApiWebsocketClient:
 
                         elif data["type"] == "notify_id":
                             self.client_id = data["payload"]["id"]
+                            # servers without the binary codec do not mention a codec
+                            self.codec = data["payload"].get(
+                                "codec", wire_codec.JSON_CONTENT_TYPE
+                            )
                             continue
                         elif data["type"] == "error":
-                            raise Exception(f"Bad request:\n{data['message']}")
+                            error = Exception(f"Bad request:\n{data['message']}")
+                            if "id" not in data:
+                                raise error
+                            self._resolve_request(data["id"], exception=error)
                         else:
                             raise Exception("Bad payload response:", data)
 
-                        self.queue.put_nowait(response)
+                for response in self.pending_requests.values():
+                    if not response.done():
+                        response.set_exception(
+                            ConnectionError("Websocket closed before responding.")
+                        )
 
     async def disconnect(self):  # pragma: no coverage
         if self.ws:
@@ -132,12 +187,41 @@ class ApiWebsocketClient:
         if self.client_session:
             await self.client_session.close()
 
-    async def _wrap_api_call(self, verb, endpoint, payload):
+    def _resolve_request(self, request_id, result=None, exception=None):
+        if request_id is None:
+            # servers that do not echo request ids answer requests in the order they were sent
+            if not self.pending_requests:
+                return
+            request_id = next(iter(self.pending_requests))
+
+        response = self.pending_requests.pop(request_id, None)
+        if response is None or response.done():
+            return
 
-        wrapped_payload = {"verb": verb, "route": endpoint, "payload": payload}
-        await self.ws.send_json(wrapped_payload)
-        response = await self.queue.get()
-        return response
+        if exception is not None:
+            response.set_exception(exception)
+        else:
+            response.set_result(result)
+
+    async def _wrap_api_call(self, verb, endpoint, payload):
+        request_id = next(self.request_ids)
+        response = self.loop.create_future()
+        self.pending_requests[request_id] = response
+
+        wrapped_payload = {
+            "id": request_id,
+            "verb": verb,
+            "route": endpoint,
+            "payload": payload,
+        }
+        try:
+            if self.codec == wire_codec.MSA_CONTENT_TYPE:
+                await self.ws.send_bytes(wire_codec.encode(wrapped_payload))
+            else:
+                await self.ws.send_str(wire_codec.encode_json(wrapped_payload))
+            return await response
+        finally:
+            self.pending_requests.pop(request_id, None)
 
     async def get(self, endpoint):
         return await self._wrap_api_call("get", endpoint, None)
@@ -151,6 +235,16 @@ class ApiWebsocketClient:
     async def delete(self, endpoint, payload=None):
         return await self._wrap_api_call("delete", endpoint, payload)
 
+    async def subscribe(self, patterns):
+        """
+        Limits the events the server propagates to this client to those targeted at it, and those whose type matches
+        one of the patterns.
+
+        :param patterns: Regular expressions matched against event class names, or `None` to receive every event.
+        :return: the api response
+        """
+        return await self.put("/core/propagation/subscriptions", {"patterns": patterns})
+
 
 class ApiLocalClient(dict):
     def __init__(self, loop):
@@ -162,6 +256,7 @@ class ApiLocalClient(dict):
         self.client = self
 
     async def _call_api_route(self, verb, route, payload=None):
+        route, query = split_query(route)
         func, url_params = self.route_adapter.lookup_route_and_resolve_url_params(
             verb, route
         )
@@ -175,7 +270,7 @@ class ApiLocalClient(dict):
                 f"{self.__class__.__name__}: api route is not callable: {func}"
             )
 
-        request = SeverRequest("local", verb, route, payload, url_params)
+        request = SeverRequest("local", verb, route, payload, url_params, query)
 
         try:
             response = await func(request)
@@ -71,6 +71,67 @@ async def get_version(self):
     return response.text
 
 
+async def get_bus_stats(self):
+    """
+    Fetches runtime statistics of the daemon's event bus: queue depth and overflow counters, per event type enqueue
+    counts, queue depth, queue wait time and dispatch latency, and per subscriber execution time. Latencies are
+    reported in seconds.
+
+    :async:
+    :return: `Dict` of event bus statistics.
+    """
+    response = await self.client.get("/core/bus/stats")
+
+    if not response:
+        return
+
+    if response.status != "success":
+        raise Exception(response.text)
+
+    return response.json
+
+
+async def get_dead_letters(self):
+    """
+    Fetches the events the daemon's event bus could not deliver, either because a subscriber failed on them or because
+    nothing was subscribed to them.
+
+    :async:
+    :return: `List` of dead letters, oldest first.
+    """
+    response = await self.client.get("/core/bus/dead_letters")
+
+    if not response:
+        return
+
+    if response.status != "success":
+        raise Exception(response.text)
+
+    return response.json["dead_letters"]
+
+
+async def replay_dead_letters(self, letter_id=None):
+    """
+    Delivers dead-lettered events again, removing them from the dead letter store.
+
+    :async:
+    :param int letter_id: (Optional) The id of the dead letter to replay. If not provided, all dead letters are
+        replayed.
+    :return: `int` the number of dead letters replayed.
+    """
+    response = await self.client.post(
+        "/core/bus/dead_letters/replay", payload={"id": letter_id}
+    )
+
+    if not response:
+        return
+
+    if response.status != "success":
+        raise Exception(response.text)
+
+    return response.json["replayed"]
+
+
 async def check_connection(self):
     """
     Raises an exception if the cli cannot contact the daemon.
@@ -110,4 +171,7 @@ def register_base_methods(api_wrapper):
     api_wrapper.register_method()(ping)
     api_wrapper.register_method()(check_version)
     api_wrapper.register_method()(get_version)
+    api_wrapper.register_method()(get_bus_stats)
+    api_wrapper.register_method()(get_dead_letters)
+    api_wrapper.register_method()(replay_dead_letters)
     api_wrapper.register_method()(check_connection)
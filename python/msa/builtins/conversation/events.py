@@ -10,8 +10,11 @@ class ConversationInputEvent(Event):
     - input: A conversational statement or question to the agent.
     """
 
+    __slots__ = ()
+    schema = Schema({"input": And(str, len)})
+
     def __init__(self):
-        super().__init__(priority=50, schema=Schema({"input": And(str, len)}))
+        super().__init__(priority=50)
 
 
 class ConversationOutputEvent(Event):
@@ -20,5 +23,11 @@ class ConversationOutputEvent(Event):
     - output: A conversational response to a statement or question given to the agent.
     """
 
+    __slots__ = ()
+    schema = Schema({"output": And(str, len)})
+
+    # built by handlers from their own responses
+    trusted = True
+
     def __init__(self):
-        super().__init__(priority=50, schema=Schema({"output": And(str, len)}))
+        super().__init__(priority=50)
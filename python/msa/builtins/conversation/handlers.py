@@ -43,7 +43,7 @@ class ConversationInputEventHandler(EventHandler):
             output = "I am afraid I don't know what to say."
             new_event = events.ConversationOutputEvent().init({"output": output})
 
-        get_supervisor().fire_event(new_event)
+        get_supervisor().fire_event(new_event.reply_to(event))
 
     def normalize(self, string):
         return string.strip().lower().replace("\n", "")
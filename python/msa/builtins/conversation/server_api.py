@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from msa.core import get_supervisor
+from msa.core.event_queue import EventQueueFullException
 from msa.api import ApiContext
 from msa.server.server_response import ServerResponseText, ServerResponseType
 
@@ -16,12 +17,23 @@ async def talk(request):
         ConversationOutputEvent,
     )
 
-    new_event = ConversationInputEvent().init(request.data).source(request.source)
+    new_event = (
+        ConversationInputEvent()
+        .init(request.data, validate=True)
+        .source(request.source)
+    )
 
-    supervisor = get_supervisor()
-    supervisor.fire_event(new_event)
+    try:
+        response_event = await get_supervisor().request(
+            new_event, ConversationOutputEvent
+        )
+    except EventQueueFullException as e:
+        return ServerResponseText(ServerResponseType.failure, text=str(e))
+    if response_event is None:
+        return ServerResponseText(
+            ServerResponseType.failure, "Timed out waiting for a response."
+        )
 
-    response_event = await supervisor.listen_for_result(ConversationOutputEvent)
     return ServerResponseText(ServerResponseType.success, response_event.data["output"])
 
 
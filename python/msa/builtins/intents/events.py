@@ -10,8 +10,8 @@ class IntentEvent(Event):
     - context: The data that the new event should be initialized with.
     """
 
+    __slots__ = ()
+    schema = Schema({"type": And(str, len), Optional("context"): Or(dict, None)})
+
     def __init__(self):
-        super().__init__(
-            priority=50,
-            schema=Schema({"type": And(str, len), Optional("context"): Or(dict, None)}),
-        )
+        super().__init__(priority=50)
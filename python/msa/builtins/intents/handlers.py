@@ -2,7 +2,7 @@
 from msa.core.event_handler import EventHandler
 from msa.core import get_supervisor
 from msa.builtins.intents.events import IntentEvent
-from msa.core.event import Event
+from msa.core.event_registry import event_registry
 
 
 class IntentToEventHandler(EventHandler):
@@ -22,27 +22,20 @@ class IntentToEventHandler(EventHandler):
 
         event_type = event.data["type"]
         event_data = event.data.get("context", None)
-        subclasses = Event.__subclasses__()
 
-        found_cls = False
         self.logger.debug(
             f"Attempting to translate Intent to event of type: {event_type}"
         )
-        for cls in subclasses:
-            mod = f"{cls.__module__}.{cls.__name__}"
-            self.logger.debug(f"Checking: {mod}")
-            if event_type == mod:
-                found_cls = True
-                break
-
-        if not found_cls:
+        cls = event_registry.by_name.get(event_type)
+
+        if cls is None:
             self.logger.warning(
                 f"Failed to translate Intent to Event. Could not find event: {event_type}"
             )
             return
 
         try:
-            new_event = cls().init(event_data)
+            new_event = cls().init(event_data, validate=True).reply_to(event)
         except:
             self.logger.exception(
                 "While attempting to convert an intent to an event, the event initialization failed "
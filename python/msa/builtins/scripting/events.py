@@ -13,17 +13,20 @@ class ScriptDeletedEvent(Event):
 
     """
 
+    __slots__ = ()
+    schema = Schema(
+        {
+            "name": And(str, len),
+            "status": Or("success", "failure"),
+            Optional("reason"): And(str, len),
+        }
+    )
+
+    # built by the scripting handlers
+    trusted = True
+
     def __init__(self):
-        super().__init__(
-            priority=50,
-            schema=Schema(
-                {
-                    "name": And(str, len),
-                    "status": Or("success", "failure"),
-                    Optional("reason"): And(str, len),
-                }
-            ),
-        )
+        super().__init__(priority=50)
 
 
 class TriggerDeleteScriptEvent(Event):
@@ -34,8 +37,11 @@ class TriggerDeleteScriptEvent(Event):
         The name of the script to deleted
     """
 
+    __slots__ = ()
+    schema = Schema({"name": And(str, len)})
+
     def __init__(self):
-        super().__init__(priority=50, schema=Schema({"name": And(str, len)}))
+        super().__init__(priority=50)
 
 
 class TriggerGetScriptEvent(Event):
@@ -46,8 +52,11 @@ class TriggerGetScriptEvent(Event):
         The name of the script to fetch
     """
 
+    __slots__ = ()
+    schema = Schema({"name": And(str, len)})
+
     def __init__(self):
-        super().__init__(priority=50, schema=Schema({"name": And(str, len)}))
+        super().__init__(priority=50)
 
 
 class GetScriptEvent(Event):
@@ -74,23 +83,26 @@ class GetScriptEvent(Event):
         A boolean indicating whether or not the script is currently running.
     """
 
+    __slots__ = ()
+    schema = Schema(
+        {
+            "id": int,
+            "name": And(str, len),
+            "crontab": Or(And(str, len), None),
+            "created": And(str, len),
+            "last_edited": And(str, len),
+            "last_run": Or(And(str, len), None),
+            "scheduled_for": Or(And(str, len), None),
+            "script_contents": And(str, len),
+            "running": bool,
+        }
+    )
+
+    # built by the scripting handlers from the stored script
+    trusted = True
+
     def __init__(self):
-        super().__init__(
-            priority=50,
-            schema=Schema(
-                {
-                    "id": int,
-                    "name": And(str, len),
-                    "crontab": Or(And(str, len), None),
-                    "created": And(str, len),
-                    "last_edited": And(str, len),
-                    "last_run": Or(And(str, len), None),
-                    "scheduled_for": Or(And(str, len), None),
-                    "script_contents": And(str, len),
-                    "running": bool,
-                }
-            ),
-        )
+        super().__init__(priority=50)
 
 
 class TriggerListScriptsEvent(Event):
@@ -100,8 +112,14 @@ class TriggerListScriptsEvent(Event):
     *No schema is required.*
     """
 
+    __slots__ = ()
+    schema = Schema(None)
+
+    # concurrent requests for the script list share a single database query
+    coalesce_window = 1
+
     def __init__(self):
-        super().__init__(priority=50, schema=Schema(None))
+        super().__init__(priority=50)
 
 
 class ListScriptsEvent(Event):
@@ -126,26 +144,29 @@ class ListScriptsEvent(Event):
         A boolean indicating whether or not the script is currently running.
     """
 
-    def __init__(self):
-        super().__init__(
-            priority=50,
-            schema=Schema(
+    __slots__ = ()
+    schema = Schema(
+        {
+            "scripts": [
                 {
-                    "scripts": [
-                        {
-                            "id": int,
-                            "name": And(str, len),
-                            "crontab": Or(And(str, len), None),
-                            "created": And(str, len),
-                            "last_edited": And(str, len),
-                            "last_run": Or(And(str, len), None),
-                            "scheduled_for": Or(And(str, len), None),
-                            "running": bool,
-                        }
-                    ]
+                    "id": int,
+                    "name": And(str, len),
+                    "crontab": Or(And(str, len), None),
+                    "created": And(str, len),
+                    "last_edited": And(str, len),
+                    "last_run": Or(And(str, len), None),
+                    "scheduled_for": Or(And(str, len), None),
+                    "running": bool,
                 }
-            ),
-        )
+            ]
+        }
+    )
+
+    # built by the scripting handlers from the stored scripts
+    trusted = True
+
+    def __init__(self):
+        super().__init__(priority=50)
 
 
 class AddScriptEvent(Event):
@@ -161,17 +182,17 @@ class AddScriptEvent(Event):
         The contents of the script to be submitted.
     """
 
+    __slots__ = ()
+    schema = Schema(
+        {
+            "name": And(str, len, lambda s: (sum(c.isspace() for c in s) == 0)),
+            Optional("crontab"): And(str, len, croniter.is_valid),
+            "script_contents": And(str, len),
+        }
+    )
+
     def __init__(self):
-        super().__init__(
-            priority=100,
-            schema=Schema(
-                {
-                    "name": And(str, len, lambda s: (sum(c.isspace() for c in s) == 0)),
-                    Optional("crontab"): And(str, len, croniter.is_valid),
-                    "script_contents": And(str, len),
-                }
-            ),
-        )
+        super().__init__(priority=100)
 
 
 class AddScriptFailedEvent(Event):
@@ -188,17 +209,20 @@ class AddScriptFailedEvent(Event):
         and should be simple enough to use with a Text-to-Speech service.
     """
 
+    __slots__ = ()
+    schema = Schema(
+        {
+            "error": And(str, len),
+            "description": And(str, len),
+            "description_verbose": And(str, len),
+        }
+    )
+
+    # built by the scripting handlers
+    trusted = True
+
     def __init__(self):
-        super().__init__(
-            priority=20,
-            schema=Schema(
-                {
-                    "error": And(str, len),
-                    "description": And(str, len),
-                    "description_verbose": And(str, len),
-                }
-            ),
-        )
+        super().__init__(priority=20)
 
 
 class TriggerScriptRunEvent(Event):
@@ -209,8 +233,11 @@ class TriggerScriptRunEvent(Event):
         The name of the script that should be run
     """
 
+    __slots__ = ()
+    schema = Schema({"name": And(str, len)})
+
     def __init__(self):
-        super().__init__(priority=50, schema=Schema({"name": And(str, len)}))
+        super().__init__(priority=50)
 
 
 class RunScriptResultEvent(Event):
@@ -225,14 +252,13 @@ class RunScriptResultEvent(Event):
         A string containing any log messages produced by the script.
     """
 
+    __slots__ = ()
+    schema = Schema(
+        {"name": And(str, len), "error": Or(None, And(str, len)), "log": And(str),}
+    )
+
+    # built by the scripting handlers from the script run
+    trusted = True
+
     def __init__(self):
-        super().__init__(
-            priority=50,
-            schema=Schema(
-                {
-                    "name": And(str, len),
-                    "error": Or(None, And(str, len)),
-                    "log": And(str),
-                }
-            ),
-        )
+        super().__init__(priority=50)
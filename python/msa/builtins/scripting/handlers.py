@@ -65,7 +65,7 @@ class AddScriptHandler(EventHandler):
                     ),
                 }
             )
-            get_supervisor().fire_event(new_event)
+            get_supervisor().fire_event(new_event.reply_to(event))
 
 
 class TriggerScriptRunHandler(EventHandler):
@@ -97,7 +97,7 @@ class TriggerScriptRunHandler(EventHandler):
             run_script_event = events.RunScriptResultEvent().init(
                 {"name": event.data["name"], "error": msg, "log": ""}
             )
-            get_supervisor().fire_event(run_script_event)
+            get_supervisor().fire_event(run_script_event.reply_to(event))
 
 
 class StartupEventHandler(EventHandler):
@@ -169,7 +169,7 @@ class TriggerScriptListHandler(EventHandler):
 
             scripts.append(script)
 
-        new_event = events.ListScriptsEvent().init({"scripts": scripts})
+        new_event = events.ListScriptsEvent().init({"scripts": scripts}).reply_to(event)
         get_supervisor().fire_event(new_event)
 
 
@@ -216,7 +216,7 @@ class TriggerGetScriptHandler(EventHandler):
             "scheduled_for": scheduled_for,
         }
 
-        new_event = events.GetScriptEvent().init(script)
+        new_event = events.GetScriptEvent().init(script).reply_to(event)
         get_supervisor().fire_event(new_event)
 
 
@@ -248,7 +248,7 @@ class TriggerDeleteScriptHandler(EventHandler):
                     "reason": f"Unable to find script with name {entity_name}.",
                 }
             )
-            get_supervisor().fire_event(new_event)
+            get_supervisor().fire_event(new_event.reply_to(event))
             return
 
         if script_entity.name in self.script_execution_manager.running_scripts:
@@ -274,7 +274,7 @@ class TriggerDeleteScriptHandler(EventHandler):
                         "reason": f"Failed to cancel script with name {entity_name}.",
                     }
                 )
-                get_supervisor().fire_event(new_event)
+                get_supervisor().fire_event(new_event.reply_to(event))
                 return
         else:
             self.logger.debug(
@@ -300,11 +300,11 @@ class TriggerDeleteScriptHandler(EventHandler):
                     "reason": f"Failed to delete script with name {entity_name}.",
                 }
             )
-            get_supervisor().fire_event(new_event)
+            get_supervisor().fire_event(new_event.reply_to(event))
             return
 
         # record that the event has been successfully deleted
         new_event = events.ScriptDeletedEvent().init(
             {"name": entity_name, "status": "success"}
         )
-        get_supervisor().fire_event(new_event)
+        get_supervisor().fire_event(new_event.reply_to(event))
@@ -1,4 +1,5 @@
 from msa.core import get_supervisor
+from msa.core.event_queue import EventQueueFullException
 from msa.server.server_response import (
     ServerResponseText,
     ServerResponseType,
@@ -14,7 +15,7 @@ async def add_script(request):
     """
     from msa.builtins.scripting.events import AddScriptEvent
 
-    new_event = AddScriptEvent().init(request.data)
+    new_event = AddScriptEvent().init(request.data, validate=True)
     get_supervisor().fire_event(new_event)
 
     return ServerResponseText(
@@ -35,9 +36,15 @@ async def list_scripts(request):
     from msa.builtins.scripting.events import TriggerListScriptsEvent, ListScriptsEvent
 
     new_event = TriggerListScriptsEvent().init(None)
-    get_supervisor().fire_event(new_event)
 
-    response_event = await get_supervisor().listen_for_result(ListScriptsEvent)
+    try:
+        response_event = await get_supervisor().request(new_event, ListScriptsEvent)
+    except EventQueueFullException as e:
+        return ServerResponseText(ServerResponseType.failure, text=str(e))
+    if response_event is None:
+        return ServerResponseText(
+            ServerResponseType.failure, "Timed out waiting for the script list."
+        )
 
     return ServerResponseJson(
         ServerResponseType.success, payload={"scripts": response_event.data["scripts"]}
@@ -56,10 +63,18 @@ async def get_script(request):
 
     from msa.builtins.scripting.events import TriggerGetScriptEvent, GetScriptEvent
 
-    new_event = TriggerGetScriptEvent().init({"name": request.url_variables["name"]})
-    get_supervisor().fire_event(new_event)
+    new_event = TriggerGetScriptEvent().init(
+        {"name": request.url_variables["name"]}, validate=True
+    )
 
-    response_event = await get_supervisor().listen_for_result(GetScriptEvent)
+    try:
+        response_event = await get_supervisor().request(new_event, GetScriptEvent)
+    except EventQueueFullException as e:
+        return ServerResponseText(ServerResponseType.failure, text=str(e))
+    if response_event is None:
+        return ServerResponseText(
+            ServerResponseType.failure, "Timed out waiting for the script."
+        )
 
     return ServerResponseJson(
         ServerResponseType.success, payload={"script": response_event.data}
@@ -81,10 +96,19 @@ async def delete_script(request):
         ScriptDeletedEvent,
     )
 
-    new_event = TriggerDeleteScriptEvent().init({"name": request.url_variables["name"]})
-    get_supervisor().fire_event(new_event)
+    new_event = TriggerDeleteScriptEvent().init(
+        {"name": request.url_variables["name"]}, validate=True
+    )
 
-    response_event = await get_supervisor().listen_for_result(ScriptDeletedEvent)
+    try:
+        response_event = await get_supervisor().request(new_event, ScriptDeletedEvent)
+    except EventQueueFullException as e:
+        return ServerResponseText(ServerResponseType.failure, text=str(e))
+    if response_event is None:
+        return ServerResponseText(
+            ServerResponseType.failure,
+            "Timed out waiting for the script to be deleted.",
+        )
 
     return ServerResponseJson(ServerResponseType.success, payload=response_event.data)
 
@@ -1,4 +1,6 @@
-from schema import Schema
+from schema import Schema, And, Optional, Or
+
+from msa.core.supervisor import RESULT_TIMEOUT
 from msa.builtins.signals import handlers
 from msa.builtins.signals import server_api
 from msa.builtins.signals import client_api
@@ -17,4 +19,15 @@ entities_list = []
 register_client_api = client_api.register_endpoints
 register_server_api = server_api.register_routes
 
-config_schema = Schema(None)
+config_schema = Schema(
+    Or(
+        None,
+        {
+            Optional("buffer_size"): And(int, lambda size: size > 0),
+            # polls are answered before the api route stops waiting for the reply
+            Optional("poll_timeout"): And(
+                Or(int, float), lambda timeout: 0 <= timeout < RESULT_TIMEOUT
+            ),
+        },
+    )
+)
@@ -15,9 +15,7 @@ async def trigger_event(self, event):
             "WARNING: event._network_propagate is not True, cancelling network propagation."
         )
 
-    response = await self.client.post(
-        "/signals/trigger_event", payload=event.get_metadata()
-    )
+    response = await self.client.post("/signals/trigger_event", payload=event)
 
     if not response:
         return
@@ -25,28 +23,39 @@ async def trigger_event(self, event):
         raise Exception(response.json["message"])
 
 
-async def get_events(self):
+async def get_events(self, after=None):
     """
-    Fetches any events that have not been dispersed to clients.
+    Fetches the network events fired since the previous call, waiting for one if there are none yet. The daemon gives
+    up waiting after its poll timeout, in which case no events are returned.
 
     :async:
+    :param int after: (Optional) The sequence number of the last event already received. Defaults to the sequence
+        number reached by the previous call, or to 0 on the first call.
     :return: List[msa.core.event.Event]
     """
-    response = await self.client.get("/signals/events")
+    if after is None:
+        after = self.get("signals_seq", 0)
+
+    response = await self.client.get(f"/signals/events?after={after}")
 
     if not response:
         return
     if response.status != "success":
         raise Exception(response.raw)
 
-    # load disburse event
-    disburse_event = Event.deserialize(response.json)
+    self.signals_seq = response.json["seq"]
+    if response.json["missed"]:
+        print(
+            "WARNING: some network events were dropped by the daemon before they were fetched."
+        )
 
-    # load sent events
+    # load sent events, local clients are handed the events themselves
     deserialized_events = []
-    for raw_event in disburse_event.data["events"]:
-        new_event = Event.deserialize(raw_event)
-        deserialized_events.append(new_event)
+    for raw_event in response.json["events"]:
+        if isinstance(raw_event, Event):
+            deserialized_events.append(raw_event)
+        else:
+            deserialized_events.append(Event.deserialize(raw_event))
 
     return deserialized_events
 
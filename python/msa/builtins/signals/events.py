@@ -1,5 +1,5 @@
 import datetime
-from schema import Schema, And, Or
+from schema import Schema, And, Optional, Or
 
 from msa.core.event import Event
 
@@ -10,23 +10,57 @@ class StartupEvent(Event):
     - timestamp: datetime in yyyy-mm-dd hh:mm:ss:xx format of starup event
     """
 
+    __slots__ = ()
+    schema = Schema({"timestamp": And(str, len)})
+
+    # built by the startup trigger
+    trusted = True
+
     def __init__(self):
-        super().__init__(priority=0, schema=Schema({"timestamp": And(str, len)}))
+        super().__init__(priority=0)
 
 
 class RequestDisburseEventsToNetworkEvent(Event):
     """
     RequestDisburseEventsToClientEvent schema:
+    - after: (Optional) the sequence number of the last event the client already received, defaults to 0
     """
 
+    __slots__ = ()
+    schema = Schema({Optional("after"): And(int, lambda after: after >= 0)})
+
+    # clients polling from the same sequence number at the same time are handed the same reply
+    coalesce_window = 0.5
+
     def __init__(self):
-        super().__init__(priority=0, schema=Schema({}))
+        super().__init__(priority=0)
 
 
 class DisburseEventsToNetworkEvent(Event):
     """
     DisburseEventsToNetworkEvent schema:
+    - events: the buffered events after the requested sequence number, or their metadata once serialized
+    - seq: the sequence number of the last buffered event, to poll from next
+    - missed: whether events after the requested sequence number were dropped from the buffer before being requested
     """
 
+    __slots__ = ()
+    schema = Schema({"events": [Or(Event, dict)], "seq": int, "missed": bool})
+
+    # built from events that were validated when they were fired
+    trusted = True
+
     def __init__(self):
-        super().__init__(priority=0, schema=Schema({"events": [dict]}))
+        super().__init__(priority=0)
+
+    def get_metadata(self):
+        # the buffered events are serialized by their metadata, so that this event can be journaled like any other
+        metadata = super().get_metadata()
+        metadata["event_data"] = {
+            **self.data,
+            "events": [
+                event.get_metadata() if isinstance(event, Event) else event
+                for event in self.data["events"]
+            ],
+        }
+        return metadata
@@ -1,9 +1,17 @@
 from collections import deque
 import datetime
+from itertools import islice
 from msa.core.event_handler import EventHandler
 from msa.core import get_supervisor
+from msa.core.event import Event
 from msa.builtins.signals import events
 
+# the number of network events kept for clients polling for them
+DEFAULT_BUFFER_SIZE = 100
+
+# seconds a poll for network events is held open waiting for an event
+DEFAULT_POLL_TIMEOUT = 20
+
 
 class StartupEventTrigger(EventHandler):
     """
@@ -26,27 +34,81 @@ class StartupEventTrigger(EventHandler):
 
 
 class NetworkPropagateEventHandler(EventHandler):
+    """
+    Buffers the events propagated to the network, numbered in sequence, for clients that poll for them. A poll for the
+    events after a sequence number is answered straight away if there are any, and otherwise held until one arrives or
+    the poll timeout passes. Only the latest events are kept, a poll for events that were dropped from the buffer is
+    answered with the events still buffered and told that it missed some.
+    """
+
     def __init__(self, loop, event_bus, logger, config=None):
         super().__init__(loop, event_bus, logger, config)
 
-        event_bus.subscribe(".*", self.handle)
+        event_bus.subscribe(Event, self.handle)
 
-        self.buffered_events = deque(maxlen=10)
+        config = config or {}
+        self.poll_timeout = config.get("poll_timeout", DEFAULT_POLL_TIMEOUT)
+        # the latest events, oldest first, numbered in sequence up to `seq`
+        self.buffered_events = deque(
+            maxlen=config.get("buffer_size", DEFAULT_BUFFER_SIZE)
+        )
+        self.seq = 0
+        # polls waiting for an event, with the timer answering them once the poll timeout passes
+        self.waiting_polls = []
 
-    async def handle(self, event):
+    def handle(self, event):
 
         if isinstance(event, events.RequestDisburseEventsToNetworkEvent):
-            self.handle_disburse_request()
+            self.handle_disburse_request(event)
             return
 
         if not event._network_propagate:
             return
 
+        self.seq += 1
         self.buffered_events.append(event)
 
-    def handle_disburse_request(self):
-        new_event = events.DisburseEventsToNetworkEvent().init(
-            {"events": [event.get_metadata() for event in self.buffered_events]}
+        waiting_polls, self.waiting_polls = self.waiting_polls, []
+        for request_event, timer in waiting_polls:
+            timer.cancel()
+            self.disburse(request_event)
+
+    def handle_disburse_request(self, request_event):
+        after = request_event.data.get("after", 0)
+        if after != self.seq or self.poll_timeout == 0:
+            self.disburse(request_event)
+            return
+
+        timer = self.loop.call_later(self.poll_timeout, self.expire_poll, request_event)
+        self.waiting_polls.append((request_event, timer))
+
+    def expire_poll(self, request_event):
+        self.waiting_polls = [
+            poll for poll in self.waiting_polls if poll[0] is not request_event
+        ]
+        self.disburse(request_event)
+
+    def disburse(self, request_event):
+        after = request_event.data.get("after", 0)
+        first_seq = self.seq - len(self.buffered_events) + 1
+        # a cursor ahead of the buffer was handed out before a restart
+        missed = after > self.seq or after < first_seq - 1
+        if after > self.seq:
+            after = 0
+
+        new_event = (
+            events.DisburseEventsToNetworkEvent()
+            .init(
+                {
+                    "events": list(
+                        islice(
+                            self.buffered_events, max(after - first_seq + 1, 0), None
+                        )
+                    ),
+                    "seq": self.seq,
+                    "missed": missed,
+                }
+            )
+            .reply_to(request_event)
         )
-        self.buffered_events.clear()
         get_supervisor().fire_event(new_event)
@@ -14,9 +14,17 @@ async def trigger_event(request):
     :return:
     """
     from msa.core.event import Event
+    from msa.core.event_queue import EventQueueFullException
 
-    new_event = Event.deserialize(request.data)
-    get_supervisor().fire_event(new_event)
+    # local clients pass the event itself
+    if isinstance(request.data, Event):
+        new_event = request.data
+    else:
+        new_event = Event.deserialize(request.data)
+    try:
+        await get_supervisor().fire_event(new_event)
+    except EventQueueFullException as e:
+        return ServerResponseText(ServerResponseType.failure, text=str(e))
 
     return ServerResponseText(
         ServerResponseType.success, text=f"Event {new_event} sucessfully triggered."
@@ -25,6 +33,8 @@ async def trigger_event(request):
 
 async def get_events(request):
     """
+    Long polls for the network events after the sequence number given by the `after` query parameter, 0 if not
+    provided.
 
     :param request:
     :return:
@@ -34,16 +44,36 @@ async def get_events(request):
         RequestDisburseEventsToNetworkEvent,
         DisburseEventsToNetworkEvent,
     )
+    from msa.core.event_queue import EventQueueFullException
 
-    new_event = RequestDisburseEventsToNetworkEvent().init({})
-    get_supervisor().fire_event(new_event)
+    after = request.query.get("after", "0")
+    if not after.isdigit():
+        return ServerResponseText(
+            ServerResponseType.failure,
+            "The after query parameter must be a sequence number.",
+        )
 
-    response_event = await get_supervisor().listen_for_result(
-        DisburseEventsToNetworkEvent
-    )
+    new_event = RequestDisburseEventsToNetworkEvent().init({"after": int(after)})
+
+    try:
+        response_event = await get_supervisor().request(
+            new_event, DisburseEventsToNetworkEvent
+        )
+    except EventQueueFullException as e:
+        return ServerResponseText(ServerResponseType.failure, text=str(e))
+    if response_event is None:
+        return ServerResponseText(
+            ServerResponseType.failure, "Timed out waiting for network events."
+        )
 
+    # the events are carried as binary records to clients that accept the binary encoding
     return ServerResponseJson(
-        ServerResponseType.success, payload=response_event.get_metadata()
+        ServerResponseType.success,
+        payload={
+            "events": response_event.data["events"],
+            "seq": response_event.data["seq"],
+            "missed": response_event.data["missed"],
+        },
     )
 
 
@@ -0,0 +1,141 @@
+import time
+
+# seconds to keep forwarding replies to merged requesters after the coalescing window has closed, for handlers that
+# reply late
+COALESCE_REPLY_TIMEOUT = 30
+
+
+class CoalescedEvent:
+    """An event dispatched once on behalf of itself and of the duplicates merged into it.
+
+    Attributes
+    ----------
+    event : msa.core.event.Event
+        The event that is dispatched, the first of its duplicates to be fired.
+    aliases : List[str]
+        The correlation ids of the merged duplicates. Replies to `event` are also delivered to result listeners
+        waiting on these.
+    replies : List[msa.core.event.Event]
+        Replies to `event` seen so far, handed to duplicates merged after they arrived.
+    expires_at : Optional[float]
+        The `time.monotonic` time the coalescing window closes. `None` while the event has not been dispatched yet."""
+
+    def __init__(self, key, event):
+        self.key = key
+        self.event = event
+        self.aliases = []
+        self.replies = []
+        self.expires_at = None
+        self.merged = 0
+
+
+class CoalesceIndex:
+    """Tracks coalescable events that are queued, or whose coalescing window is still open, so that duplicates can be
+    merged into them. See `msa.core.event.Event.coalesce_window`."""
+
+    def __init__(self):
+        self.by_key = {}
+        self.by_correlation = {}
+
+    @staticmethod
+    def get_key(event):
+        if type(event).coalesce_window is None:
+            return None
+        return type(event), event.coalesce_key()
+
+    def merge(self, event):
+        """Merges an event into a queued or recently dispatched duplicate of it.
+
+        Returns
+        -------
+        Optional[CoalescedEvent]
+            The duplicate the event was merged into, in which case the event should not be queued. `None` if the event
+            is not coalescable or has no duplicate, in which case it is tracked so that later duplicates can merge into
+            it."""
+        key = self.get_key(event)
+        if key is None:
+            return None
+
+        now = time.monotonic()
+        self.sweep(now)
+
+        record = self.by_key.get(key)
+        if record is not None and self._can_merge(record, event, now):
+            record.merged += 1
+            primary = record.event
+            if event.correlation_id is not None:
+                if primary.correlation_id is None:
+                    # still queued, so replies to the primary can carry the requester's id
+                    primary.correlation_id = event.correlation_id
+                    self.by_correlation[primary.correlation_id] = record
+                elif event.correlation_id != primary.correlation_id:
+                    record.aliases.append(event.correlation_id)
+            return record
+
+        record = CoalescedEvent(key, event)
+        self.by_key[key] = record
+        if event.correlation_id is not None:
+            self.by_correlation[event.correlation_id] = record
+        return None
+
+    @staticmethod
+    def _can_merge(record, event, now):
+        if record.expires_at is None:
+            return True
+        if now > record.expires_at:
+            return False
+
+        # replies to an uncorrelated primary could never be matched back to the requester
+        return event.correlation_id is None or record.event.correlation_id is not None
+
+    def discard(self, event):
+        """Stops tracking an event that was dropped rather than queued."""
+        key = self.get_key(event)
+        record = self.by_key.get(key)
+        if record is not None and record.event is event:
+            del self.by_key[key]
+            if event.correlation_id is not None:
+                self.by_correlation.pop(event.correlation_id, None)
+
+    def dispatched(self, event):
+        """Opens the coalescing window of an event once it has been dispatched."""
+        key = self.get_key(event)
+        record = self.by_key.get(key)
+        if record is not None and record.event is event:
+            record.expires_at = time.monotonic() + type(event).coalesce_window
+
+    def replied(self, reply):
+        """Records a reply to a coalesced event, and returns the correlation ids of the merged duplicates that should
+        receive it as well."""
+        if reply.correlation_id is None:
+            return ()
+
+        record = self.by_correlation.get(reply.correlation_id)
+        if record is None or record.event is reply:
+            return ()
+
+        record.replies.append(reply)
+        return record.aliases
+
+    def sweep(self, now):
+        """Forgets events whose coalescing window has closed."""
+        expired = [
+            key
+            for key, record in self.by_key.items()
+            if record.expires_at is not None and now > record.expires_at
+        ]
+        for key in expired:
+            del self.by_key[key]
+
+        stale = [
+            correlation_id
+            for correlation_id, record in self.by_correlation.items()
+            if record.expires_at is not None
+            and now > record.expires_at
+            and (
+                len(record.replies) > 0
+                or now > record.expires_at + COALESCE_REPLY_TIMEOUT
+            )
+        ]
+        for correlation_id in stale:
+            del self.by_correlation[correlation_id]
@@ -1,9 +1,11 @@
 import json
 import logging
 from types import MappingProxyType
-from schema import Schema, And, Or, Use
+from schema import Schema, And, Or, Use, Optional
 from pathlib import Path
 
+from msa.core.event_queue import OverflowPolicy
+
 CONFIG_SCHEMA = Schema(
     {
         "agent": {"name": And(str, len), "user_title": And(str, len)},
@@ -33,6 +35,35 @@ CONFIG_SCHEMA = Schema(
             ],
             "truncate_log_file": bool,
         },
+        Optional("event_bus"): {
+            Optional("max_queue_size"): And(int, lambda n: n >= 0),
+            Optional("overflow_policy"): And(str, Use(OverflowPolicy)),
+            Optional("process_modules"): [And(str, len)],
+            Optional("retry"): {
+                Optional("max_attempts"): And(int, lambda n: n >= 1),
+                Optional("delay"): And(Or(int, float), lambda n: n >= 0),
+                Optional("backoff"): And(Or(int, float), lambda n: n >= 1),
+            },
+            Optional("dead_letter_size"): And(int, lambda n: n >= 0),
+            Optional("journal"): {
+                "directory": And(str, len),
+                Optional("segment_size"): And(int, lambda n: n > 0),
+                Optional("sync_interval"): And(Or(int, float), lambda n: n >= 0),
+            },
+            Optional("lanes"): And(
+                [
+                    {
+                        "name": And(str, len),
+                        Optional("max_priority"): Or(None, int),
+                        Optional("weight"): And(int, lambda n: n >= 1),
+                        Optional("max_wait"): Or(
+                            None, And(Or(int, float), lambda n: n > 0)
+                        ),
+                    }
+                ],
+                len,
+            ),
+        },
     }
 )
 
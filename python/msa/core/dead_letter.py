@@ -0,0 +1,104 @@
+import itertools
+import time
+from collections import deque
+from enum import Enum
+
+from msa.core.event_bus_stats import get_name
+
+DEFAULT_DEAD_LETTER_SIZE = 100
+
+
+class DeadLetterReason(Enum):
+    # a subscriber raised an exception while handling the event, after any retries
+    failed = "failed"
+
+    # nothing was subscribed to the event type when it was fired or dispatched
+    unroutable = "unroutable"
+
+
+class RetryPolicy:
+    """How often a failing subscriber is retried before its event is dead-lettered.
+
+    Attempts are made inline, so while a sequentially dispatched subscriber is being retried the event bus waits for it.
+    Keep the delay short, or subscribe slow and flaky handlers with `DispatchMode.concurrent`."""
+
+    def __init__(self, max_attempts=1, delay=0.0, backoff=2.0):
+        """Creates a new retry policy.
+
+        Parameters
+        ----------
+        max_attempts : int
+            The total number of times a subscriber is called with an event, including the first call. `1` disables
+            retries.
+        delay : float
+            Seconds to wait before the first retry.
+        backoff : float
+            The delay is multiplied by this factor after each retry."""
+        self.max_attempts = max(max_attempts, 1)
+        self.delay = delay
+        self.backoff = backoff
+
+    def get_delay(self, attempt):
+        """Returns the number of seconds to wait after a failed attempt, attempts being numbered from 1."""
+        return self.delay * (self.backoff ** (attempt - 1))
+
+
+class DeadLetter:
+    """An event that could not be delivered, along with why."""
+
+    def __init__(self, letter_id, event, reason, callback=None, error=None, attempts=0):
+        self.id = letter_id
+        self.event = event
+        self.reason = reason
+        self.callback = callback
+        self.error = error
+        self.attempts = attempts
+        self.time = time.time()
+
+    def get_data(self):
+        return {
+            "id": self.id,
+            "reason": self.reason.value,
+            "event": self.event.get_metadata(),
+            "subscriber": None if self.callback is None else get_name(self.callback),
+            "error": None if self.error is None else repr(self.error),
+            "attempts": self.attempts,
+            "time": self.time,
+        }
+
+
+class DeadLetterStore:
+    """A bounded store of dead letters. Once full, the oldest dead letter is discarded to make room for a new one."""
+
+    def __init__(self, max_size=DEFAULT_DEAD_LETTER_SIZE):
+        self.letters = deque(maxlen=max_size)
+        self._ids = itertools.count(1)
+        self.counters = {reason.value: 0 for reason in DeadLetterReason}
+        self.discarded = 0
+
+    def add(self, event, reason, callback=None, error=None, attempts=0):
+        """Stores an event that could not be delivered, and returns the new `DeadLetter`."""
+        if len(self.letters) == self.letters.maxlen:
+            self.discarded += 1
+
+        letter = DeadLetter(next(self._ids), event, reason, callback, error, attempts)
+        self.letters.append(letter)
+        self.counters[reason.value] += 1
+        return letter
+
+    def pop(self, letter_id):
+        """Removes and returns the dead letter with the given id, or `None` if it is not stored."""
+        for letter in self.letters:
+            if letter.id == letter_id:
+                self.letters.remove(letter)
+                return letter
+        return None
+
+    def pop_all(self):
+        """Removes and returns all stored dead letters, oldest first."""
+        letters = list(self.letters)
+        self.letters.clear()
+        return letters
+
+    def get_data(self):
+        return [letter.get_data() for letter in self.letters]
@@ -1,13 +1,68 @@
 from __future__ import annotations
 from typing import Dict, Union, Type
 from schema import Schema
+from uuid import uuid4
 import datetime
+import json
+import time
+
+from msa.core.event_registry import event_registry
+from msa.core.schema_compiler import compile_schema
+
+GENERATION_TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
 
 class Event(object):
-    """The base Event Class. All other events should be subclasses of this class."""
+    """The base Event Class. All other events should be subclasses of this class.
+
+    Subclasses declare the schema of their data as the `schema` class attribute, so it is built once per class rather
+    than once per event, and declare `__slots__ = ()` so that events do not carry an instance `__dict__`.
+
+    Attributes
+    ----------
+    schema : schema.Schema
+        The schema for validating the data associated with events of this class. When `Event.init` is called the data
+        object that is passed in is validated against this schema. The schema is compiled into a validator function
+        when the class is defined, see `msa.core.schema_compiler.compile_schema`.
+    trusted : bool
+        Set on event classes that are only built by the agent's own handlers, from data already known to be valid.
+        `Event.init` then skips validating the data, unless asked to validate it. Data arriving from outside the agent,
+        through `Event.deserialize` or `Event.init(data, validate=True)`, is always validated. The schema of a trusted
+        event class should not convert data or fill in defaults, as it is not applied.
+    coalesce_window : Optional[float]
+        Set on idempotent request event classes to merge duplicate requests. A fired event that duplicates one still
+        queued, or one dispatched less than `coalesce_window` seconds ago, is not dispatched again. Instead its
+        requester receives the replies to the earlier event. Duplicates are identified by `Event.coalesce_key`.
+        `None`, the default, disables coalescing.
+    generation_time : int
+        The time the event was created, in microseconds since the epoch. Formatted as a date only by
+        `Event.get_metadata`."""
+
+    __slots__ = (
+        "generation_time",
+        "priority",
+        "data",
+        "propagate",
+        "_network_propagate",
+        "propagate_target",
+        "propagate_source",
+        "correlation_id",
+    )
 
-    def __init__(self, priority: int, schema: Schema):
+    schema = None
+    trusted = False
+    coalesce_window = None
+
+    # `schema` compiled into a function
+    _validator = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        event_registry.register(cls)
+        if "schema" in cls.__dict__ and cls.schema is not None:
+            cls._validator = staticmethod(compile_schema(cls.schema))
+
+    def __init__(self, priority: int, schema: Schema = None):
         """Create a new event. This creates a new event and populates the event metadata but does not set the data on
         it. Data must follow the defined schema otherwise a schema.SchemaError is raised.
 
@@ -15,18 +70,21 @@ class Event(object):
         ----------
         priority : int
             The priority level of this event type. Lower values indicate higher priority.
-        schema : schema.Schema
-            The schema for validating the data associated with this event. When `Event.init` is
-            called the data object that passed in is validated against this schema."""
+        schema : Optional[schema.Schema]
+            Only for event classes without `__slots__` that build their schema per event rather than declaring it on
+            the class. Overrides the class schema for this event."""
 
-        self.generation_time = datetime.datetime.now()
+        self.generation_time = time.time_ns() // 1000
         self.priority = priority
-        self.schema = schema
         self.data = None
         self.propagate = True
         self._network_propagate = False
         self.propagate_target = "all"
         self.propagate_source = None
+        self.correlation_id = None
+
+        if schema is not None:
+            self.schema = schema
 
     def __eq__(self, other):
         return (
@@ -70,33 +128,49 @@ class Event(object):
             and self.priority <= other.priority
         )
 
-    def init(self, data: Union[Dict, None] = None) -> Type[Event]:
+    def init(
+        self, data: Union[Dict, None] = None, validate: bool = None
+    ) -> Type[Event]:
         """
         Sets the data property on this event. Used when creating a new event, and when deserializing an event.
 
         :param Dict data: Event specific data. Must follow the defined schema for the event type.
+        :param bool validate: (Optional) Whether to validate the data against the schema. By default data is validated
+            unless the event class is `trusted`. Pass `True` for data that comes from outside the agent.
         :return: the initialized event instance
         """
-        """
+        if validate is None:
+            validate = not self.trusted
 
-        Parameters
-        ----------
-        data : Dict
-            """
-        self.data = self.schema.validate(data)
+        self.data = self.validate(data) if validate else data
 
         return self
 
+    def validate(self, data):
+        """Validates data against the schema of this event, and returns the validated data. Raises
+        `schema.SchemaError` if the data is invalid."""
+        schema = self.schema
+        if schema is not type(self).schema:
+            # a schema built for this event rather than declared on the class is not worth compiling
+            return schema.validate(data)
+        return self._validator(data)
+
+    def coalesce_key(self):
+        """Returns a hashable key identifying duplicates of this event, see `Event.coalesce_window`. By default events
+        of the same class carrying equal data are duplicates."""
+        return json.dumps(self.data, sort_keys=True, default=str)
+
     def get_metadata(self) -> Dict:
         """Returns the metadata of this event. Used for network serialization of an event."""
         return {
-            "event_type": self.__class__.__name__,
-            "generation_time": self.generation_time.strftime("%Y-%m-%d %H:%M:%S.%f"),
+            "event_type": event_registry.get_serialized_name(self.__class__),
+            "generation_time": self.format_generation_time(),
             "priority": self.priority,
             "propagate": self.propagate,
             "_network_propagate": self._network_propagate,
             "propagate_source": self.propagate_source,
             "propagate_target": self.propagate_target,
+            "correlation_id": self.correlation_id,
             "event_data": self.data,
         }
 
@@ -107,17 +181,36 @@ class Event(object):
         ----------
         metadata : Dict
             A dictionary containing the event metadata"""
-        self.generation_time = metadata.get("generation_time", datetime.datetime.now())
+        generation_time = metadata.get("generation_time", None)
+        if generation_time is None:
+            generation_time = time.time_ns() // 1000
+        elif isinstance(generation_time, str):
+            generation_time = _to_microseconds(
+                datetime.datetime.strptime(generation_time, GENERATION_TIME_FORMAT)
+            )
+        elif isinstance(generation_time, datetime.datetime):
+            generation_time = _to_microseconds(generation_time)
+        self.generation_time = generation_time
         self.priority = metadata.get("priority", 100)
         self.propagate = metadata.get("propagate", True)
         self._network_propagate = metadata.get("_network_propagate", False)
         self.data = metadata.get("event_data", None)
         self.propagate_source = metadata.get("propagate_source")
         self.propagate_target = metadata.get("propagate_target")
-        self.schema.validate(self.data)
+        self.correlation_id = metadata.get("correlation_id")
+        self.validate(self.data)
+
+    def format_generation_time(self) -> str:
+        """Returns the time the event was created as a local date and time string."""
+        seconds, microseconds = divmod(self.generation_time, 1000000)
+        return (
+            datetime.datetime.fromtimestamp(seconds)
+            .replace(microsecond=microseconds)
+            .strftime(GENERATION_TIME_FORMAT)
+        )
 
     def __str__(self):
-        return f"<{self.__class__.__module__}.{self.__class__.__name__} at {hex(id(self))} created at {self.generation_time}"
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} at {hex(id(self))} created at {self.format_generation_time()}"
 
     def network_propagate(self):
         """
@@ -149,22 +242,45 @@ class Event(object):
         self.propagate_target = target
         return self
 
+    def correlate(self, correlation_id=None):
+        """
+        Tag the event with a correlation id, so that a reply to it can be matched back to the request. Used with
+        `Supervisor.request` and `EventBus.listen_for_result`.
+
+        :param correlation_id: (Optional) The id to use, a new unique id is generated if not provided.
+        :return: the Event instance
+        """
+        self.correlation_id = (
+            correlation_id if correlation_id is not None else str(uuid4())
+        )
+        return self
+
+    def reply_to(self, event):
+        """
+        Indicate that this event is a reply to another event, by carrying over its correlation id.
+
+        :param event: The event being replied to.
+        :return: the Event instance
+        """
+        self.correlation_id = event.correlation_id
+        return self
+
     @staticmethod
     def deserialize(event_data):
         event_type = event_data.get("event_type", None)
-        subclasses = Event.__subclasses__()
 
         if not event_type:
             raise Exception(
                 "Attempted to deserialize an event that does not have a defined event type."
             )
 
-        for cls in subclasses:
-            if event_type == cls.__name__:
-                new_event = cls()
-                new_event.set_metadata(event_data)
-                return new_event
+        cls = event_registry.get(event_type)
+        new_event = cls()
+        new_event.set_metadata(event_data)
+        return new_event
 
-        raise Exception(
-            f"Attempted to deserialize an event of type {event_type} but an event class of that type could not be found."
-        )
+
+def _to_microseconds(generation_time):
+    """Converts a local date and time to microseconds since the epoch."""
+    seconds = int(generation_time.replace(microsecond=0).timestamp())
+    return seconds * 1000000 + generation_time.microsecond
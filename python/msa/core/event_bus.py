@@ -1,13 +1,192 @@
 import asyncio
+import inspect
 import re
+import time
+import traceback
+from enum import Enum
+from functools import partial
+
+from msa.core.coalesce import CoalesceIndex
+from msa.core.dead_letter import (
+    DEFAULT_DEAD_LETTER_SIZE,
+    DeadLetterReason,
+    DeadLetterStore,
+    RetryPolicy,
+)
+from msa.core.event_bus_stats import EventBusStats
+from msa.core.event_registry import event_registry
+from msa.core.event_queue import EventQueue, OverflowPolicy
+
+
+class DispatchMode(Enum):
+    # the bus awaits the subscriber before dequeuing the next event, preserving strict ordering across subscribers
+    sequential = "sequential"
+
+    # the subscriber is fed through its own worker and bounded inbox, so the bus keeps draining while it catches up
+    concurrent = "concurrent"
+
+
+DEFAULT_INBOX_SIZE = 100
+DEFAULT_BATCH_TIMEOUT = 0.05
+
+# seconds to wait for the reply to a request event before giving up
+RESULT_TIMEOUT = 30
+
+
+class SubscriberWorker:
+    """Drains a bounded inbox of events for one concurrently dispatched subscriber, or subscription group. Events
+    within a worker are handled one at a time and in the order they were dispatched."""
+
+    def __init__(self, loop, invoke, inbox_size=DEFAULT_INBOX_SIZE):
+        """Creates a new worker.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop the worker runs in.
+        invoke : Callable[[Callable, Any], Coroutine]
+            Called with a callback and its argument to run the callback, see `EventBus._invoke`.
+        inbox_size : int
+            The maximum number of events waiting in the inbox."""
+        self.loop = loop
+        self.invoke = invoke
+        self.inbox = asyncio.Queue(maxsize=inbox_size, loop=self.loop)
+        self.task = None
+        # set while the worker is handling events taken from its inbox
+        self.busy = False
+        self.closing = False
+
+    async def put(self, callback, event):
+        """Queues an event for a callback owned by this worker. Waits when the inbox is full, which applies
+        backpressure to the event bus rather than growing without bound."""
+        if self.task is None:
+            self.task = self.loop.create_task(self.run())
+
+        await self.inbox.put((callback, event))
+
+    async def run(self):
+        while True:
+            callback, event = await self.inbox.get()
+            self.busy = True
+            try:
+                await self.invoke(callback, event)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self.busy = False
+                self.inbox.task_done()
+
+            if self._closed():
+                return
+
+    def close(self):
+        """Stops the worker once it has handled the events already in its inbox. Called when the last callback owned
+        by the worker is unsubscribed."""
+        self.closing = True
+        if self.task is not None and not self.busy and self.inbox.empty():
+            self.task.cancel()
+            self.task = None
+
+    def _closed(self):
+        if self.closing and self.inbox.empty():
+            self.task = None
+            return True
+        return False
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+
+class BatchSubscriberWorker(SubscriberWorker):
+    """A worker for a batch-consuming subscriber. Queued events are handed to the callback as a list, once
+    `batch_size` events are waiting or `batch_timeout` seconds have passed since the first of them arrived."""
+
+    def __init__(
+        self,
+        loop,
+        invoke,
+        batch_size,
+        batch_timeout=DEFAULT_BATCH_TIMEOUT,
+        inbox_size=DEFAULT_INBOX_SIZE,
+    ):
+        super().__init__(loop, invoke, max(inbox_size, batch_size))
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+
+    async def run(self):
+        while True:
+            callback, event = await self.inbox.get()
+            self.busy = True
+            batch = [event]
+            deadline = self.loop.time() + self.batch_timeout
+
+            while len(batch) < self.batch_size:
+                if not self.inbox.empty():
+                    _, event = self.inbox.get_nowait()
+                    batch.append(event)
+                    continue
+
+                remaining = deadline - self.loop.time()
+                if remaining <= 0:
+                    break
+
+                try:
+                    _, event = await asyncio.wait_for(self.inbox.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(event)
+
+            try:
+                await self.invoke(callback, batch)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self.busy = False
+                for _ in batch:
+                    self.inbox.task_done()
+
+            if self._closed():
+                return
 
 
 class EventBus:
     """The event bus is responsible for tracking event queues and pushing new events into the event queues so that the
     event handlers can wait until a new event is sent to them via their event queue."""
 
-    def __init__(self, loop):
-        """Creates a new event bus"""
+    def __init__(
+        self,
+        loop,
+        max_queue_size=0,
+        overflow_policy=OverflowPolicy.block,
+        retry_policy=None,
+        dead_letter_size=DEFAULT_DEAD_LETTER_SIZE,
+        lanes=None,
+        journal=None,
+    ):
+        """Creates a new event bus
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop the bus runs in.
+        max_queue_size : int
+            The maximum number of events waiting to be dispatched. Zero means the queue is unbounded.
+        overflow_policy : msa.core.event_queue.OverflowPolicy
+            What to do with newly fired events once the queue is full.
+        retry_policy : Optional[msa.core.dead_letter.RetryPolicy]
+            How often a failing subscriber is retried. By default subscribers are not retried.
+        dead_letter_size : int
+            The maximum number of failed and unroutable events kept for inspection and replay.
+        lanes : Optional[List[msa.core.event_queue.PriorityLane]]
+            The priority lanes of the event queue, `msa.core.event_queue.default_lanes()` if not provided.
+        journal : Optional[msa.core.event_journal.EventJournal]
+            If provided, an opened journal that fired events are written to, and acknowledged in once dispatched."""
         self.loop = loop
         self.event_queues = {}
         self.registered_event_types = {}
@@ -15,18 +194,112 @@ class EventBus:
 
         self.subscriptions = {}
         self.complex_subscriptions = {}
+        self.compiled_subscriptions = {}
+
+        # concrete event type -> tuple of subscribers, across the subscriptions to the type, its base classes, and the
+        # regular expressions matching its name. Entries affected by subscribe/unsubscribe are rebuilt in place.
+        self.subscriber_cache = {}
+
+        # (event type, correlation id) -> futures waiting on an event of that type. A correlation id of None matches
+        # any event of the type.
         self.result_listeners = {}
-        self.event_result = {}
 
-        self.queue = asyncio.PriorityQueue(loop=self.loop)
+        # coalescable events that are queued or within their coalescing window
+        self.coalesce_index = CoalesceIndex()
+
+        self.subscriber_workers = {}
+        self.group_workers = {}
+
+        # plain callables, called inline during dispatch rather than gathered as coroutines
+        self.sync_subscribers = set()
+
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.dead_letters = DeadLetterStore(dead_letter_size)
+
+        self.stats = EventBusStats()
+        self.queue = EventQueue(
+            max_queue_size, overflow_policy, self.stats, lanes, loop=self.loop
+        )
+
+        self.journal = journal
+        # id of a queued event -> its journal record id
+        self.journal_records = {}
+        if self.journal is not None:
+            self.queue.on_drop = self._acknowledge
 
         self.task = None
 
-    def subscribe(self, event_type, callback):
+    def subscribe(
+        self,
+        event_type,
+        callback,
+        dispatch=DispatchMode.sequential,
+        group=None,
+        inbox_size=DEFAULT_INBOX_SIZE,
+        batch_size=None,
+        batch_timeout=DEFAULT_BATCH_TIMEOUT,
+    ):
+        """Subscribes a coroutine function to an event type.
+
+        Parameters
+        ----------
+        event_type : Union[Type[msa.core.event.Event], str]
+            An event class, or a regular expression matched against the event class name. Subscribing to a class also
+            subscribes to all of its subclasses, so subscribing to `msa.core.event.Event` receives every event.
+        callback : Callable[[msa.core.event.Event], Optional[Coroutine]]
+            The coroutine function to call with each matching event. A plain function is also accepted, in which case
+            sequential dispatch calls it inline, without creating a coroutine or task for it. Keep plain callbacks
+            short, as they run on the event loop and hold up the bus while they do.
+        dispatch : DispatchMode
+            `DispatchMode.sequential` (the default) awaits the callback before the bus dequeues the next event.
+            `DispatchMode.concurrent` hands the event to a worker with its own bounded inbox so that a slow callback
+            does not stall the rest of the agent. The dispatch mode applies to the callback across all of its
+            subscriptions.
+        group : Optional[str]
+            Only used with `DispatchMode.concurrent`. Callbacks sharing a group name share a single worker, so events
+            are handled in order across the whole group.
+        inbox_size : int
+            Only used with `DispatchMode.concurrent`. The maximum number of events waiting in the worker inbox before
+            the bus waits for the worker to catch up.
+        batch_size : Optional[int]
+            If provided, the callback consumes events in batches: it is called with a list of up to `batch_size`
+            events rather than a single event. Batch subscribers are always dispatched concurrently, through their
+            own worker.
+        batch_timeout : float
+            Only used with `batch_size`. The maximum number of seconds to wait for a batch to fill up after its first
+            event arrives."""
+
+        if batch_size is not None:
+            worker = self.subscriber_workers.get(callback)
+            if not isinstance(worker, BatchSubscriberWorker):
+                worker = BatchSubscriberWorker(
+                    self.loop, self._invoke, batch_size, batch_timeout, inbox_size
+                )
+            self._replace_worker(callback, worker)
+        elif dispatch == DispatchMode.concurrent:
+            if group is not None:
+                if group not in self.group_workers:
+                    self.group_workers[group] = SubscriberWorker(
+                        self.loop, self._invoke, inbox_size
+                    )
+                worker = self.group_workers[group]
+            else:
+                worker = self.subscriber_workers.get(callback)
+                if worker is None:
+                    worker = SubscriberWorker(self.loop, self._invoke, inbox_size)
+            self._replace_worker(callback, worker)
+        elif callback in self.subscriber_workers:
+            self._replace_worker(callback, None)
+
+        if _is_coroutine_callback(callback):
+            self.sync_subscribers.discard(callback)
+        else:
+            self.sync_subscribers.add(callback)
 
         if isinstance(event_type, str):
             if event_type not in self.complex_subscriptions:
                 self.complex_subscriptions[event_type] = {callback}
+                self.compiled_subscriptions[event_type] = re.compile(event_type)
             else:
                 self.complex_subscriptions[event_type].add(callback)
         else:
@@ -35,26 +308,130 @@ class EventBus:
             else:
                 self.subscriptions[event_type].add(callback)
 
+        self._refresh_subscriber_cache(event_type)
+
     def unsubscribe(self, event_type, callback):
+        # a pattern that was never subscribed has no cached subscribers to refresh
+        if (
+            isinstance(event_type, str)
+            and event_type not in self.compiled_subscriptions
+        ):
+            return
+
         if event_type in self.subscriptions:
             if callback in self.subscriptions[event_type]:
                 self.subscriptions[event_type].remove(callback)
 
+            if len(self.subscriptions[event_type]) == 0:
+                del self.subscriptions[event_type]
+
+        matcher = None
         if event_type in self.complex_subscriptions:
             if callback in self.complex_subscriptions[event_type]:
                 self.complex_subscriptions[event_type].remove(callback)
 
+            if len(self.complex_subscriptions[event_type]) == 0:
+                del self.complex_subscriptions[event_type]
+                matcher = self.compiled_subscriptions.pop(event_type)
+
+        self._refresh_subscriber_cache(event_type, matcher)
+
+        if not self._is_subscribed(callback):
+            self.sync_subscribers.discard(callback)
+            if callback in self.subscriber_workers:
+                self._replace_worker(callback, None)
+
+    def _replace_worker(self, callback, worker):
+        """Sets the worker a callback is dispatched through, `None` for sequential dispatch. A worker left without
+        callbacks is closed, and a group worker is forgotten along with its group."""
+        previous = self.subscriber_workers.pop(callback, None)
+        if worker is not None:
+            self.subscriber_workers[callback] = worker
+
+        if previous is None or previous is worker:
+            return
+        if any(owned is previous for owned in self.subscriber_workers.values()):
+            return
+
+        previous.close()
+        for group, group_worker in list(self.group_workers.items()):
+            if group_worker is previous:
+                del self.group_workers[group]
+
+    def _is_subscribed(self, callback):
+        """Returns `True` if a callback is subscribed to any event type or pattern."""
+        return any(
+            callback in callbacks for callbacks in self.subscriptions.values()
+        ) or any(
+            callback in callbacks for callbacks in self.complex_subscriptions.values()
+        )
+
+    def _refresh_subscriber_cache(self, event_type, matcher=None):
+        """Rebuilds the cached subscribers of the event types affected by a change to the subscriptions of
+        `event_type`: its subclasses if it is a class, or the classes whose name it matches if it is a regular
+        expression. Other cached entries are left as they are."""
+        if isinstance(event_type, str):
+            if matcher is None:
+                matcher = self.compiled_subscriptions[event_type]
+            affected = [
+                type_
+                for type_ in self.subscriber_cache
+                if matcher.match(type_.__name__)
+            ]
+        else:
+            affected = [
+                type_
+                for type_ in self.subscriber_cache
+                if issubclass(type_, event_type)
+            ]
+
+        for type_ in affected:
+            self.subscriber_cache[type_] = self._resolve_subscribers(type_)
+
+    def _resolve_subscribers(self, event_type):
+        subs = set()
+        for base in event_type.__mro__:
+            subs.update(self.subscriptions.get(base, ()))
+
+        for type_, matcher in self.compiled_subscriptions.items():
+            if matcher.match(event_type.__name__):
+                subs.update(self.complex_subscriptions[type_])
+
+        return tuple(subs)
+
     def _get_subscribers(self, event_type):
-        subs = []
+        """Returns a tuple of the callbacks subscribed to an event type, or to any of its base classes. Resolved
+        subscribers are memoized per event type, so after the first event of a type this is a single dict lookup."""
+        subs = self.subscriber_cache.get(event_type)
+        if subs is not None:
+            return subs
+
+        subs = self._resolve_subscribers(event_type)
+        self.subscriber_cache[event_type] = subs
+        return subs
+
+    def warm_subscriber_cache(self, event_types=None):
+        """Resolves the subscribers of event types ahead of their first dispatch. Called once plugins have been loaded
+        and their handlers have subscribed, so that event classes imported by plugin loading are resolved up front.
 
-        if event_type in self.subscriptions.keys():
-            subs.extend(self.subscriptions[event_type])
+        Parameters
+        ----------
+        event_types : Optional[Iterable[Type[msa.core.event.Event]]]
+            The event types to resolve. By default every event class registered so far, see
+            `msa.core.event_registry.EventRegistry`.
 
-        for type_, listeners in self.complex_subscriptions.items():
-            if re.match(type_, event_type.__name__):
-                subs.extend(listeners)
+        Returns
+        -------
+        int
+            The number of event types resolved."""
+        if event_types is None:
+            event_types = list(event_registry.by_name.values())
 
-        return list(set(subs))
+        count = 0
+        for event_type in event_types:
+            self.subscriber_cache[event_type] = self._resolve_subscribers(event_type)
+            count += 1
+        return count
 
     async def listen(self, timeout=None):
         """Listens for a new event to be passed into the event bus queue via EventBus.fire_event. """
@@ -69,53 +446,468 @@ class EventBus:
                 except asyncio.TimeoutError:
                     return
 
+            dispatch_start = time.perf_counter()
             event_type = type(event)
             subs = self._get_subscribers(event_type)
-            if len(subs) == 0 and not event in list(self.result_listeners.keys()):
+            resolved = self._resolve_result_listeners(event)
+            if len(subs) == 0 and not resolved:
                 print(
                     f'WARNING: propagated event type "{event_type}" that nothing was subscribed to. Dropping event.'
                 )
+                self.dead_letters.add(event, DeadLetterReason.unroutable)
 
-            if event_type in self.result_listeners:
-                async_event = self.result_listeners[event_type]
-                del self.result_listeners[event_type]
-                self.event_result[event_type] = event
-                async_event.set()
+            pending = []
+            for callback in subs:
+                worker = self.subscriber_workers.get(callback)
+                if worker is not None:
+                    await worker.put(callback, event)
+                elif callback in self.sync_subscribers:
+                    retry = self._invoke_inline(callback, event)
+                    if retry is not None:
+                        pending.append(retry)
+                else:
+                    pending.append(self._invoke(callback, event))
 
-            self.task = asyncio.gather(*[callback(event) for callback in subs])
+            if len(pending) > 0:
+                self.task = asyncio.gather(*pending)
+                await self.task
 
-            result = await self.task
+            if event_type.coalesce_window is not None:
+                self.coalesce_index.dispatched(event)
 
-    async def listen_for_result(self, event_type, timeout=None):
-        if event_type not in self.result_listeners:
-            event = asyncio.Event()
-            self.result_listeners[event_type] = event
-        else:
-            event = self.result_listeners[event_type]
+            if self.journal is not None:
+                self._acknowledge(event)
 
-        if timeout is None:
-            await event.wait()
+            self.stats.record_dispatch(event_type, time.perf_counter() - dispatch_start)
+
+    async def _invoke(self, callback, event, attempt=1):
+        """Runs a subscriber callback, recording its execution time.
+
+        Exceptions raised by the callback stop here, so a misbehaving subscriber cannot take down the bus. The callback
+        is retried as the retry policy allows, after which the event is dead-lettered. `event` is a list of events for
+        batch subscribers, in which case each event of the batch is dead-lettered."""
+        while True:
+            if attempt > 1:
+                await asyncio.sleep(self.retry_policy.get_delay(attempt - 1))
+
+            start = time.perf_counter()
+            try:
+                result = callback(event)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+            except Exception as err:
+                self.stats.record_subscriber_error(callback)
+                if attempt >= self.retry_policy.max_attempts:
+                    self._dead_letter(callback, event, err, attempt)
+                    return None
+            finally:
+                self.stats.record_subscriber(callback, time.perf_counter() - start)
+
+            attempt += 1
+
+    def _invoke_inline(self, callback, event):
+        """Calls a synchronous subscriber in place, with the same failure handling as `EventBus._invoke`.
+
+        Returns
+        -------
+        Optional[Coroutine]
+            `None` once the callback has run, or a coroutine to await if the callback failed and should be retried, or
+            if it returned an awaitable, such as a lambda wrapping a coroutine function."""
+        start = time.perf_counter()
+        try:
+            result = callback(event)
+        except Exception as err:
+            self.stats.record_subscriber(callback, time.perf_counter() - start)
+            return self._handle_inline_failure(callback, event, err)
+
+        if inspect.isawaitable(result):
+            return self._await_inline(callback, event, result, start)
+
+        self.stats.record_subscriber(callback, time.perf_counter() - start)
+        return None
+
+    async def _await_inline(self, callback, event, result, start):
+        try:
+            await result
+        except Exception as err:
+            retry = self._handle_inline_failure(callback, event, err)
+            if retry is not None:
+                await retry
+        finally:
+            self.stats.record_subscriber(callback, time.perf_counter() - start)
+
+    def _handle_inline_failure(self, callback, event, err):
+        self.stats.record_subscriber_error(callback)
+        if self.retry_policy.max_attempts <= 1:
+            self._dead_letter(callback, event, err, 1)
+            return None
+        return self._invoke(callback, event, attempt=2)
+
+    def _dead_letter(self, callback, event, err, attempts):
+        traceback.print_exc()
+        failed_events = event if isinstance(event, list) else [event]
+        for failed_event in failed_events:
+            self.dead_letters.add(
+                failed_event, DeadLetterReason.failed, callback, err, attempts
+            )
+
+    def get_stats(self):
+        """Returns a snapshot of the event bus runtime statistics.
+
+        Returns
+        -------
+        Dict
+            The queue depth, configuration and overflow counters, per lane wait times, along with per event type counts
+            and latencies and per subscriber execution times. Latencies are in seconds."""
+        return {
+            "queue": {
+                "depth": self.queue.qsize(),
+                "max_size": self.queue.maxsize,
+                "overflow_policy": self.queue.overflow_policy.value,
+                "counters": dict(self.queue.counters),
+                "lanes": self.queue.get_lane_stats(),
+            },
+            "journal": None if self.journal is None else self.journal.get_data(),
+            "dead_letters": {
+                "size": len(self.dead_letters.letters),
+                "max_size": self.dead_letters.letters.maxlen,
+                "discarded": self.dead_letters.discarded,
+                "counters": dict(self.dead_letters.counters),
+            },
+            **self.stats.get_data(),
+        }
+
+    def get_dead_letters(self):
+        """Returns the stored dead letters, oldest first, as a list of dictionaries."""
+        return self.dead_letters.get_data()
+
+    async def replay_dead_letter(self, letter_id):
+        """Removes a dead letter from the store and delivers its event again, see `EventBus._replay`.
+
+        Returns
+        -------
+        bool
+            `False` if no dead letter with the given id is stored."""
+        letter = self.dead_letters.pop(letter_id)
+        if letter is None:
+            return False
+
+        await self._replay(letter)
+        return True
+
+    async def replay_dead_letters(self):
+        """Removes all dead letters from the store and delivers their events again, oldest first. Returns the number
+        of dead letters replayed."""
+        letters = self.dead_letters.pop_all()
+        for letter in letters:
+            await self._replay(letter)
+        return len(letters)
+
+    async def _replay(self, letter):
+        """A failed event is delivered only to the subscriber that failed on it, as long as that subscriber is still
+        subscribed to the event type. Otherwise the event is fired again to all current subscribers, and if there are
+        none it becomes an unroutable dead letter once more."""
+        if (
+            letter.reason == DeadLetterReason.failed
+            and letter.callback in self._get_subscribers(type(letter.event))
+        ):
+            worker = self.subscriber_workers.get(letter.callback)
+            if worker is None:
+                await self._invoke(letter.callback, letter.event)
+            else:
+                await worker.put(letter.callback, letter.event)
         else:
+            await self.fire_event(letter.event)
+
+    async def stop_workers(self):
+        """Cancels the workers of concurrently dispatched subscribers."""
+        workers = set(self.subscriber_workers.values()) | set(
+            self.group_workers.values()
+        )
+        for worker in workers:
+            await worker.stop()
+
+    def _result_listener_keys(self, event):
+        keys = [(type(event), None)]
+        if event.correlation_id is not None:
+            keys.append((type(event), event.correlation_id))
+        return keys
+
+    def _has_result_listeners(self, event):
+        return any(
+            key in self.result_listeners for key in self._result_listener_keys(event)
+        ) or (event.correlation_id in self.coalesce_index.by_correlation)
+
+    def _resolve_result_listeners(self, event):
+        resolved = False
+        for key in self._result_listener_keys(event):
+            resolved = self._resolve_result_listener(key, event) or resolved
+
+        # requesters whose duplicate requests were merged into the one this event replies to
+        for alias in self.coalesce_index.replied(event):
+            resolved = (
+                self._resolve_result_listener((type(event), alias), event) or resolved
+            )
+
+        return resolved
+
+    def _resolve_result_listener(self, key, event):
+        resolved = False
+        for future in self.result_listeners.pop(key, ()):
+            if not future.done():
+                future.set_result(event)
+                resolved = True
+        return resolved
+
+    def _coalesce(self, new_event):
+        """Merges a coalescable event into a queued or recently dispatched duplicate. Replies the duplicate already
+        received are delivered to the requester straight away.
+
+        Returns
+        -------
+        bool
+            `True` if the event was merged and should not be queued."""
+        record = self.coalesce_index.merge(new_event)
+        if record is None:
+            return False
+
+        self.stats.record_coalesce(type(new_event))
+        if new_event.correlation_id is not None:
+            for reply in record.replies:
+                self._resolve_result_listener(
+                    (type(reply), new_event.correlation_id), reply
+                )
+        return True
+
+    def _track(self, new_event, journal_record=None):
+        """Prepares an event to be queued: merges it into a coalescable duplicate, or writes it to the journal.
+
+        Returns
+        -------
+        bool
+            `True` if the event was merged and should not be queued."""
+        if new_event.coalesce_window is not None and self._coalesce(new_event):
+            if journal_record is not None:
+                self.journal.ack(journal_record)
+            return True
+
+        if self.journal is not None:
+            if journal_record is None:
+                journal_record = self.journal.append(new_event)
+            if journal_record is not None:
+                self.journal_records[id(new_event)] = journal_record
+
+        return False
+
+    async def _queue_event(self, new_event, journal_record=None):
+        if self._track(new_event, journal_record):
+            return True
+
+        try:
+            queued = await self.queue.put_event((new_event.priority, new_event))
+        except Exception:
+            self._discard(new_event)
+            raise
+
+        if not queued:
+            self._discard(new_event)
+        return queued
+
+    def _queue_event_nowait(self, new_event):
+        if self._track(new_event):
+            return True
+
+        try:
+            queued = self.queue.put_event_nowait((new_event.priority, new_event))
+        except Exception:
+            self._discard(new_event)
+            raise
+
+        if not queued:
+            self._discard(new_event)
+        return queued
+
+    def _discard(self, new_event):
+        """Stops tracking an event that was dropped rather than queued."""
+        self.coalesce_index.discard(new_event)
+        if self.journal is not None:
+            self._acknowledge(new_event)
+
+    def _acknowledge(self, event):
+        record_id = self.journal_records.pop(id(event), None)
+        if record_id is not None:
+            self.journal.ack(record_id)
+
+    async def replay_journal(self):
+        """Queues the events recovered from the journal when it was opened, those that were fired but never dispatched
+        before the daemon last stopped. Should be called once handlers have subscribed, before listening.
+
+        Returns
+        -------
+        int
+            The number of events queued."""
+        if self.journal is None:
+            return 0
+
+        from msa.core.event import Event
+
+        recovered, self.journal.recovered = self.journal.recovered, []
+
+        queued = 0
+        for record_id, metadata in recovered:
             try:
-                await asyncio.wait_for(event.wait(), timeout)
-            except asyncio.TimeoutError:
-                return None
-        return self.event_result[event_type]
+                event = Event.deserialize(metadata)
+            except Exception as err:
+                print(f"WARNING: failed to replay journaled event {metadata}: {err}")
+                self.journal.ack(record_id)
+                continue
+
+            if await self._queue_event(event, record_id):
+                queued += 1
+
+        return queued
+
+    def _discard_result_listener(self, key, future):
+        futures = self.result_listeners.get(key)
+        if futures is not None and future in futures:
+            futures.remove(future)
+            if len(futures) == 0:
+                del self.result_listeners[key]
+
+    def expect_result(self, event_type, correlation_id=None):
+        """Registers interest in the next event of a type, and returns a future that resolves to that event.
+
+        Registering before firing the request event guarantees the reply cannot be missed. The listener is removed
+        once the future is done, including when it is cancelled because a wait on it timed out.
+
+        Parameters
+        ----------
+        event_type : Type[msa.core.event.Event]
+            The type of event to wait for.
+        correlation_id : Optional[str]
+            If provided, only an event carrying this correlation id resolves the future.
+
+        Returns
+        -------
+        asyncio.Future"""
+        key = (event_type, correlation_id)
+        future = self.loop.create_future()
+
+        if key not in self.result_listeners:
+            self.result_listeners[key] = [future]
+        else:
+            self.result_listeners[key].append(future)
+
+        future.add_done_callback(partial(self._discard_result_listener, key))
+        return future
+
+    @staticmethod
+    async def wait_for_result(future, timeout=None):
+        """Waits on a future returned by `EventBus.expect_result`. Returns `None` if the timeout expires first."""
+        if timeout is None:
+            return await future
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def listen_for_result(self, event_type, timeout=None, correlation_id=None):
+        """Waits for the next event of a type, optionally carrying a specific correlation id. Returns `None` if the
+        timeout expires first."""
+        future = self.expect_result(event_type, correlation_id)
+        return await self.wait_for_result(future, timeout)
 
     async def fire_event(self, new_event):
         """Fires an event to each event handler via its corresponding event queue.
 
+        When the queue is full the overflow policy applies: with `OverflowPolicy.block` this waits until there is room,
+        and with `OverflowPolicy.reject` it raises `msa.core.event_queue.EventQueueFullException`.
+
+        An event of a class with a `coalesce_window` that duplicates a queued or recently dispatched event is merged
+        into it rather than queued, see `msa.core.event.Event.coalesce_window`.
+
         Parameters
         ----------
         new_event : msa.core.event.Event
-            A subclass of msa.core.event.Event to propagate to event handlers."""
-        # get queues for event type
-        event_type = type(new_event)
-
-        subs = self._get_subscribers(event_type)
-        if len(subs) == 0:
-            print(
-                f'WARNING: attempted to propagate event type "{event_type}" that nothing was subscribed to. Dropping event.'
-            )
-        else:
-            self.queue.put_nowait((new_event.priority, new_event))
+            A subclass of msa.core.event.Event to propagate to event handlers.
+
+        Returns
+        -------
+        bool
+            `True` if the event was queued."""
+        if not self._is_routable(new_event):
+            return False
+
+        return await self._queue_event(new_event)
+
+    def fire_event_nowait(self, new_event):
+        """Fires an event without waiting, see `EventBus.fire_event`. Must be called from the event loop thread.
+
+        Raises `asyncio.QueueFull` if the queue is full and the overflow policy is `OverflowPolicy.block`, in which
+        case nothing has been done with the event and it can be passed to `EventBus.fire_event` to wait for room.
+
+        Parameters
+        ----------
+        new_event : msa.core.event.Event
+            A subclass of msa.core.event.Event to propagate to event handlers.
+
+        Returns
+        -------
+        bool
+            `True` if the event was queued."""
+        if self.queue.would_block():
+            raise asyncio.QueueFull
+
+        if not self._is_routable(new_event):
+            return False
+
+        return self._queue_event_nowait(new_event)
+
+    async def fire_events(self, new_events):
+        """Fires many events in one step. Behaves like calling `EventBus.fire_event` for each event in order, but
+        without creating a task per event.
+
+        Parameters
+        ----------
+        new_events : Iterable[msa.core.event.Event]
+            The events to propagate to event handlers.
+
+        Returns
+        -------
+        int
+            The number of events queued."""
+        queued = 0
+        for new_event in new_events:
+            if not self._is_routable(new_event):
+                continue
+
+            if await self._queue_event(new_event):
+                queued += 1
+
+        return queued
+
+    def _is_routable(self, new_event):
+        """Returns `True` if something is subscribed to, or waiting on a result of, an event about to be fired.
+        Otherwise the event is dead-lettered."""
+        subs = self._get_subscribers(type(new_event))
+        if len(subs) > 0 or self._has_result_listeners(new_event):
+            return True
+
+        print(
+            f'WARNING: attempted to propagate event type "{type(new_event)}" that nothing was subscribed to. Dropping event.'
+        )
+        self.dead_letters.add(new_event, DeadLetterReason.unroutable)
+        return False
+
+
+def _is_coroutine_callback(callback):
+    """Returns `True` if calling `callback` returns a coroutine, looking through `functools.partial` wrappers and at the
+    `__call__` of callable objects."""
+    while isinstance(callback, partial):
+        callback = callback.func
+
+    return inspect.iscoroutinefunction(callback) or inspect.iscoroutinefunction(
+        getattr(callback, "__call__", None)
+    )
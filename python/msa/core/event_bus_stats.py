@@ -0,0 +1,137 @@
+import functools
+
+
+def get_name(obj):
+    """Returns the qualified name of an event type or a subscriber. `functools.partial` objects are named after the
+    function they wrap, and callables without a qualified name, such as callable instances, by their `repr`."""
+    while isinstance(obj, functools.partial):
+        obj = obj.func
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if module is None or qualname is None:
+        return repr(obj)
+    return f"{module}.{qualname}"
+
+
+class LatencyHistogram:
+    """A fixed-size histogram of durations. Bucket `i` counts durations below `2 ** i` microseconds, so recording a
+    value is constant time and memory does not grow with the number of events."""
+
+    BUCKETS = 24  # the last bucket collects everything above ~4 seconds
+
+    def __init__(self):
+        self.buckets = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        microseconds = int(seconds * 1000000)
+        index = min(microseconds.bit_length(), self.BUCKETS - 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """Returns the upper bound, in seconds, of the bucket containing the given percentile."""
+        if self.count == 0:
+            return 0.0
+
+        threshold = self.count * percent / 100
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= threshold:
+                return min((2 ** index) / 1000000, self.max)
+        return self.max  # pragma: no cover
+
+    def get_data(self):
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+
+class EventTypeStats:
+    def __init__(self):
+        self.enqueued = 0
+        self.coalesced = 0
+        self.depth = 0
+        self.queue_wait = LatencyHistogram()
+        self.dispatch_latency = LatencyHistogram()
+
+    def get_data(self):
+        return {
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "depth": self.depth,
+            "queue_wait": self.queue_wait.get_data(),
+            "dispatch_latency": self.dispatch_latency.get_data(),
+        }
+
+
+class EventBusStats:
+    """Runtime statistics of an event bus, tracked per event type and per subscriber."""
+
+    def __init__(self):
+        self.event_types = {}
+        self.subscribers = {}
+        self.subscriber_errors = {}
+
+    def _event_type_stats(self, event_type):
+        stats = self.event_types.get(event_type)
+        if stats is None:
+            stats = EventTypeStats()
+            self.event_types[event_type] = stats
+        return stats
+
+    def record_enqueue(self, event_type):
+        stats = self._event_type_stats(event_type)
+        stats.enqueued += 1
+        stats.depth += 1
+
+    def record_coalesce(self, event_type):
+        self._event_type_stats(event_type).coalesced += 1
+
+    def record_dequeue(self, event_type, wait):
+        stats = self._event_type_stats(event_type)
+        stats.depth -= 1
+        stats.queue_wait.record(wait)
+
+    def record_drop(self, event_type):
+        self._event_type_stats(event_type).depth -= 1
+
+    def record_dispatch(self, event_type, latency):
+        self._event_type_stats(event_type).dispatch_latency.record(latency)
+
+    def record_subscriber(self, callback, duration):
+        histogram = self.subscribers.get(callback)
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.subscribers[callback] = histogram
+        histogram.record(duration)
+
+    def record_subscriber_error(self, callback):
+        self.subscriber_errors[callback] = self.subscriber_errors.get(callback, 0) + 1
+
+    def get_data(self):
+        return {
+            "event_types": {
+                get_name(event_type): stats.get_data()
+                for event_type, stats in self.event_types.items()
+            },
+            "subscribers": {
+                get_name(callback): histogram.get_data()
+                for callback, histogram in self.subscribers.items()
+            },
+            "subscriber_errors": {
+                get_name(callback): errors
+                for callback, errors in self.subscriber_errors.items()
+            },
+        }
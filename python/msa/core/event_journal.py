@@ -0,0 +1,226 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# bytes written to a segment before a new one is started
+DEFAULT_SEGMENT_SIZE = 4 * 1024 * 1024
+
+# seconds between group commits, the most recent events fired in this window are lost if the daemon dies
+DEFAULT_SYNC_INTERVAL = 0.01
+
+
+class EventJournal:
+    """An append-only journal of the events fired into the event bus, so that events that were queued but not yet
+    dispatched survive the daemon dying.
+
+    The journal is a directory of segment files of JSON lines. Each fired event is written as an
+    `{"op": "event", "id": ..., "event": ...}` record holding its `Event.get_metadata`, and once the event has been
+    dispatched an `{"op": "ack", "id": ...}` record is written. Writes are not synced one at a time; instead the
+    segment is fsync'd at most once every `sync_interval` seconds, so many events share the cost of each sync.
+
+    When the journal is opened, events without an ack record are handed back for replay. Once every event in a segment,
+    and in all the segments before it, has been acknowledged the segment is deleted."""
+
+    def __init__(
+        self,
+        loop,
+        directory,
+        segment_size=DEFAULT_SEGMENT_SIZE,
+        sync_interval=DEFAULT_SYNC_INTERVAL,
+    ):
+        """Creates a new event journal. No files are touched until `EventJournal.open` is called.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop the journal is written from.
+        directory : str
+            The directory holding the segment files. It is created if it does not exist.
+        segment_size : int
+            The number of bytes written to a segment before a new segment is started.
+        sync_interval : float
+            The number of seconds between group commits."""
+        self.loop = loop
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.sync_interval = sync_interval
+
+        # segment number -> ids of the events in the segment that have not been acknowledged
+        self.segments = {}
+        # event id -> segment number
+        self.record_segments = {}
+        self.next_id = 1
+
+        self.current = None
+        self.file = None
+        self.file_size = 0
+
+        # events found unacknowledged when the journal was opened, as (id, metadata) pairs
+        self.recovered = []
+
+        self.commit_handle = None
+        # syncs, closes and deletes run in order, off the event loop
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+        self.counters = {
+            "appended": 0,
+            "acknowledged": 0,
+            "commits": 0,
+            "recovered": 0,
+            "compacted": 0,
+        }
+
+    def _segment_path(self, number):
+        return self.directory / f"segment-{number:08d}.log"
+
+    def open(self):
+        """Reads the existing segments, collecting the events that were never acknowledged into
+        `EventJournal.recovered`, then starts a new segment.
+
+        Returns
+        -------
+        List[Tuple[int, Dict]]
+            The id and metadata of each unacknowledged event, in the order they were fired."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        numbers = sorted(
+            int(path.stem.split("-")[1])
+            for path in self.directory.glob("segment-*.log")
+        )
+
+        pending = {}
+        for number in numbers:
+            self.segments[number] = set()
+            with self._segment_path(number).open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # a record torn by the daemon dying mid write
+                        continue
+
+                    record_id = record["id"]
+                    if record["op"] == "event":
+                        pending[record_id] = record["event"]
+                        self.segments[number].add(record_id)
+                        self.record_segments[record_id] = number
+                        self.next_id = max(self.next_id, record_id + 1)
+                    elif record["op"] == "ack":
+                        pending.pop(record_id, None)
+                        self._forget(record_id)
+
+        self._start_segment(numbers[-1] + 1 if numbers else 1)
+        self._compact()
+
+        self.recovered = list(pending.items())
+        self.counters["recovered"] = len(self.recovered)
+        return self.recovered
+
+    def append(self, event):
+        """Writes an event to the journal and returns its id, to be passed to `EventJournal.ack` once the event has
+        been dispatched. Returns `None` if the event data cannot be serialized, in which case the event is not
+        journaled."""
+        record_id = self.next_id
+        try:
+            line = json.dumps(
+                {"op": "event", "id": record_id, "event": event.get_metadata()}
+            )
+        except (TypeError, ValueError):
+            return None
+
+        self.next_id += 1
+        self.segments[self.current].add(record_id)
+        self.record_segments[record_id] = self.current
+        self.counters["appended"] += 1
+
+        self._write(line)
+        return record_id
+
+    def ack(self, record_id):
+        """Records that an event has been dispatched, so it is not replayed when the journal is next opened."""
+        self.counters["acknowledged"] += 1
+        self._write(json.dumps({"op": "ack", "id": record_id}))
+
+        if self._forget(record_id):
+            self._compact()
+
+    def _forget(self, record_id):
+        """Removes an event from the unacknowledged events of its segment. Returns `True` if the segment is now fully
+        processed."""
+        number = self.record_segments.pop(record_id, None)
+        if number is None:
+            return False
+
+        unacknowledged = self.segments[number]
+        unacknowledged.discard(record_id)
+        return len(unacknowledged) == 0
+
+    def _write(self, line):
+        self.file.write(line)
+        self.file.write("\n")
+        self.file_size += len(line) + 1
+
+        if self.file_size >= self.segment_size:
+            self._start_segment(self.current + 1)
+        elif self.commit_handle is None:
+            self.commit_handle = self.loop.call_later(self.sync_interval, self.commit)
+
+    def commit(self):
+        """Flushes buffered records and syncs the current segment to disk in the background."""
+        if self.commit_handle is not None:
+            self.commit_handle.cancel()
+            self.commit_handle = None
+
+        self.file.flush()
+        self.counters["commits"] += 1
+        return self.loop.run_in_executor(self.executor, os.fsync, self.file.fileno())
+
+    def _start_segment(self, number):
+        if self.file is not None:
+            self.commit()
+            self.loop.run_in_executor(self.executor, self.file.close)
+
+        previous = self.current
+        self.current = number
+        self.segments.setdefault(number, set())
+        self.file = self._segment_path(number).open("a", encoding="utf-8")
+        self.file_size = self.file.tell()
+
+        if previous is not None:
+            self._compact()
+
+    def _compact(self):
+        """Deletes fully processed segments, oldest first. A segment is only deleted along with all the segments before
+        it, so that an ack record is never deleted while the event it acknowledges is kept."""
+        for number in sorted(self.segments):
+            if number == self.current or len(self.segments[number]) > 0:
+                break
+
+            del self.segments[number]
+            self.counters["compacted"] += 1
+            self.loop.run_in_executor(
+                self.executor, self._remove, self._segment_path(number)
+            )
+
+    @staticmethod
+    def _remove(path):
+        if path.exists():
+            path.unlink()
+
+    async def close(self):
+        """Commits outstanding records and closes the current segment."""
+        if self.file is None:
+            return
+
+        await self.commit()
+        await self.loop.run_in_executor(self.executor, self.file.close)
+        self.file = None
+        self.executor.shutdown()
+
+    def get_data(self):
+        return {
+            "segments": len(self.segments),
+            "unacknowledged": len(self.record_segments),
+            **self.counters,
+        }
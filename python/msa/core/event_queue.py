@@ -0,0 +1,376 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from enum import Enum
+
+from msa.core.event_bus_stats import LatencyHistogram
+
+
+class OverflowPolicy(Enum):
+    # wait until the queue has room, the producer awaiting the fire is held back
+    block = "block"
+
+    # make room by discarding the oldest queued event of the lowest priority
+    drop_oldest = "drop_oldest"
+
+    # discard the event being fired
+    drop_newest = "drop_newest"
+
+    # raise an EventQueueFullException to the producer
+    reject = "reject"
+
+
+class EventQueueFullException(Exception):
+    pass
+
+
+class PriorityLane:
+    """A lane of the event queue, holding the queued events whose priority falls within its range. Within a lane,
+    events are dequeued by priority, then in the order they were queued.
+
+    Queue entries are lists of `[priority, sequence number, enqueue time, event, queued]`. An entry taken out of turn,
+    by promotion or eviction, only has `queued` cleared and is skipped once it reaches the top of the heap, so that
+    leaving the lane is never linear in its depth. The entry to evict is found with a second heap ordered by lowest
+    priority then age, only built once the lane first evicts an entry."""
+
+    def __init__(self, name, max_priority=None, weight=1, max_wait=None):
+        """Creates a new lane.
+
+        Parameters
+        ----------
+        name : str
+            The name of the lane, used in statistics.
+        max_priority : Optional[int]
+            The highest priority value, that is the lowest priority, carried by this lane. `None` means no limit.
+        weight : int
+            The share of dequeues this lane receives while other lanes are also waiting. A lane with weight 4 is served
+            four times as often as a lane with weight 1.
+        max_wait : Optional[float]
+            Seconds an event may wait in this lane before it is promoted ahead of the weighted schedule. `None`
+            disables promotion."""
+        self.name = name
+        self.max_priority = max_priority
+        self.weight = weight
+        self.max_wait = max_wait
+
+        self.heap = []
+        self.size = 0
+        # entries in the order they were queued, only tracked when promotion is enabled. Entries that already left
+        # the lane are skipped lazily.
+        self.arrivals = deque()
+        # entries keyed by lowest priority first, then by age, built by the first call to `lowest`. Entries that
+        # already left the lane are skipped lazily.
+        self.eviction_heap = None
+        self.current_weight = 0
+
+        self.promoted = 0
+        self.wait = LatencyHistogram()
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return (entry for entry in self.heap if entry[4])
+
+    def push(self, entry):
+        heapq.heappush(self.heap, entry)
+        if self.max_wait is not None:
+            self.arrivals.append(entry)
+        if self.eviction_heap is not None:
+            heapq.heappush(self.eviction_heap, (-entry[0], entry[1], entry))
+            if len(self.eviction_heap) > 2 * self.size + 16:
+                self._build_eviction_heap()
+        self.size += 1
+
+    def pop(self):
+        heap = self.heap
+        entry = heapq.heappop(heap)
+        while not entry[4]:
+            entry = heapq.heappop(heap)
+        entry[4] = False
+        self.size -= 1
+        return entry
+
+    def oldest(self):
+        """Returns the entry that has been in the lane the longest. Only available when promotion is enabled."""
+        arrivals = self.arrivals
+        while not arrivals[0][4]:
+            arrivals.popleft()
+        return arrivals[0]
+
+    def lowest(self):
+        """Returns the oldest entry among those with the lowest priority, i.e. the highest priority value."""
+        if self.eviction_heap is None:
+            self._build_eviction_heap()
+        eviction_heap = self.eviction_heap
+        while not eviction_heap[0][2][4]:
+            heapq.heappop(eviction_heap)
+        return eviction_heap[0][2]
+
+    def _build_eviction_heap(self):
+        self.eviction_heap = [(-entry[0], entry[1], entry) for entry in self]
+        heapq.heapify(self.eviction_heap)
+
+    def remove(self, entry):
+        entry[4] = False
+        self.size -= 1
+
+        # drop skipped entries once they outnumber the queued ones
+        if len(self.heap) > 2 * self.size + 16:
+            self.heap = [entry for entry in self.heap if entry[4]]
+            heapq.heapify(self.heap)
+
+    def get_data(self):
+        return {
+            "max_priority": self.max_priority,
+            "weight": self.weight,
+            "max_wait": self.max_wait,
+            "depth": self.size,
+            "dequeued": self.wait.count,
+            "promoted": self.promoted,
+            "wait": self.wait.get_data(),
+        }
+
+
+def default_lanes():
+    """Returns the default lanes: startup and signal events, conversation, intent and scripting events, and
+    everything else."""
+    return [
+        PriorityLane("high", max_priority=10, weight=8, max_wait=1),
+        PriorityLane("normal", max_priority=50, weight=4, max_wait=5),
+        PriorityLane("low", max_priority=None, weight=1, max_wait=10),
+    ]
+
+
+class PriorityLanes:
+    """The entries of an `EventQueue`, split into priority lanes.
+
+    Lanes are served by smooth weighted round robin, so a busy lane cannot starve the others, and an entry that has
+    waited longer than the `max_wait` of its lane is promoted ahead of the schedule."""
+
+    def __init__(self, lanes):
+        # lanes ordered by priority range, with the unlimited lane last
+        self.lanes = sorted(
+            lanes, key=lambda lane: (lane.max_priority is None, lane.max_priority or 0),
+        )
+        self.lane_lookup = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for lane in self.lanes:
+            yield from lane
+
+    def get_lane(self, priority):
+        """Returns the lane carrying a priority. Priorities above the range of every lane go to the last lane."""
+        lane = self.lane_lookup.get(priority)
+        if lane is None:
+            lane = self.lanes[-1]
+            for candidate in self.lanes:
+                if candidate.max_priority is None or priority <= candidate.max_priority:
+                    lane = candidate
+                    break
+            self.lane_lookup[priority] = lane
+        return lane
+
+    def push(self, entry):
+        self.get_lane(entry[0]).push(entry)
+        self.size += 1
+
+    def pop(self, now):
+        """Removes and returns the next entry to dispatch, along with its lane."""
+        active = [lane for lane in self.lanes if lane.size]
+
+        # promote the entry that is the furthest past the maximum wait of its lane
+        overdue = None
+        overdue_by = 0
+        for lane in active:
+            if lane.max_wait is not None:
+                waited = now - lane.oldest()[2] - lane.max_wait
+                if waited > overdue_by:
+                    overdue, overdue_by = lane, waited
+
+        if overdue is not None:
+            entry = overdue.oldest()
+            overdue.remove(entry)
+            overdue.promoted += 1
+            return self._popped(overdue, entry)
+
+        if len(active) == 1:
+            selected = active[0]
+        else:
+            total_weight = 0
+            selected = None
+            for lane in active:
+                lane.current_weight += lane.weight
+                total_weight += lane.weight
+                if selected is None or lane.current_weight > selected.current_weight:
+                    selected = lane
+            selected.current_weight -= total_weight
+
+        return self._popped(selected, selected.pop())
+
+    def _popped(self, lane, entry):
+        self.size -= 1
+        if lane.size == 0:
+            # an idle lane does not bank credit to burst with later
+            lane.current_weight = 0
+        return lane, entry
+
+    def remove_lowest(self):
+        """Removes and returns the oldest entry among those with the lowest priority, i.e. the highest priority value."""
+        lane = next(lane for lane in reversed(self.lanes) if lane.size > 0)
+        entry = lane.lowest()
+        lane.remove(entry)
+        self.size -= 1
+        return entry
+
+    def peek_lowest_priority(self):
+        lane = next(lane for lane in reversed(self.lanes) if lane.size > 0)
+        return lane.lowest()[0]
+
+    def get_data(self):
+        return {lane.name: lane.get_data() for lane in self.lanes}
+
+
+class EventQueue(asyncio.PriorityQueue):
+    """A priority queue of `(priority, event)` entries with an optional maximum depth. When the queue is full, the
+    overflow policy decides what happens to newly fired events. A count of each outcome is kept in `counters`.
+
+    Entries are split into priority lanes, see `PriorityLanes`. Internally each entry is stored with a sequence number
+    that is unique and increasing, so events of equal priority are dequeued in the order they were queued, and heap
+    comparisons never fall through to the `Event` rich comparison methods."""
+
+    def __init__(
+        self,
+        maxsize=0,
+        overflow_policy=OverflowPolicy.block,
+        stats=None,
+        lanes=None,
+        *,
+        loop=None,
+    ):
+        """Creates a new event queue.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of queued events. Zero or less means the queue is unbounded.
+        overflow_policy : OverflowPolicy
+            What to do with a newly fired event when the queue is full.
+        stats : Optional[msa.core.event_bus_stats.EventBusStats]
+            If provided, queue depth and queue wait time are recorded per event type.
+        lanes : Optional[List[PriorityLane]]
+            The priority lanes of the queue, `default_lanes()` if not provided.
+        loop : asyncio.AbstractEventLoop
+            The event loop the queue belongs to."""
+        self.stats = stats
+        self.lanes = lanes if lanes is not None else default_lanes()
+        super().__init__(maxsize, loop=loop)
+        self.overflow_policy = overflow_policy
+        # called with each queued event evicted by `OverflowPolicy.drop_oldest`
+        self.on_drop = None
+        self.counters = {
+            "enqueued": 0,
+            "blocked": 0,
+            "dropped_oldest": 0,
+            "dropped_newest": 0,
+            "rejected": 0,
+        }
+
+    def _init(self, maxsize):
+        self._queue = PriorityLanes(self.lanes)
+        self._sequence = itertools.count()
+
+    def _put(self, item):
+        self.counters["enqueued"] += 1
+        priority, event = item
+        if self.stats is not None:
+            self.stats.record_enqueue(type(event))
+        self._queue.push(
+            [priority, next(self._sequence), time.monotonic(), event, True]
+        )
+
+    def _get(self):
+        now = time.monotonic()
+        lane, (priority, _, enqueued_at, event, _) = self._queue.pop(now)
+        wait = now - enqueued_at
+        lane.wait.record(wait)
+        if self.stats is not None:
+            self.stats.record_dequeue(type(event), wait)
+        return priority, event
+
+    def get_lane_stats(self):
+        """Returns the configuration, depth, dequeue and promotion counts, and wait times of each lane."""
+        return self._queue.get_data()
+
+    def would_block(self):
+        """Returns `True` if queueing an event now would have to wait for room, that is if the queue is full and the
+        overflow policy is `OverflowPolicy.block`."""
+        return self.overflow_policy == OverflowPolicy.block and self.full()
+
+    async def put_event(self, entry):
+        """Adds an entry to the queue, applying the overflow policy if the queue is full.
+
+        Parameters
+        ----------
+        entry : Tuple[int, msa.core.event.Event]
+            A `(priority, event)` pair.
+
+        Returns
+        -------
+        bool
+            `True` if the entry was queued, `False` if it was dropped."""
+        if self.would_block():
+            self.counters["blocked"] += 1
+            await self.put(entry)
+            return True
+
+        return self.put_event_nowait(entry)
+
+    def put_event_nowait(self, entry):
+        """Adds an entry to the queue without waiting, applying the overflow policy if the queue is full. Raises
+        `asyncio.QueueFull` rather than waiting if the overflow policy is `OverflowPolicy.block`, see
+        `EventQueue.put_event`.
+
+        Parameters
+        ----------
+        entry : Tuple[int, msa.core.event.Event]
+            A `(priority, event)` pair.
+
+        Returns
+        -------
+        bool
+            `True` if the entry was queued, `False` if it was dropped."""
+        if not self.full():
+            self.put_nowait(entry)
+            return True
+
+        if self.overflow_policy == OverflowPolicy.block:
+            raise asyncio.QueueFull
+
+        if self.overflow_policy == OverflowPolicy.reject:
+            self.counters["rejected"] += 1
+            raise EventQueueFullException(
+                f"Event queue is full ({self.maxsize} events), rejected event {entry[1]}."
+            )
+
+        if self.overflow_policy == OverflowPolicy.drop_oldest:
+            # never evict a queued event in favour of one with an even lower priority
+            if entry[0] <= self._queue.peek_lowest_priority():
+                victim = self._queue.remove_lowest()[3]
+                if self.stats is not None:
+                    self.stats.record_drop(type(victim))
+                if self.on_drop is not None:
+                    self.on_drop(victim)
+                self.task_done()
+                self.counters["dropped_oldest"] += 1
+                self.put_nowait(entry)
+                return True
+
+        self.counters["dropped_newest"] += 1
+        return False
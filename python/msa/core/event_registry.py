@@ -0,0 +1,84 @@
+class EventTypeNotFoundException(Exception):
+    pass
+
+
+class AmbiguousEventTypeException(EventTypeNotFoundException):
+    pass
+
+
+class EventRegistry:
+    """Maps event type names to event classes. Every subclass of `msa.core.event.Event` is registered when it is
+    defined, so looking up an event class by name does not have to scan the class hierarchy.
+
+    Classes are registered under their fully qualified name, `module.QualifiedName`, and under their short class name
+    as an alias. Short names are what events have always been serialized with, but two modules may define event
+    classes with the same short name, in which case only the fully qualified names identify them.
+
+    Attributes
+    ----------
+    by_name : Dict[str, Type[msa.core.event.Event]]
+        Event classes by fully qualified name.
+    aliases : Dict[str, Set[str]]
+        The fully qualified names of the event classes sharing each short name."""
+
+    def __init__(self):
+        self.by_name = {}
+        self.aliases = {}
+
+    @staticmethod
+    def get_full_name(event_type):
+        return f"{event_type.__module__}.{event_type.__qualname__}"
+
+    def register(self, event_type):
+        """Registers an event class. A class with the same fully qualified name, for example one from a module that
+        was reloaded, is replaced."""
+        full_name = self.get_full_name(event_type)
+        self.by_name[full_name] = event_type
+        self.aliases.setdefault(event_type.__name__, set()).add(full_name)
+
+    def get(self, name):
+        """Looks up an event class by fully qualified name, or by short name if only one event class has it.
+
+        Raises
+        ------
+        EventTypeNotFoundException
+            If no event class has the name.
+        AmbiguousEventTypeException
+            If the name is a short name shared by several event classes."""
+        event_type = self.by_name.get(name)
+        if event_type is not None:
+            return event_type
+
+        full_names = self.aliases.get(name)
+        if not full_names:
+            raise EventTypeNotFoundException(
+                f"An event class of type {name} could not be found."
+            )
+        if len(full_names) > 1:
+            raise AmbiguousEventTypeException(
+                f"Event class name {name} is ambiguous, it could refer to any of: "
+                f"{', '.join(sorted(full_names))}. Use the fully qualified name instead."
+            )
+
+        (full_name,) = full_names
+        return self.by_name[full_name]
+
+    def get_serialized_name(self, event_type):
+        """Returns the name to serialize events of a class with: the short class name, unless another event class
+        shares it."""
+        if len(self.aliases.get(event_type.__name__, ())) > 1:
+            return self.get_full_name(event_type)
+        return event_type.__name__
+
+    def get_ambiguous_names(self):
+        """Returns the short names shared by several event classes, mapped to the fully qualified names of those
+        classes."""
+        return {
+            name: sorted(full_names)
+            for name, full_names in self.aliases.items()
+            if len(full_names) > 1
+        }
+
+
+# the registry of all event classes
+event_registry = EventRegistry()
@@ -0,0 +1,412 @@
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import msa.core
+from msa.core.event import Event
+from msa.core.event_bus import EventBus, RESULT_TIMEOUT
+from msa.core.event_queue import EventQueueFullException
+
+# seconds to wait for a worker process to start its handlers, and to exit once asked to stop
+WORKER_START_TIMEOUT = 30
+WORKER_STOP_TIMEOUT = 5
+
+
+class HandlerProcessException(Exception):
+    pass
+
+
+class HandlerProcess:
+    """Runs the event handlers of one module in a worker process, so that CPU heavy handlers do not compete with the
+    main event loop.
+
+    Events cross the process boundary as `Event.get_metadata` dictionaries over a pair of multiprocessing queues. The
+    worker reports which event types its handlers subscribe to, and this proxy subscribes to the same types on the
+    main event bus and forwards matching events to the worker. Events fired by the handlers in the worker are
+    deserialized and fired into the main event bus.
+
+    Messages exchanged with the worker are tuples whose first item is the message kind:
+
+    - `("subscriptions", [(kind, key), ...])`: sent by the worker, the full set of its subscriptions. `kind` is
+      `"type"` with the fully qualified name of an event class, or `"pattern"` with a regular expression.
+    - `("event", metadata)`: an event, in either direction.
+    - `("stop",)`: asks the worker to shut down.
+    """
+
+    def __init__(
+        self,
+        loop,
+        event_bus,
+        logger,
+        module_name,
+        config,
+        logging_config=None,
+        config_manager=None,
+    ):
+        """Creates a new handler process. The process is not started until `HandlerProcess.start` is awaited.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The main event loop.
+        event_bus : msa.core.event_bus.EventBus
+            The main event bus.
+        logger : logging.Logger
+            The logger of the proxy.
+        module_name : str
+            The fully qualified name of the module whose `handler_factories` should run in the worker.
+        config : Optional[Dict]
+            The validated module config, passed to each handler.
+        logging_config : Optional[Dict]
+            The `logging` section of the application config. If provided the worker appends to the same log file.
+        config_manager : Optional[msa.core.config_manager.ConfigManager]
+            The config manager of the main process, exposed to the handlers by the supervisor of the worker."""
+        self.loop = loop
+        self.event_bus = event_bus
+        self.logger = logger
+        self.module_name = module_name
+        self.config = config
+        self.logging_config = logging_config
+
+        # spawn rather than fork, the forked copy of a running event loop is not usable in the child
+        context = multiprocessing.get_context("spawn")
+        self.inbox = context.Queue()
+        self.outbox = context.Queue()
+        self.process = context.Process(
+            target=run_worker,
+            args=(
+                module_name,
+                config,
+                logging_config,
+                config_manager,
+                self.inbox,
+                self.outbox,
+            ),
+            name=f"msa-{module_name}",
+            daemon=True,
+        )
+
+        self.subscriptions = set()
+        self.started = None
+        self.reader_task = None
+
+    async def start(self):
+        """Starts the worker process and waits until its handlers are initialized."""
+        self.logger.info(f"Starting worker process for module {self.module_name}.")
+        self.started = self.loop.create_future()
+        self.process.start()
+        self.reader_task = self.loop.create_task(self.read())
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self.started), WORKER_START_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HandlerProcessException(
+                f"Worker process for module {self.module_name} did not start within {WORKER_START_TIMEOUT} seconds."
+            )
+
+    async def read(self):
+        """Reads messages from the worker until it exits. A worker that exits before its handlers are initialized fails
+        `HandlerProcess.start`."""
+        try:
+            await self._read_messages()
+        finally:
+            if not self.started.done():
+                self.started.set_exception(
+                    HandlerProcessException(
+                        f"Worker process for module {self.module_name} exited before its handlers were initialized."
+                    )
+                )
+
+    async def _read_messages(self):
+        while True:
+            message = await self.loop.run_in_executor(None, self.outbox.get)
+            if message is None:
+                return
+
+            kind = message[0]
+            if kind == "subscriptions":
+                self.update_subscriptions(message[1])
+                if not self.started.done():
+                    self.started.set_result(True)
+            elif kind == "event":
+                try:
+                    event = Event.deserialize(message[1])
+                except Exception:
+                    self.logger.exception(
+                        f"Failed to deserialize event from worker process {self.module_name}."
+                    )
+                    continue
+
+                try:
+                    await self.event_bus.fire_event(event)
+                except EventQueueFullException as err:
+                    self.logger.warning(
+                        f"Dropped event from worker process {self.module_name}: {err}"
+                    )
+
+    async def forward(self, event):
+        """Sends an event to the worker process. Subscribed on the main event bus in place of the worker handlers."""
+        self.inbox.put(("event", event.get_metadata()))
+
+    def update_subscriptions(self, subscriptions):
+        """Mirrors the subscriptions of the worker handlers onto the main event bus."""
+        subscriptions = set(subscriptions)
+
+        for kind, key in self.subscriptions - subscriptions:
+            self.event_bus.unsubscribe(self._resolve(kind, key), self.forward)
+
+        for kind, key in subscriptions - self.subscriptions:
+            self.event_bus.subscribe(self._resolve(kind, key), self.forward)
+
+        self.subscriptions = subscriptions
+
+    @staticmethod
+    def _resolve(kind, key):
+        if kind == "pattern":
+            return key
+
+        module_name, _, class_name = key.rpartition(".")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    async def stop(self):
+        """Asks the worker process to shut down, terminating it if it does not exit in time."""
+        self.logger.info(f"Stopping worker process for module {self.module_name}.")
+        for kind, key in self.subscriptions:
+            self.event_bus.unsubscribe(self._resolve(kind, key), self.forward)
+        self.subscriptions = set()
+
+        if self.process.is_alive():
+            self.inbox.put(("stop",))
+            await self.loop.run_in_executor(
+                None, self.process.join, WORKER_STOP_TIMEOUT
+            )
+            if self.process.is_alive():
+                self.logger.warning(
+                    f"Worker process for module {self.module_name} did not exit, terminating it."
+                )
+                self.process.terminate()
+
+        if self.reader_task is not None:
+            if not self.reader_task.done():
+                # the worker did not get to say goodbye, unblock the reader thread waiting on the outbox
+                self.outbox.put(None)
+            await self.reader_task
+            self.reader_task = None
+
+
+class WorkerSupervisor:
+    """Stands in for `msa.core.supervisor.Supervisor` inside a worker process, so that handlers run unchanged. Events
+    fired by the handlers are sent back to the main process. While a handler waits for a result, the worker event bus
+    subscribes to the result type, so that the main process forwards the result to the worker."""
+
+    def __init__(self, loop, event_bus, outbox, logger, config_manager=None):
+        self.loop = loop
+        self.event_bus = event_bus
+        self.outbox = outbox
+        self.logger = logger
+        self.config_manager = config_manager
+        self.executor = ThreadPoolExecutor()
+        self.handler_lookup = {}
+        self.stop_loop = False
+        # the number of pending results of each event type
+        self.result_types = {}
+
+    def fire_event(self, new_event):
+        self.outbox.put(("event", new_event.get_metadata()))
+
+        fired = self.loop.create_future()
+        fired.set_result(True)
+        return fired
+
+    def fire_events(self, new_events):
+        count = 0
+        for new_event in new_events:
+            self.outbox.put(("event", new_event.get_metadata()))
+            count += 1
+
+        fired = self.loop.create_future()
+        fired.set_result(count)
+        return fired
+
+    async def listen_for_result(self, event_type, timeout=None, correlation_id=None):
+        future = self._expect_result(event_type, correlation_id)
+        return await self.event_bus.wait_for_result(future, timeout)
+
+    async def request(self, new_event, result_type, timeout=RESULT_TIMEOUT):
+        """Fires an event and waits for the reply to it, see `msa.core.supervisor.Supervisor.request`."""
+        if new_event.correlation_id is None:
+            new_event.correlate()
+
+        future = self._expect_result(result_type, new_event.correlation_id)
+        # the subscription to the result type is sent ahead of the event, so the reply cannot be missed
+        self.fire_event(new_event)
+        return await self.event_bus.wait_for_result(future, timeout)
+
+    def _expect_result(self, event_type, correlation_id):
+        future = self.event_bus.expect_result(event_type, correlation_id)
+
+        pending = self.result_types.get(event_type, 0)
+        if pending == 0:
+            self.event_bus.subscribe(event_type, _receive_result)
+        self.result_types[event_type] = pending + 1
+
+        future.add_done_callback(partial(self._release_result_type, event_type))
+        return future
+
+    def _release_result_type(self, event_type, future):
+        self.result_types[event_type] -= 1
+        if self.result_types[event_type] == 0:
+            del self.result_types[event_type]
+            self.event_bus.unsubscribe(event_type, _receive_result)
+
+    def should_stop(self):
+        return self.stop_loop
+
+    def get_handler(self, handler_type):
+        return self.handler_lookup.get(handler_type)
+
+
+def _receive_result(event):
+    # results resolve the futures waiting on them as they are dispatched, nothing else is done with them
+    pass
+
+
+class WorkerEventBus(EventBus):
+    """The event bus of a worker process. Reports its subscriptions to the main process whenever they change, so that
+    handlers may subscribe and unsubscribe as they run."""
+
+    def __init__(self, loop, outbox):
+        super().__init__(loop)
+        self.outbox = outbox
+        self.report_subscriptions = False
+
+    def subscribe(self, event_type, callback, *args, **kwargs):
+        super().subscribe(event_type, callback, *args, **kwargs)
+        if self.report_subscriptions:
+            self.send_subscriptions()
+
+    def unsubscribe(self, event_type, callback):
+        super().unsubscribe(event_type, callback)
+        if self.report_subscriptions:
+            self.send_subscriptions()
+
+    def send_subscriptions(self):
+        keys = [
+            ("type", f"{event_type.__module__}.{event_type.__qualname__}")
+            for event_type in self.subscriptions
+        ]
+        keys.extend(("pattern", pattern) for pattern in self.complex_subscriptions)
+        self.outbox.put(("subscriptions", keys))
+
+
+def run_worker(module_name, config, logging_config, config_manager, inbox, outbox):
+    """The entry point of a worker process. Runs the handlers of a module on a private event loop and event bus until
+    asked to stop."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    root_logger = logging.getLogger("msa")
+    if logging_config is not None:
+        root_logger.setLevel(logging_config["global_log_level"])
+        file_handler = logging.FileHandler(
+            logging_config["log_file_location"], mode="a"
+        )
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(levelname)s - %(processName)s - %(name)s - %(message)s"
+            )
+        )
+        root_logger.addHandler(file_handler)
+
+    event_bus = WorkerEventBus(loop, outbox)
+    supervisor = WorkerSupervisor(
+        loop,
+        event_bus,
+        outbox,
+        root_logger.getChild("core.supervisor"),
+        config_manager,
+    )
+    msa.core.supervisor_instance = supervisor
+
+    try:
+        loop.run_until_complete(
+            _worker_main(
+                loop, event_bus, supervisor, root_logger, module_name, config, inbox
+            )
+        )
+    except Exception:
+        traceback.print_exc()
+    finally:
+        supervisor.stop_loop = True
+        loop.run_until_complete(event_bus.stop_workers())
+        supervisor.executor.shutdown()
+        outbox.put(None)
+        loop.close()
+
+
+async def _worker_main(
+    loop, event_bus, supervisor, root_logger, module_name, config, inbox
+):
+    module = importlib.import_module(module_name)
+
+    if hasattr(module, "entities_list") and isinstance(module.entities_list, list):
+        from msa.data import __models__, start_db_engine
+
+        # database connections cannot cross the process boundary, so the worker opens its own to the database file of
+        # the main process. The main process has created the tables of every module, including this one, before any
+        # worker starts, so only missing tables would be created here. SQLite locks the file around each write, so
+        # both processes can write to it.
+        __models__.extend(module.entities_list)
+        await start_db_engine()
+
+    handlers = []
+    for handler in module.handler_factories:
+        namespace = "{}.{}".format(module_name[4:], handler.__name__)
+        instance = handler(loop, event_bus, root_logger.getChild(namespace), config)
+        supervisor.handler_lookup[handler] = instance
+        handlers.append(instance)
+
+    await asyncio.gather(*[handler.init() for handler in handlers])
+
+    event_bus.send_subscriptions()
+    event_bus.report_subscriptions = True
+
+    tasks = [loop.create_task(event_bus.listen())]
+
+    scheduled = [
+        handler.schedule()
+        for handler in handlers
+        if not hasattr(handler.schedule, "base_class")
+    ]
+    if scheduled:
+        from msa.core.supervisor import Supervisor
+
+        for coros in scheduled:
+            for [tab, coro] in coros:
+                tasks.append(
+                    loop.create_task(Supervisor._wrap_scheduled_coro(tab, coro))
+                )
+
+    try:
+        while True:
+            message = await loop.run_in_executor(None, inbox.get)
+            if message[0] == "stop":
+                break
+
+            try:
+                event = Event.deserialize(message[1])
+            except Exception:
+                root_logger.exception(
+                    f"Failed to deserialize event in worker process {module_name}."
+                )
+                continue
+
+            await event_bus.fire_event(event)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
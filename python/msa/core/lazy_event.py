@@ -0,0 +1,97 @@
+from typing import Callable, Dict, Optional
+
+from msa.core.event import Event
+
+
+class LazyEvent:
+    """An event received over the network whose data has not been decoded or validated yet.
+
+    The metadata of the event, its type, priority, source, target and correlation id, can be read without touching
+    its data, so consumers that only route or forward events do not pay for decoding them. The data is decoded and
+    validated the first time `data` or `get_event` is used.
+
+    Attributes
+    ----------
+    raw : Optional[bytes]
+        The event as it was encoded when it was received, see `msa.server.wire_codec`, if it was received in binary.
+        Encoding the lazy event again forwards these bytes unchanged."""
+
+    __slots__ = ("metadata", "raw", "_raw_data", "_decode_data", "_event")
+
+    def __init__(
+        self,
+        metadata: Dict,
+        raw_data: Optional[bytes] = None,
+        decode_data: Optional[Callable[[bytes], object]] = None,
+        raw: Optional[bytes] = None,
+    ):
+        """
+        Parameters
+        ----------
+        metadata : Dict
+            The metadata of the event, as returned by `Event.get_metadata`. May hold the data of the event as
+            `event_data`, in which case it is only validated when accessed.
+        raw_data : Optional[bytes]
+            The encoded data of the event, if the metadata does not hold it.
+        decode_data : Optional[Callable[[bytes], object]]
+            Decodes `raw_data`.
+        raw : Optional[bytes]
+            The encoded event."""
+        self.metadata = metadata
+        self.raw = raw
+        self._raw_data = raw_data
+        self._decode_data = decode_data
+        self._event = None
+
+    @property
+    def event_type(self):
+        return self.metadata["event_type"]
+
+    @property
+    def priority(self):
+        return self.metadata.get("priority", 100)
+
+    @property
+    def propagate_source(self):
+        return self.metadata.get("propagate_source")
+
+    @property
+    def propagate_target(self):
+        return self.metadata.get("propagate_target")
+
+    @property
+    def correlation_id(self):
+        return self.metadata.get("correlation_id")
+
+    @property
+    def _network_propagate(self):
+        return self.metadata.get("_network_propagate", False)
+
+    @_network_propagate.setter
+    def _network_propagate(self, network_propagate):
+        self.metadata["_network_propagate"] = network_propagate
+        if self._event is not None:
+            self._event._network_propagate = network_propagate
+
+    @property
+    def data(self):
+        """The data of the event, decoded and validated on first access."""
+        return self.get_event().data
+
+    def get_event(self) -> Event:
+        """Returns the event, decoding and validating its data the first time it is called. Raises
+        `schema.SchemaError` if the data is invalid."""
+        if self._event is None:
+            self._event = Event.deserialize(self.get_metadata())
+        return self._event
+
+    def get_metadata(self) -> Dict:
+        """Returns the metadata of the event, decoding but not validating its data. The metadata the event was
+        received with is returned as is, so forwarding it does not serialize the event again."""
+        if self._raw_data is not None:
+            self.metadata["event_data"] = self._decode_data(self._raw_data)
+            self._raw_data = None
+        return self.metadata
+
+    def __str__(self):
+        return f"<lazy {self.event_type} at {hex(id(self))}>"
@@ -0,0 +1,369 @@
+import schema as schema_module
+from schema import And, Or, Optional, Schema, SchemaError, Use
+
+try:
+    from schema import SchemaMissingKeyError, SchemaWrongKeyError
+except ImportError:  # pragma: no cover
+    SchemaMissingKeyError = SchemaWrongKeyError = SchemaError
+
+# schema constructs that are always validated by the schema library rather than compiled
+_UNCOMPILED_TYPES = tuple(
+    getattr(schema_module, name)
+    for name in ("Literal", "Hook", "Regex")
+    if hasattr(schema_module, name)
+)
+
+_ITERABLE_TYPES = (list, tuple, set, frozenset)
+
+
+def compile_schema(schema):
+    """Compiles a schema into a Python function that validates data against it.
+
+    `schema.Schema.validate` interprets the schema anew for every value it validates, building a `Schema` for each node
+    it visits and copying dicts as it goes. The compiled function has the checks for the whole schema laid out as
+    straight Python code, built once. It returns the validated data, and raises `schema.SchemaError` when the data is
+    invalid, as `schema.Schema.validate` does.
+
+    Plain `Schema` wrappers, dicts, lists, tuples and sets, types, literal values, callables, `And`, `Or`, `Use` and
+    `Optional` dict keys are compiled. Anything else, such as `Regex`, `Hook` or a `Schema` with a custom error or
+    `ignore_extra_keys`, is handed to the schema library where it appears.
+
+    Parameters
+    ----------
+    schema : Any
+        A `schema.Schema`, or any value that can be wrapped in one.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        The validator function."""
+    return _SchemaCompiler().compile(schema)
+
+
+def _is_plain(node):
+    """Returns `True` for a `Schema`, `And` or `Or` without options that change how it validates."""
+    if getattr(node, "_error", None) is not None:
+        return False
+    if getattr(node, "_ignore_extra_keys", False):
+        return False
+    if type(node) is Schema:
+        return getattr(node, "_name", None) is None
+    if type(node) is Or and getattr(node, "only_one", False):
+        return False
+    return type(node) in (And, Or)
+
+
+def _kind(node):
+    """Classifies a schema node the way `schema.Schema.validate` does."""
+    if type(node) in _ITERABLE_TYPES:
+        return "iterable"
+    if isinstance(node, dict):
+        return "dict"
+    if isinstance(node, type):
+        return "type"
+    if isinstance(node, _UNCOMPILED_TYPES):
+        return "library"
+    if hasattr(node, "validate"):
+        return "validator"
+    if callable(node):
+        return "callable"
+    return "comparable"
+
+
+def _callable_name(node):
+    return getattr(node, "__name__", type(node).__name__)
+
+
+class _SchemaCompiler:
+    def __init__(self):
+        self.namespace = {
+            "Schema": Schema,
+            "SchemaError": SchemaError,
+            "SchemaMissingKeyError": SchemaMissingKeyError,
+            "SchemaWrongKeyError": SchemaWrongKeyError,
+        }
+        self.functions = []
+        self.count = 0
+
+    def compile(self, node):
+        name = self.function(node)
+        source = "\n\n".join(self.functions)
+        exec(compile(source, f"<compiled schema {node!r:.60}>", "exec"), self.namespace)
+        return self.namespace[name]
+
+    def constant(self, value):
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def new_name(self, prefix):
+        self.count += 1
+        return f"{prefix}{self.count}"
+
+    def function(self, node):
+        """Emits a function validating `node`, and returns its name."""
+        name = self.new_name("_validate")
+        while type(node) is Schema and _is_plain(node):
+            node = node.schema
+
+        if _kind(node) == "dict" and not self.is_library_dict(node):
+            body = self.dict_body(node)
+        elif type(node) in _ITERABLE_TYPES:
+            body = self.iterable_body(node)
+        elif type(node) is Or and _is_plain(node):
+            body = self.or_body(node.args)
+        else:
+            body = self.check(node, "data", 1) + ["    return data"]
+
+        self.functions.append(f"def {name}(data):\n" + "\n".join(body))
+        return name
+
+    def check(self, node, var, depth):
+        """Returns the lines validating `var` against `node` in place, indented `depth` levels."""
+        indent = "    " * depth
+        kind = _kind(node)
+
+        if type(node) is Schema and _is_plain(node):
+            return self.check(node.schema, var, depth)
+
+        if kind == "dict" and self.is_library_dict(node):
+            kind = "library"
+
+        if kind in ("dict", "iterable") or (type(node) is Or and _is_plain(node)):
+            return [f"{indent}{var} = {self.function(node)}({var})"]
+
+        if kind == "type":
+            c = self.constant(node)
+            condition = f"not isinstance({var}, {c})"
+            if node is int:
+                condition = f"type({var}) is bool or {condition}"
+            return [
+                f"{indent}if {condition}:",
+                f"{indent}    raise SchemaError('%r should be instance of %r' % ({var}, {node.__name__!r}))",
+            ]
+
+        if kind == "comparable":
+            c = self.constant(node)
+            return [
+                f"{indent}if not {c} == {var}:",
+                f"{indent}    raise SchemaError('%r does not match %r' % ({c}, {var}))",
+            ]
+
+        if kind == "callable":
+            c = self.constant(node)
+            name = _callable_name(node)
+            return [
+                f"{indent}try:",
+                f"{indent}    ok = {c}({var})",
+                f"{indent}except SchemaError as x:",
+                f"{indent}    raise SchemaError([None] + x.autos, [None] + x.errors)",
+                f"{indent}except Exception as x:",
+                f"{indent}    raise SchemaError('%s(%r) raised %r' % ({name!r}, {var}, x))",
+                f"{indent}if not ok:",
+                f"{indent}    raise SchemaError('%s(%r) should evaluate to True' % ({name!r}, {var}))",
+            ]
+
+        if type(node) is And and _is_plain(node):
+            lines = []
+            for arg in node.args:
+                lines += self.check(arg, var, depth)
+            return lines or [f"{indent}pass"]
+
+        if type(node) is Use and getattr(node, "_error", None) is None:
+            c = self.constant(node._callable)
+            name = _callable_name(node._callable)
+            return [
+                f"{indent}try:",
+                f"{indent}    {var} = {c}({var})",
+                f"{indent}except SchemaError as x:",
+                f"{indent}    raise SchemaError([None] + x.autos, [None] + x.errors)",
+                f"{indent}except Exception as x:",
+                f"{indent}    raise SchemaError('%s(%r) raised %r' % ({name!r}, {var}, x))",
+            ]
+
+        # everything else is validated by the schema library, exactly as `Schema` would
+        c = self.constant(node if isinstance(node, Schema) else Schema(node))
+        return [f"{indent}{var} = {c}.validate({var})"]
+
+    def predicate(self, node, var):
+        """Returns a boolean expression checking `var` against `node`, or `None` if `node` does more than check its
+        value, or does not appear in the schema as a plain value check."""
+        if type(node) is Schema and _is_plain(node):
+            return self.predicate(node.schema, var)
+
+        kind = _kind(node)
+        if kind == "type":
+            if node is int:
+                return f"(type({var}) is not bool and isinstance({var}, {self.constant(node)}))"
+            return f"isinstance({var}, {self.constant(node)})"
+        if kind == "comparable":
+            return f"{self.constant(node)} == {var}"
+        if kind == "callable":
+            return f"{self.constant(node)}({var})"
+        if type(node) is And and _is_plain(node) and len(node.args) > 0:
+            predicates = [self.predicate(arg, var) for arg in node.args]
+            if None not in predicates:
+                return " and ".join(predicates)
+        return None
+
+    def or_body(self, args):
+        c = self.constant(Or(*args))
+        lines = []
+        for arg in args:
+            predicate = self.predicate(arg, "data")
+            if predicate is not None:
+                # checks that fail fall through to the next alternative without raising, as raising and catching
+                # `SchemaError` costs far more than the checks themselves
+                lines += [
+                    "    try:",
+                    f"        if {predicate}:",
+                    "            return data",
+                    "    except Exception:",
+                    "        pass",
+                ]
+                continue
+
+            lines += [
+                "    try:",
+                "        value = data",
+                *self.check(arg, "value", 2),
+                "        return value",
+                "    except SchemaError:",
+                "        pass",
+            ]
+        lines.append(
+            "    raise SchemaError('%r did not validate %r' % (" + c + ", data))"
+        )
+        return lines
+
+    def iterable_body(self, node):
+        iterable_type = self.constant(type(node))
+        element = self.function(node[0] if len(node) == 1 else Or(*node))
+        return [
+            f"    if not isinstance(data, {iterable_type}):",
+            f"        raise SchemaError('%r should be instance of %r' % (data, {type(node).__name__!r}))",
+            "    if type(data) is list:",
+            f"        return [{element}(item) for item in data]",
+            f"    return type(data)({element}(item) for item in data)",
+        ]
+
+    @staticmethod
+    def is_library_dict(node):
+        """Dicts with keys that cannot be compiled are validated by the schema library as a whole."""
+        for key in node:
+            inner = key.schema if type(key) is Optional else key
+            if isinstance(key, Schema) and type(key) not in (Schema, Optional):
+                return True
+            if isinstance(inner, Schema) and not _is_plain(inner):
+                return True
+            if _kind(inner) == "library":
+                return True
+        return False
+
+    def dict_body(self, node):
+        literal_keys = []
+        other_keys = []
+        for key in node:
+            optional = type(key) is Optional
+            inner = key.schema if optional else key
+            if _kind(inner) == "comparable":
+                literal_keys.append((key, inner, optional))
+            else:
+                # non-literal keys are tried in the order `Schema` tries them, optional keys after required ones
+                other_keys.append((key, inner, optional))
+        other_keys.sort(key=lambda entry: (_priority(entry[1]), entry[2]))
+
+        lines = [
+            "    if not isinstance(data, dict):",
+            "        raise SchemaError('%r should be instance of %r' % (data, 'dict'))",
+            "    new = type(data)()",
+        ]
+        if any(not optional for _, _, optional in other_keys):
+            lines.append("    covered = set()")
+
+        lines += ["    for key, value in data.items():", "        try:"]
+
+        branch = "if"
+        for key, inner, _ in literal_keys:
+            lines.append(f"            {branch} key == {self.constant(inner)}:")
+            lines += self.check(node[key], "value", 4)
+            lines.append("                new[key] = value")
+            branch = "elif"
+
+        if other_keys:
+            indent = 3
+            if literal_keys:
+                lines.append("            else:")
+                indent = 4
+            pad = "    " * indent
+            for index, (key, inner, optional) in enumerate(other_keys):
+                lines += [
+                    f"{pad}try:",
+                    f"{pad}    nkey = key",
+                    *self.check(inner, "nkey", indent + 1),
+                    f"{pad}except SchemaError:",
+                    f"{pad}    pass",
+                    f"{pad}else:",
+                    *self.check(node[key], "value", indent + 1),
+                    f"{pad}    new[nkey] = value",
+                ]
+                if not optional:
+                    lines.append(f"{pad}    covered.add({index})")
+                lines.append(f"{pad}    continue")
+        elif not literal_keys:
+            lines.append("            pass")
+
+        lines += [
+            "        except SchemaError as x:",
+            "            raise SchemaError([\"Key '%s' error:\" % (key,)] + x.autos, [None] + x.errors)",
+        ]
+
+        required_literals = [
+            inner for _, inner, optional in literal_keys if not optional
+        ]
+        required_indexes = {
+            index: key
+            for index, (key, _, optional) in enumerate(other_keys)
+            if not optional
+        }
+        conditions = []
+        missing = []
+        if required_literals:
+            c = self.constant(frozenset(required_literals))
+            conditions.append(f"not data.keys() >= {c}")
+            missing.append(f"[k for k in {c} if k not in data]")
+        if required_indexes:
+            c = self.constant(required_indexes)
+            conditions.append(f"len(covered) != {len(required_indexes)}")
+            missing.append(f"[k for i, k in {c}.items() if i not in covered]")
+        if conditions:
+            lines += [
+                f"    if {' or '.join(conditions)}:",
+                f"        missing = sorted({' + '.join(missing)}, key=repr)",
+                "        raise SchemaMissingKeyError('Missing key%s: %s' % ('s' if len(missing) > 1 else '', ', '.join(repr(k) for k in missing)))",
+            ]
+
+        lines += [
+            "    if len(new) != len(data):",
+            "        wrong = sorted(set(data) - set(new), key=repr)",
+            "        raise SchemaWrongKeyError('Wrong key%s %s in %r' % ('s' if len(wrong) > 1 else '', ', '.join(repr(k) for k in wrong), data))",
+        ]
+
+        for key, inner, optional in literal_keys:
+            if optional and hasattr(key, "default"):
+                default = self.constant(key.default)
+                value = f"{default}()" if callable(key.default) else default
+                lines += [
+                    f"    if {self.constant(inner)} not in data:",
+                    f"        new[{key.key!r}] = {value}",
+                ]
+
+        lines.append("    return new")
+        return lines
+
+
+def _priority(node):
+    """The order `schema.Schema` tries dict keys in, see `_kind`."""
+    return ["comparable", "callable", "validator", "type", "dict", "iterable"].index(
+        _kind(node) if _kind(node) != "library" else "validator"
+    )
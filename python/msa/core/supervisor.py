@@ -5,15 +5,25 @@ import traceback
 import logging
 import inspect
 from contextlib import suppress
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor
 from aiocron import crontab
 from datetime import datetime
 
 from schema import Schema
 
 from msa.core.event import Event
+from msa.core.event_registry import event_registry
 from msa.core.loader import load_builtin_modules, load_plugin_modules
-from msa.core.event_bus import EventBus
+from msa.core.event_bus import EventBus, RESULT_TIMEOUT
+from msa.core.dead_letter import DEFAULT_DEAD_LETTER_SIZE, RetryPolicy
+from msa.core.event_journal import EventJournal
+from msa.core.event_queue import (
+    OverflowPolicy,
+    EventQueueFullException,
+    PriorityLane,
+)
+from msa.core.handler_process import HandlerProcess
 from msa.core.config_manager import ConfigManager
 from msa.server.route_adapter import RouteAdapter
 from msa.api import get_api
@@ -37,6 +47,8 @@ class Supervisor:
 
         self.handler_lookup = {}
 
+        self.handler_processes = []
+
         self.shutdown_callbacks = []
 
         self.executor = ThreadPoolExecutor()
@@ -107,17 +119,36 @@ class Supervisor:
             A dictionary containing configuration options derived from the command line interface.
         route_adapter: ** fix docstrings **
         """
+        # ### PLACEHOLDER - Load Configuration file here --
+        self.config_manager = ConfigManager(cli_config["cli_overrides"])
+        config = self.config_manager.get_config()
+
         if not os.environ.get("TEST"):
             self.loop = loop
-            self.event_bus = EventBus(self.loop)
+            bus_config = config.get("event_bus", {})
+
+            journal = None
+            if "journal" in bus_config:
+                journal = EventJournal(self.loop, **bus_config["journal"])
+                journal.open()
+
+            self.event_bus = EventBus(
+                self.loop,
+                max_queue_size=bus_config.get("max_queue_size", 0),
+                overflow_policy=bus_config.get("overflow_policy", OverflowPolicy.block),
+                retry_policy=RetryPolicy(**bus_config.get("retry", {})),
+                dead_letter_size=bus_config.get(
+                    "dead_letter_size", DEFAULT_DEAD_LETTER_SIZE
+                ),
+                lanes=[PriorityLane(**lane) for lane in bus_config["lanes"]]
+                if "lanes" in bus_config
+                else None,
+                journal=journal,
+            )
             self.event_queue = asyncio.Queue(self.loop)
             # block getting a loop if we are running unit tests
             # helps suppress a warning.
 
-        # ### PLACEHOLDER - Load Configuration file here --
-        self.config_manager = ConfigManager(cli_config["cli_overrides"])
-        config = self.config_manager.get_config()
-
         client_api_binder = get_api(
             ApiContext.local, config["plugin_modules"], loop=loop
         )
@@ -143,8 +174,18 @@ class Supervisor:
 
         self.logger.info("Finished loading modules.")
 
+        for name, full_names in event_registry.get_ambiguous_names().items():
+            self.logger.warning(
+                "Event class name %s is defined by several modules: %s. Events of these classes are serialized with "
+                "their fully qualified names.",
+                name,
+                ", ".join(full_names),
+            )
+
         self.loaded_modules = bultin_modules + plugin_modules
 
+        process_modules = config.get("event_bus", {}).get("process_modules", [])
+
         # ### Registering Handlers
         self.logger.info("Registering handlers.")
         for module in self.loaded_modules:
@@ -180,6 +221,27 @@ class Supervisor:
             self.logger.debug(f"Validating module {module.__name__} config schema.")
             validated_config = module.config_schema.validate(module_config)
 
+            if module_name_tail in process_modules:
+                self.logger.debug(
+                    f"Handlers for module {module.__name__} will run in a worker process."
+                )
+                process_logger = self.root_logger.getChild(
+                    f"core.handler_process.{module_name_tail}"
+                )
+                self.loggers[process_logger.name] = process_logger
+                self.handler_processes.append(
+                    HandlerProcess(
+                        self.loop,
+                        self.event_bus,
+                        process_logger,
+                        module.__name__,
+                        validated_config,
+                        config["logging"],
+                        self.config_manager,
+                    )
+                )
+                continue
+
             self.logger.debug(
                 "Registering handlers for module msa.{}".format(module.__name__)
             )
@@ -247,11 +309,25 @@ class Supervisor:
                 with suppress(asyncio.CancelledError):
                     await future
 
+        self.logger.debug("Exit: Stopping handler worker processes.")
+        for handler_process in self.handler_processes:
+            await handler_process.stop()
+
+        self.logger.debug(f"Event queue counters: {self.event_bus.queue.counters}")
+        self.logger.debug(
+            f"Dead letter counters: {self.event_bus.dead_letters.counters}"
+        )
+
         self.logger.debug("Exit: Cancelling event bus futures.")
         with suppress(asyncio.CancelledError):
             if self.event_bus.task is not None:
                 self.event_bus.task.cancel()
                 await self.event_bus.task
+            await self.event_bus.stop_workers()
+
+        if self.event_bus.journal is not None:
+            self.logger.debug("Exit: Closing event journal.")
+            await self.event_bus.journal.close()
 
         # cancel and suppress exit future
         if self.stop_future is not None:
@@ -266,20 +342,136 @@ class Supervisor:
     def fire_event(self, new_event: Event):
         """Fires an event to all event listeners.
 
+        Safe to call from any thread. On the event loop thread the event is queued straight away, and from another
+        thread, such as an executor running blocking work, it is handed to the event loop thread to be queued.
+
         Parameters
         ----------
         new_event : `Event`
             A new instance of a subclass of `Event` to be propagated to other event handlers.
+
+        Returns
+        -------
+        Union[asyncio.Future, concurrent.futures.Future]
+            Resolves once the event has been queued, or dropped by the event queue overflow policy. Awaiting it
+            applies backpressure when the queue is full, and raises `EventQueueFullException` if the event was
+            rejected. Called from another thread, a `concurrent.futures.Future` is returned instead, which can be
+            waited on in that thread or awaited in another event loop after wrapping it with `asyncio.wrap_future`.
         """
-        self.logger.debug("Fire event: {}".format(new_event))
+        self.logger.debug("Fire event: %s", new_event)
 
-        def fire():
-            self.loop.create_task(self.event_bus.fire_event(new_event))
+        if self._on_loop_thread():
+            return self._fire_event_now(new_event)
 
-        self.loop.call_soon(fire)
+        fired = Future()
+        self.loop.call_soon_threadsafe(self._fire_event_threadsafe, new_event, fired)
+        return fired
 
-    async def listen_for_result(self, event_type):
-        return await self.event_bus.listen_for_result(event_type)
+    def fire_events(self, new_events):
+        """Fires many events to all event listeners, scheduling a single task for all of them rather than one per
+        event. Like `Supervisor.fire_event`, safe to call from any thread.
+
+        Parameters
+        ----------
+        new_events : Iterable[`Event`]
+            New instances of subclasses of `Event` to be propagated to other event handlers.
+
+        Returns
+        -------
+        Union[asyncio.Future, concurrent.futures.Future]
+            Resolves to the number of events queued, once all of them have been queued or dropped.
+        """
+        new_events = list(new_events)
+        self.logger.debug("Fire %s events", len(new_events))
+
+        if self._on_loop_thread():
+            return self._fire_events_now(new_events)
+
+        fired = Future()
+        self.loop.call_soon_threadsafe(self._fire_events_threadsafe, new_events, fired)
+        return fired
+
+    def _on_loop_thread(self):
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            # no loop is running in this thread, so either the event loop has not been started yet, or it is running
+            # in another thread
+            return not self.loop.is_running()
+
+    def _fire_event_now(self, new_event):
+        fired = self.loop.create_future()
+        try:
+            fired.set_result(self.event_bus.fire_event_nowait(new_event))
+        except asyncio.QueueFull:
+            # wait for room in a task, as the overflow policy asks
+            task = self.loop.create_task(self.event_bus.fire_event(new_event))
+            task.add_done_callback(partial(self._resolve_fired, new_event, fired))
+        except Exception as err:
+            self.logger.warning(f"Failed to fire event {new_event}: {err}")
+            _set_logged_exception(fired, err)
+        return fired
+
+    def _fire_events_now(self, new_events):
+        fired = self.loop.create_future()
+        task = self.loop.create_task(self.event_bus.fire_events(new_events))
+        task.add_done_callback(partial(self._resolve_fired, new_events, fired))
+        return fired
+
+    def _fire_event_threadsafe(self, new_event, fired):
+        self._fire_event_now(new_event).add_done_callback(
+            partial(_copy_future_state, fired)
+        )
+
+    def _fire_events_threadsafe(self, new_events, fired):
+        self._fire_events_now(new_events).add_done_callback(
+            partial(_copy_future_state, fired)
+        )
+
+    def _resolve_fired(self, new_event, fired, task):
+        if fired.cancelled():
+            return
+
+        if task.exception() is not None:
+            self.logger.warning(f"Failed to fire event {new_event}: {task.exception()}")
+            _set_logged_exception(fired, task.exception())
+        else:
+            fired.set_result(task.result())
+
+    async def listen_for_result(self, event_type, timeout=None, correlation_id=None):
+        return await self.event_bus.listen_for_result(
+            event_type, timeout=timeout, correlation_id=correlation_id
+        )
+
+    async def request(self, new_event: Event, result_type, timeout=RESULT_TIMEOUT):
+        """Fires an event and waits for the reply to it. Replies are matched by correlation id rather than by type, so
+        concurrent requests of the same type each receive their own reply.
+
+        Parameters
+        ----------
+        new_event : `Event`
+            The request event. It is given a correlation id if it does not already have one.
+        result_type : Type[`Event`]
+            The type of the reply event. Handlers replying to the request should call `Event.reply_to`.
+        timeout : Optional[float]
+            Seconds to wait for the reply.
+
+        Returns
+        -------
+        Optional[`Event`]
+            The reply, or `None` if the timeout expired first.
+        """
+        if new_event.correlation_id is None:
+            new_event.correlate()
+
+        future = self.event_bus.expect_result(result_type, new_event.correlation_id)
+        try:
+            await self.fire_event(new_event)
+        except EventQueueFullException:
+            future.cancel()
+            raise
+
+        return await self.event_bus.wait_for_result(future, timeout)
 
     async def startup_coroutine(self, additional_coros=[]):
         """The main coroutine that manages starting the handlers, and waiting for a shutdown signal.
@@ -304,6 +496,12 @@ class Supervisor:
                     f"Finished initializing database for module msa.{module.__name__}"
                 )
 
+        if len(self.handler_processes) > 0:
+            self.logger.info("Starting handler worker processes.")
+            await asyncio.gather(
+                *[handler_process.start() for handler_process in self.handler_processes]
+            )
+
         self.logger.debug("Startup Coroutine: Call async init on handlers.")
         init_coros = [handler.init() for handler in self.initialized_event_handlers]
 
@@ -311,6 +509,13 @@ class Supervisor:
 
         await asyncio.gather(*init_coros)
 
+        resolved = self.event_bus.warm_subscriber_cache()
+        self.logger.debug(f"Resolved subscribers of {resolved} event types.")
+
+        if self.event_bus.journal is not None:
+            replayed = await self.event_bus.replay_journal()
+            self.logger.info(f"Replayed {replayed} events from the event journal.")
+
         self.logger.debug("Startup Coroutine: Prime EventBus coroutine.")
         primed_coros = [self.event_bus.listen(), *scheduled_coros]
 
@@ -365,3 +570,21 @@ class Supervisor:
         while True:
             time = await tab.next()
             await coro(time)
+
+
+def _set_logged_exception(fired, err):
+    """Fails the future returned by a fire with an error that was already logged. Most fires are not awaited, so the
+    error is marked as retrieved to keep asyncio from logging it again once the future is garbage collected. Awaiting
+    the future still raises it."""
+    fired.set_exception(err)
+    fired.exception()
+
+
+def _copy_future_state(destination, source):
+    """Copies the outcome of an asyncio future to a `concurrent.futures.Future`."""
+    if source.cancelled():
+        destination.cancel()
+    elif source.exception() is not None:
+        destination.set_exception(source.exception())
+    else:
+        destination.set_result(source.result())
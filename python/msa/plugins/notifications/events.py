@@ -9,22 +9,22 @@ class SendNotificationEvent(Event):
     - timestamp: datetime in yyyy-mm-dd hh:mm:ss:xx format of starup event
     """
 
-    def __init__(self):
-        super().__init__(
-            priority=40,
-            schema=Schema(
-                {
-                    "provider": Or(
-                        NotificationProvider.slack.value,
-                        NotificationProvider.email.value,
-                        NotificationProvider.pushbullet.value,
-                    ),
-                    Optional("target"): And(str, len),
-                    "title": And(str, len),
-                    "message": And(str, len),
-                }
+    __slots__ = ()
+    schema = Schema(
+        {
+            "provider": Or(
+                NotificationProvider.slack.value,
+                NotificationProvider.email.value,
+                NotificationProvider.pushbullet.value,
             ),
-        )
+            Optional("target"): And(str, len),
+            "title": And(str, len),
+            "message": And(str, len),
+        }
+    )
+
+    def __init__(self):
+        super().__init__(priority=40)
 
 
 class SendPreferredNotificationEvent(Event):
@@ -33,14 +33,14 @@ class SendPreferredNotificationEvent(Event):
     - timestamp: datetime in yyyy-mm-dd hh:mm:ss:xx format of starup event
     """
 
+    __slots__ = ()
+    schema = Schema(
+        {
+            Optional("target"): And(str, len),
+            "title": And(str, len),
+            "message": And(str, len),
+        }
+    )
+
     def __init__(self):
-        super().__init__(
-            priority=40,
-            schema=Schema(
-                {
-                    Optional("target"): And(str, len),
-                    "title": And(str, len),
-                    "message": And(str, len),
-                }
-            ),
-        )
+        super().__init__(priority=40)
@@ -1,5 +1,6 @@
 from functools import partial
 
+from msa.core.event_bus import DispatchMode
 from msa.core.event_handler import EventHandler
 from msa.plugins.notifications.events import (
     SendNotificationEvent,
@@ -70,10 +71,15 @@ class SendNotificationEventHandler(EventHandler):
             preferred_provider_type = NotificationProvider[preferred_provider]
             self.preferred_provider = self.providers[preferred_provider_type]
             self.event_bus.subscribe(
-                SendPreferredNotificationEvent, self.handle_preferred
+                SendPreferredNotificationEvent,
+                self.handle_preferred,
+                dispatch=DispatchMode.concurrent,
             )
 
-        self.event_bus.subscribe(SendNotificationEvent, self.handle_notify)
+        # notification providers are slow network calls, so they should not hold up the event bus
+        self.event_bus.subscribe(
+            SendNotificationEvent, self.handle_notify, dispatch=DispatchMode.concurrent
+        )
 
     async def handle_notify(self, event):
 
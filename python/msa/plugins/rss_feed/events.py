@@ -8,5 +8,11 @@ class RssFeedRequestEvent(Event):
     - timestamp: datetime in yyyy-mm-dd hh:mm:ss:xx format of starup event
     """
 
+    __slots__ = ()
+    schema = Schema(None)
+
+    # clients asking for the feed at the same time share one response
+    coalesce_window = 5
+
     def __init__(self):
-        super().__init__(priority=40, schema=Schema(None))
+        super().__init__(priority=40)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from msa.builtins.intents.events import IntentEvent
+from msa.core.event_bus import DispatchMode
 from msa.core.event_handler import EventHandler
 from msa.core import get_supervisor
 from msa.builtins.conversation.events import ConversationOutputEvent
@@ -21,7 +22,11 @@ class RssPollingHandler(EventHandler):
     def __init__(self, loop, event_bus, logger, config=None):
         super().__init__(loop, event_bus, logger, config)
 
-        self.event_bus.subscribe(RssFeedRequestEvent, self.handle_request_feed)
+        self.event_bus.subscribe(
+            RssFeedRequestEvent,
+            self.handle_request_feed,
+            dispatch=DispatchMode.concurrent,
+        )
 
         self.feed = None
 
@@ -49,7 +54,10 @@ class RssPollingHandler(EventHandler):
             output += f"• {title}: {link}\n"
 
         output_event = (
-            ConversationOutputEvent().init({"output": output}).network_propagate()
+            ConversationOutputEvent()
+            .init({"output": output})
+            .network_propagate()
+            .reply_to(event)
         )
 
         notify_intent = IntentEvent().init(
@@ -1,6 +1,13 @@
+import re
+
 from msa.version import v as msa_version
 
-from msa.server.server_response import ServerResponseText, ServerResponseType
+from msa.core import get_supervisor
+from msa.server.server_response import (
+    ServerResponseText,
+    ServerResponseType,
+    ServerResponseJson,
+)
 
 
 def register_default_routes(route_adapter):
@@ -11,3 +18,54 @@ def register_default_routes(route_adapter):
     @route_adapter.get("/version")
     async def version_handler(request=None, raw_data=None):
         return ServerResponseText(ServerResponseType.success, text=msa_version)
+
+    @route_adapter.get("/core/bus/stats")
+    async def bus_stats_handler(request=None, raw_data=None):
+        return ServerResponseJson(
+            ServerResponseType.success, payload=get_supervisor().event_bus.get_stats()
+        )
+
+    @route_adapter.get("/core/bus/dead_letters")
+    async def dead_letters_handler(request=None, raw_data=None):
+        return ServerResponseJson(
+            ServerResponseType.success,
+            payload={"dead_letters": get_supervisor().event_bus.get_dead_letters()},
+        )
+
+    @route_adapter.post("/core/bus/dead_letters/replay")
+    async def replay_dead_letters_handler(request=None, raw_data=None):
+        event_bus = get_supervisor().event_bus
+        letter_id = (request.data or {}).get("id")
+
+        if letter_id is None:
+            replayed = await event_bus.replay_dead_letters()
+        elif await event_bus.replay_dead_letter(letter_id):
+            replayed = 1
+        else:
+            return ServerResponseText(
+                ServerResponseType.failure, f"No dead letter with id {letter_id}."
+            )
+
+        return ServerResponseJson(
+            ServerResponseType.success, payload={"replayed": replayed}
+        )
+
+    @route_adapter.put("/core/propagation/subscriptions")
+    async def propagation_subscriptions_handler(request=None, raw_data=None):
+        patterns = (request.data or {}).get("patterns")
+
+        try:
+            route_adapter.app["websocket_subscriptions"].subscribe(
+                request.source, patterns
+            )
+        except KeyError:
+            return ServerResponseText(
+                ServerResponseType.failure,
+                "Only websocket clients can subscribe to propagated events.",
+            )
+        except (re.error, TypeError) as e:
+            return ServerResponseText(
+                ServerResponseType.failure, f"Invalid event type pattern: {e}"
+            )
+
+        return ServerResponseText(ServerResponseType.success, "subscribed")
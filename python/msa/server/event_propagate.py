@@ -1,35 +1,151 @@
-import json
+import asyncio
+import collections
+
+from msa.core.event import Event
+from msa.server import wire_codec
+
+# the number of propagated events queued for a websocket client, past which the oldest of the lowest priority events
+# queued are dropped
+MAX_QUEUED_EVENTS = 256
+
+# the seconds a websocket client may take to receive a propagated event before it is disconnected
+SEND_TIMEOUT = 10
 
 
 class EventPropagationRouter:
     def __init__(self):
         self.app = None
         self.event_bus = None
+        # the senders of the connected websocket clients, by websocket
+        self.senders = {}
 
     def register_propagate_subscription(self, event_bus):
         self.event_bus = event_bus
-        event_bus.subscribe(".*", self.handle_event_propagate)
+        event_bus.subscribe(Event, self.handle_event_propagate)
 
     async def app_start(self, app):
         self.app = app
 
     async def app_stop(self, app):
-        pass
+        for sender in self.senders.values():
+            sender.close()
+        await asyncio.gather(
+            *[sender.writer for sender in self.senders.values()], return_exceptions=True
+        )
+        self.senders = {}
         # self.event_bus.unsubscri
 
     async def handle_event_propagate(self, event):
+        """Queues an event to be sent to the websocket clients it is targeted at or that subscribed to its type, see
+        `msa.server.websocket_subscriptions.WebsocketSubscriptions`. The event is encoded once per codec in use, and
+        sending it is left to the writer task of each client, so that slow clients hold up neither the event bus nor
+        the other clients."""
         if not event._network_propagate:
             return
 
-        if "websockets" not in self.app:
+        if "websocket_subscriptions" not in self.app:
             return
 
-        for ws in self.app["websockets"]:
-            try:
-                await ws.send_str(
-                    json.dumps(
-                        {"type": "event_propagate", "payload": event.get_metadata()}
-                    )
-                )
-            except:
-                pass
+        subscriptions = self.app["websocket_subscriptions"]
+        binary_websockets = self.app.get("binary_websockets", ())
+        frames = {}
+
+        for ws in subscriptions.get_recipients(event):
+            if ws.closed:
+                continue
+
+            binary = ws in binary_websockets
+            if binary not in frames:
+                frames[binary] = self._encode(event, binary)
+            if frames[binary] is None:
+                continue
+
+            sender = self.senders.get(ws)
+            if sender is None:
+                sender = self.senders[ws] = WebsocketSender(ws)
+            sender.send(event.priority, frames[binary])
+
+        # forget the senders of disconnected clients
+        if len(self.senders) > len(subscriptions.clients):
+            connected = set(subscriptions.clients.values())
+            for ws in [ws for ws in self.senders if ws not in connected]:
+                self.senders.pop(ws).close()
+
+    @staticmethod
+    def _encode(event, binary):
+        try:
+            if binary:
+                return wire_codec.encode({"type": "event_propagate", "payload": event})
+            return wire_codec.encode_json({"type": "event_propagate", "payload": event})
+        except (wire_codec.WireCodecException, TypeError, ValueError):
+            return None
+
+
+class WebsocketSender:
+    """Sends the events propagated to a websocket client from a bounded queue drained by a writer task.
+
+    Once `max_queued` events are waiting to be sent, the oldest of the lowest priority events queued is dropped to make
+    room for a new event of the same or a higher priority, and new events of a lower priority are dropped. A client
+    that takes longer than `SEND_TIMEOUT` seconds to receive an event is disconnected."""
+
+    def __init__(self, ws, max_queued=MAX_QUEUED_EVENTS):
+        self.ws = ws
+        self.max_queued = max_queued
+        # (priority, frame) pairs in the order they are sent
+        self.queue = collections.deque()
+        self.dropped = 0
+        self.closed = False
+        self.ready = asyncio.Event()
+        self.writer = asyncio.ensure_future(self._write())
+
+    def send(self, priority, frame):
+        """Queues a frame to be sent, `bytes` as a binary message and `str` as a text message.
+
+        Returns
+        -------
+        bool
+            `True` if the frame was queued, `False` if it was dropped."""
+        if self.writer.done():
+            return False
+
+        if len(self.queue) >= self.max_queued:
+            # lower values indicate higher priority
+            lowest = max(
+                range(len(self.queue)), key=lambda index: (self.queue[index][0], -index)
+            )
+            self.dropped += 1
+            if priority > self.queue[lowest][0]:
+                return False
+            del self.queue[lowest]
+
+        self.queue.append((priority, frame))
+        self.ready.set()
+        return True
+
+    def close(self):
+        # cancelling the writer alone is not enough, `asyncio.wait_for` may swallow the cancellation if the send it
+        # waits for completes at the same time
+        self.closed = True
+        self.queue.clear()
+        self.ready.set()
+        self.writer.cancel()
+
+    async def _write(self):
+        try:
+            while not self.closed and not self.ws.closed:
+                await self.ready.wait()
+                while self.queue:
+                    _, frame = self.queue.popleft()
+                    if isinstance(frame, bytes):
+                        send = self.ws.send_bytes(frame)
+                    else:
+                        send = self.ws.send_str(frame)
+                    await asyncio.wait_for(send, SEND_TIMEOUT)
+                self.ready.clear()
+        except asyncio.TimeoutError:
+            await self.ws.close(message=b"Too slow to receive events")
+        except (ConnectionError, RuntimeError):
+            # the client disconnected
+            pass
+        finally:
+            self.queue.clear()
@@ -1,3 +1,4 @@
+import asyncio
 import aiohttp
 from aiohttp import web
 import json
@@ -11,7 +12,14 @@ from msa.server.server_response import (
     ServerResponseType,
     ServerResponseJson,
 )
-from msa.server.url_param_parser import UrlParamParser
+from msa.server.route_tree import RouteTree
+from msa.server.url_param_parser import split_query
+from msa.server.websocket_subscriptions import WebsocketSubscriptions
+from msa.server import wire_codec
+
+# the number of requests with an id a websocket client may have running at once, further requests are not read from
+# the websocket until one completes
+WEBSOCKET_MAX_CONCURRENT_REQUESTS = 16
 
 
 class RouteAdapter:
@@ -19,7 +27,7 @@ class RouteAdapter:
 
     def __init__(self):
         self.routes = {"get": {}, "put": {}, "post": {}, "delete": {}}
-        self.param_matchers = []
+        self.routers = {verb: RouteTree() for verb in self.routes}
         self.app = None
 
     @staticmethod
@@ -33,9 +41,13 @@ class RouteAdapter:
 
     def _register_route(self, verb, route):
         if route in self.routes[verb]:
-            raise Exception("Route GET {} already registered".format(route))
+            raise Exception(
+                "Route {} {} already registered".format(verb.upper(), route)
+            )
 
         def add_route(func):
+            # the route tree rejects routes that conflict with a registered route, leave the route table as it was
+            self.routers[verb].add(route, func)
             self.routes[verb][route] = func
 
         return add_route
@@ -55,6 +67,9 @@ class RouteAdapter:
     def register_app(self, app):
         self.app = app
         self.app["websockets"] = []
+        # websockets that negotiated the binary codec
+        self.app["binary_websockets"] = set()
+        self.app["websocket_subscriptions"] = WebsocketSubscriptions()
 
     def lookup_route(self, verb, route):
         if verb not in self.routes:
@@ -74,6 +89,55 @@ class RouteAdapter:
             )
         return response.get_data()
 
+    async def _handle_websocket_request(self, client_id, payload):
+        """Runs the route a websocket request is for, and returns the message answering it. The message carries the
+        id of the request, if it has one."""
+        response = await self._run_websocket_request(client_id, payload)
+        if isinstance(payload, dict) and "id" in payload:
+            response["id"] = payload["id"]
+        return response
+
+    async def _run_websocket_request(self, client_id, payload):
+        if "verb" not in payload:
+            return {
+                "type": "error",
+                "message": "Websocket payload requires a verb field.",
+            }
+
+        if "route" not in payload:
+            return {
+                "type": "error",
+                "message": "Websocket payload requires a route field.",
+            }
+
+        if "payload" not in payload:
+            return {
+                "type": "error",
+                "message": "Websocket payload requires a payload field.",
+            }
+
+        route, query = split_query(payload["route"])
+        try:
+            route_func, url_params = self.lookup_route_and_resolve_url_params(
+                payload["verb"], route
+            )
+        except Exception as e:
+            return {"type": "error", "message": str(e)}
+
+        request = SeverRequest(
+            client_id, payload["verb"], route, payload["payload"], url_params, query
+        )
+
+        try:
+            response = await route_func(request)
+
+            return {
+                "type": "response",
+                "payload": self._build_generic_response(response),
+            }
+        except Exception as e:
+            return {"type": "error", "message": traceback.format_exc()}
+
     def generate_websocket_route(self):
         route_adapter = self
 
@@ -90,92 +154,86 @@ class RouteAdapter:
             ws = web.WebSocketResponse()
             await ws.prepare(response)
 
+            # the client asks for the binary codec when connecting, otherwise messages are exchanged as json
+            binary = response.query.get("codec") == wire_codec.MSA_CONTENT_TYPE
+
+            async def send(message):
+                if binary:
+                    await ws.send_bytes(wire_codec.encode(message))
+                else:
+                    await ws.send_str(wire_codec.encode_json(message))
+
             print(f"Client {host}:{port} connected")
             self.app["websockets"].append(ws)
+            if binary:
+                self.app["binary_websockets"].add(ws)
+            self.app["websocket_subscriptions"].connect(client_id, ws)
 
-            # send client id to client
+            # send client id and the codec used to the client, always as json so that any client can read it
             await ws.send_str(
-                json.dumps({"type": "notify_id", "payload": {"id": client_id}})
+                json.dumps(
+                    {
+                        "type": "notify_id",
+                        "payload": {
+                            "id": client_id,
+                            "codec": wire_codec.MSA_CONTENT_TYPE
+                            if binary
+                            else wire_codec.JSON_CONTENT_TYPE,
+                        },
+                    }
+                )
             )
 
-            async for msg in ws:
-                if msg.type == aiohttp.WSMsgType.TEXT:
-                    payload = json.loads(msg.data)
-
-                    if "verb" not in payload:
-                        await ws.send_str(
-                            json.dumps(
-                                {
-                                    "type": "error",
-                                    "message": "Websocket payload requires a verb field.",
-                                }
-                            )
-                        )
-                        continue
+            # requests carrying an id run concurrently and are answered with the same id, requests without an id are
+            # answered in the order they are received
+            request_slots = asyncio.Semaphore(WEBSOCKET_MAX_CONCURRENT_REQUESTS)
+            running_requests = set()
 
-                    if "route" not in payload:
-                        await ws.send_str(
-                            json.dumps(
-                                {
-                                    "type": "error",
-                                    "message": "Websocket payload requires a route field.",
-                                }
-                            )
-                        )
-                        continue
-
-                    if "payload" not in payload:
-                        await ws.send_str(
-                            json.dumps(
-                                {
-                                    "type": "error",
-                                    "message": "Websocket payload requires a payload field.",
-                                }
-                            )
+            async def run_request(payload):
+                try:
+                    await send(
+                        await route_adapter._handle_websocket_request(
+                            client_id, payload
                         )
+                    )
+                finally:
+                    request_slots.release()
 
+            async for msg in ws:
+                if msg.type in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
                     try:
-                        (
-                            route_func,
-                            url_params,
-                        ) = route_adapter.lookup_route_and_resolve_url_params(
-                            payload["verb"], payload["route"]
-                        )
-                    except Exception as e:
-                        await ws.send_str(
-                            json.dumps({"type": "error", "message": str(e)})
-                        )
+                        if msg.type == aiohttp.WSMsgType.BINARY:
+                            payload = wire_codec.decode(msg.data)
+                        else:
+                            payload = json.loads(msg.data)
+                    except (wire_codec.WireCodecException, ValueError) as e:
+                        await send({"type": "error", "message": str(e)})
                         continue
 
-                    request = SeverRequest(
-                        client_id,
-                        payload["verb"],
-                        payload["route"],
-                        payload["payload"],
-                        url_params,
-                    )
-
-                    try:
-                        response = await route_func(request)
-
-                        wrapped_response = {
-                            "type": "response",
-                            "payload": self._build_generic_response(response),
-                        }
-
-                        await ws.send_str(json.dumps(wrapped_response))
-                    except Exception as e:
-                        await ws.send_str(
-                            json.dumps(
-                                {"type": "error", "message": traceback.format_exc()}
+                    if not isinstance(payload, dict) or "id" not in payload:
+                        await send(
+                            await route_adapter._handle_websocket_request(
+                                client_id, payload
                             )
                         )
                         continue
 
+                    # stop reading from a client that has too many requests running
+                    await request_slots.acquire()
+                    task = asyncio.ensure_future(run_request(payload))
+                    running_requests.add(task)
+                    task.add_done_callback(running_requests.discard)
+
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     print("ws connection closed with exception %s" % ws.exception())
 
-                    self.app["websockets"].remove(ws)
+            if ws in self.app["websockets"]:
+                self.app["websockets"].remove(ws)
+            self.app["binary_websockets"].discard(ws)
+            self.app["websocket_subscriptions"].disconnect(client_id)
+
+            for task in running_requests:
+                task.cancel()
 
             print(f"Client {host}:{port} disconnected")
             return ws
@@ -186,30 +244,38 @@ class RouteAdapter:
         all_routes = []
 
         def route_wrapper(verb, route, func):
-
-            self.param_matchers.append(UrlParamParser(route))
-
             async def wrapped_route(request, raw_data=None):
                 if raw_data:
                     payload = raw_data
                     url_vars = (
                         {}
                     )  # TODO: find some way to get url params from local client
+                    query = {}
                 else:
                     dump = await request.read()
                     url_vars = request.match_info
-                    decoded = dump.decode("utf-8")
-                    if len(decoded) != 0:
-                        payload = json.loads(decoded)
-                    else:
+                    query = dict(request.query)
+                    if len(dump) == 0:
                         payload = None
+                    elif request.content_type == wire_codec.MSA_CONTENT_TYPE:
+                        payload = wire_codec.decode(dump)
+                    else:
+                        payload = json.loads(dump.decode("utf-8"))
 
                 server_request = SeverRequest(
-                    "rest" + str(uuid4()), verb, route, payload, url_vars
+                    "rest" + str(uuid4()), verb, route, payload, url_vars, query
                 )
 
                 response = await func(server_request)
-                return web.json_response(self._build_generic_response(response))
+                data = self._build_generic_response(response)
+                if not raw_data and wire_codec.accepts_binary(
+                    request.headers.get("Accept")
+                ):
+                    return web.Response(
+                        body=wire_codec.encode(data),
+                        content_type=wire_codec.MSA_CONTENT_TYPE,
+                    )
+                return web.json_response(data, dumps=wire_codec.encode_json)
 
             return wrapped_route
 
@@ -237,12 +303,9 @@ class RouteAdapter:
         return None
 
     def lookup_route_and_resolve_url_params(self, verb, route):
-        if verb in self.routes:
-            for matcher in self.param_matchers:
-                if matcher.match(route) and matcher.route in self.routes[verb]:
-                    return (
-                        self.routes[verb][matcher.route],
-                        matcher.resolve_params(route),
-                    )
+        if verb in self.routers:
+            resolved = self.routers[verb].resolve(route)
+            if resolved is not None:
+                return resolved
 
         raise Exception("Failed to resolve url:", verb, route)
@@ -0,0 +1,124 @@
+import re
+
+from msa.server.url_param_parser import url_param_re, url_param_value_pattern
+
+url_param_value_re = re.compile(url_param_value_pattern)
+
+
+class RouteTree:
+    """Resolves request paths to the routes registered for one verb.
+
+    Routes are split into path segments stored in a tree. Static segments are looked up by their text, and `{param}`
+    segments are a single wildcard child capturing the whole segment, so resolving a path costs a dict lookup per path
+    segment no matter how many routes are registered. Segments mixing text and parameters, such as `v{version}`, are
+    matched with a regular expression. Static segments are preferred to parameters when both match a path."""
+
+    def __init__(self):
+        self.root = _RouteNode()
+
+    def add(self, route, handler):
+        """Registers the handler of a route. Raises an exception if the route is already registered, or if it only
+        differs from a registered route by the names of its parameters."""
+        node = self.root
+        fields = []
+        for segment in _split(route):
+            node = node.add_child(segment, fields)
+
+        if node.route is not None:
+            raise Exception(f"Route {route} conflicts with route {node.route}")
+
+        node.route = route
+        node.handler = handler
+        node.fields = fields
+
+    def resolve(self, path):
+        """Resolves a path, with or without a trailing slash.
+
+        Returns
+        -------
+        Optional[Tuple[Callable, Dict[str, str]]]
+            The handler of the route matching the path, and the values of the url parameters of the route. `None` if
+            no route matches the path."""
+        values = []
+        node = self.root.resolve(_split(path), 0, values)
+        if node is None:
+            return None
+        return node.handler, dict(zip(node.fields, values))
+
+
+class _RouteNode:
+    __slots__ = ("static", "param", "patterns", "route", "handler", "fields")
+
+    def __init__(self):
+        self.static = {}
+        self.param = None
+        self.patterns = []
+        # set on nodes that end a route
+        self.route = None
+        self.handler = None
+        self.fields = None
+
+    def add_child(self, segment, fields):
+        names = url_param_re.findall(segment)
+
+        if not names:
+            child = self.static.get(segment)
+            if child is None:
+                child = self.static[segment] = _RouteNode()
+            return child
+
+        fields.extend(names)
+
+        if url_param_re.fullmatch(segment):
+            if self.param is None:
+                self.param = _RouteNode()
+            return self.param
+
+        pattern = "".join(
+            f"({url_param_value_pattern})" if index % 2 else re.escape(text)
+            for index, text in enumerate(url_param_re.split(segment))
+        )
+        for matcher, child in self.patterns:
+            if matcher.pattern == pattern:
+                return child
+
+        child = _RouteNode()
+        self.patterns.append((re.compile(pattern), child))
+        return child
+
+    def resolve(self, segments, index, values):
+        if index == len(segments):
+            return self if self.route is not None else None
+
+        segment = segments[index]
+
+        child = self.static.get(segment)
+        if child is not None:
+            found = child.resolve(segments, index + 1, values)
+            if found is not None:
+                return found
+
+        if self.param is not None and url_param_value_re.fullmatch(segment):
+            values.append(segment)
+            found = self.param.resolve(segments, index + 1, values)
+            if found is not None:
+                return found
+            values.pop()
+
+        for matcher, child in self.patterns:
+            match = matcher.fullmatch(segment)
+            if match is not None:
+                captured = match.groups()
+                values.extend(captured)
+                found = child.resolve(segments, index + 1, values)
+                if found is not None:
+                    return found
+                del values[len(values) - len(captured) :]
+
+        return None
+
+
+def _split(path):
+    if len(path) > 1 and path.endswith("/"):
+        path = path[:-1]
+    return path.split("/")
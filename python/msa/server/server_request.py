@@ -1,7 +1,8 @@
 class SeverRequest:
-    def __init__(self, source, verb, route, data, url_variables):
+    def __init__(self, source, verb, route, data, url_variables, query=None):
         self.source = source
         self.data = data
         self.verb = verb
         self.route = route
         self.url_variables = url_variables
+        self.query = {} if query is None else query
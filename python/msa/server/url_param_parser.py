@@ -1,6 +1,20 @@
 import re
+from urllib.parse import parse_qsl
 
 url_param_re = re.compile("{([0-9a-zA-Z_]+)}")
+# the characters a url parameter value may be made of
+url_param_value_pattern = "[a-zA-Z0-9-_.]+"
+
+
+def split_query(url):
+    """Splits the query string off a url.
+
+    Returns
+    -------
+    Tuple[str, Dict[str, str]]
+        The path of the url, and its query parameters. A parameter given more than once keeps its last value."""
+    path, _, query_string = url.partition("?")
+    return path, dict(parse_qsl(query_string))
 
 
 class UrlParamParser:
@@ -17,7 +31,9 @@ class UrlParamParser:
         for grp in matches:
             self.fields.append(grp)
 
-            url_matcher = url_matcher.replace("{" + grp + "}", "([a-zA-Z0-9-_.]+)")
+            url_matcher = url_matcher.replace(
+                "{" + grp + "}", f"({url_param_value_pattern})"
+            )
 
         self.matcher = re.compile("^" + url_matcher + "/?$")
 
@@ -0,0 +1,69 @@
+import re
+
+
+class WebsocketSubscriptions:
+    """Tracks the connected websocket clients and the propagated events each of them is interested in.
+
+    Clients are indexed by their client id, so that events targeted at a client are only sent to its websocket. A
+    client that subscribed to event type patterns is only sent the untargeted events whose type matches one of them,
+    other clients are sent every untargeted event. Patterns are regular expressions matched against the event class
+    name, like the string subscriptions of `msa.core.event_bus.EventBus.subscribe`. The websockets subscribed to each
+    event type are cached until a client connects, disconnects or changes its subscriptions."""
+
+    def __init__(self):
+        # websockets by client id
+        self.clients = {}
+        # compiled patterns by client id, for clients that subscribed to event type patterns
+        self.patterns = {}
+        # websockets by event type
+        self._subscribers = {}
+
+    def connect(self, client_id, ws):
+        self.clients[client_id] = ws
+        self._subscribers = {}
+
+    def disconnect(self, client_id):
+        self.clients.pop(client_id, None)
+        self.patterns.pop(client_id, None)
+        self._subscribers = {}
+
+    def subscribe(self, client_id, patterns):
+        """Limits the untargeted events sent to a client to those whose type matches one of the patterns. Raises
+        `re.error` if a pattern is invalid, and `KeyError` if the client is not connected.
+
+        Parameters
+        ----------
+        client_id : str
+            The id of the client.
+        patterns : Optional[List[str]]
+            Regular expressions matched against event class names. `None` subscribes the client to every event."""
+        if client_id not in self.clients:
+            raise KeyError(client_id)
+
+        if patterns is None:
+            self.patterns.pop(client_id, None)
+        else:
+            self.patterns[client_id] = [re.compile(pattern) for pattern in patterns]
+        self._subscribers = {}
+
+    def get_recipients(self, event):
+        """Returns the websockets an event should be sent to."""
+        target = event.propagate_target
+        if target != "all":
+            ws = self.clients.get(target)
+            return () if ws is None else (ws,)
+
+        event_type = type(event)
+        try:
+            return self._subscribers[event_type]
+        except KeyError:
+            pass
+
+        name = event_type.__name__
+        subscribers = self._subscribers[event_type] = [
+            ws
+            for client_id, ws in self.clients.items()
+            if client_id not in self.patterns
+            or any(pattern.match(name) for pattern in self.patterns[client_id])
+        ]
+        return subscribers
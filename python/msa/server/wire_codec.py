@@ -0,0 +1,288 @@
+import json
+import struct
+
+from msa.core.event import Event
+from msa.core.event_registry import event_registry
+from msa.core.lazy_event import LazyEvent
+
+JSON_CONTENT_TYPE = "application/json"
+MSA_CONTENT_TYPE = "application/x-msa"
+
+# the version of the encoding, written as the first byte of every message
+VERSION = 2
+
+# stands in for an event in the json body of a message, mapped to the index of the event record
+EVENT_MARKER = "\u0000msa_event"
+
+# event flags
+_PROPAGATE = 1
+_NETWORK_PROPAGATE = 2
+
+# the length of a string in an event record that is None
+_NONE_LENGTH = 0xFFFF
+
+_VERSION = struct.Struct("<B")
+_LENGTH = struct.Struct("<I")
+# event type name length, generation time, priority, flags, propagate source, propagate target and correlation id
+# lengths, data length
+_EVENT_HEADER = struct.Struct("<HqiBHHHI")
+# the offset of the flags in an event record
+_FLAGS_OFFSET = 14
+
+_encode_json = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, check_circular=False
+).encode
+_decode_json = json.JSONDecoder().decode
+
+
+class WireCodecException(Exception):
+    pass
+
+
+def accepts_binary(accept_header):
+    """Returns `True` if an HTTP `Accept` header lists the binary content type."""
+    return accept_header is not None and MSA_CONTENT_TYPE in accept_header
+
+
+def encode(value) -> bytes:
+    """Encodes a value in the binary `application/x-msa` encoding, negotiated with clients as an alternative to json.
+
+    A message is a version byte, followed by the value as length prefixed compact json, followed by a binary record
+    for each `msa.core.event.Event` instance found in the value. In the json, events are replaced by a marker object
+    holding the index of their record. A record is a struct carrying the generation time as integer microseconds, the
+    priority and the propagation flags, followed by the fully qualified name of the event type, the propagation
+    source, target and correlation id as length prefixed strings, and by the data of the event as json, which can be
+    decoded lazily. Naming the event type lets a receiver that does not load the event class, such as a client
+    without the plugin defining it, still route and forward the event. `msa.core.lazy_event.LazyEvent` instances
+    received in binary are forwarded as the record they were received as.
+
+    Raises
+    ------
+    WireCodecException
+        If the value cannot be carried as json, for example if event data holds events."""
+    events = []
+
+    def encode_event(event):
+        if not isinstance(event, (Event, LazyEvent)):
+            raise TypeError(
+                f"Object of type {type(event).__name__} is not JSON serializable"
+            )
+        events.append(event)
+        return {EVENT_MARKER: len(events) - 1}
+
+    try:
+        body = json.dumps(
+            value,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            check_circular=False,
+            default=encode_event,
+        ).encode("utf-8")
+        out = bytearray(_VERSION.pack(VERSION))
+        out += _LENGTH.pack(len(body))
+        out += body
+        for event in events:
+            if isinstance(event, LazyEvent):
+                _encode_lazy_event(event, out)
+            else:
+                _encode_event(event, out)
+    except (TypeError, ValueError, struct.error) as err:
+        raise WireCodecException(
+            f"Cannot encode value as {MSA_CONTENT_TYPE}: {err}"
+        ) from err
+
+    return bytes(out)
+
+
+def encode_json(value) -> str:
+    """Encodes a value as json, the counterpart of `encode` for clients that did not negotiate the binary encoding.
+    `msa.core.event.Event` and `msa.core.lazy_event.LazyEvent` instances are carried as their metadata, see
+    `Event.get_metadata`. Raises `TypeError` if the value cannot be carried as json."""
+    return json.dumps(value, default=_event_metadata)
+
+
+def decode(data: bytes, lazy: bool = False):
+    """Decodes a value encoded by `encode`. Events are decoded into their metadata, see `Event.get_metadata`, with an
+    integer generation time, which `Event.deserialize` accepts.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded value.
+    lazy : bool
+        Decode events into `msa.core.lazy_event.LazyEvent` instances instead, leaving their data encoded until it is
+        accessed.
+
+    Raises
+    ------
+    WireCodecException
+        If the data is not a valid encoded value."""
+    if not data or data[0] != VERSION:
+        raise WireCodecException(
+            f"Unsupported {MSA_CONTENT_TYPE} encoding version, expected {VERSION}."
+        )
+
+    try:
+        (length,) = _LENGTH.unpack_from(data, 1)
+        pos = 5 + length
+        if pos > len(data):
+            raise ValueError("truncated body")
+        body = bytes(data[5:pos]).decode("utf-8")
+
+        value = _decode_json(body)
+        if pos == len(data):
+            return value
+
+        events = []
+        while pos < len(data):
+            event, pos = _decode_event(data, pos, lazy)
+            events.append(event)
+
+        return _replace_markers(value, events)
+    except (IndexError, TypeError, ValueError, struct.error) as err:
+        raise WireCodecException(f"Malformed {MSA_CONTENT_TYPE} data: {err}") from err
+
+
+# the encoded fully qualified names of event types, by event type
+_type_names = {}
+
+
+def _event_metadata(value):
+    if not isinstance(value, (Event, LazyEvent)):
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+    return value.get_metadata()
+
+
+def _encode_event(event, out):
+    flags = (_PROPAGATE if event.propagate else 0) | (
+        _NETWORK_PROPAGATE if event._network_propagate else 0
+    )
+    type_name = _type_names.get(type(event))
+    if type_name is None:
+        type_name = _type_names[type(event)] = _encode_string(
+            event_registry.get_full_name(type(event))
+        )
+
+    strings = [
+        _encode_string(event.propagate_source),
+        _encode_string(event.propagate_target),
+        _encode_string(event.correlation_id),
+    ]
+    data = _encode_json(event.data).encode("utf-8")
+
+    out += _EVENT_HEADER.pack(
+        len(type_name),
+        event.generation_time,
+        event.priority,
+        flags,
+        *[_NONE_LENGTH if value is None else len(value) for value in strings],
+        len(data),
+    )
+    out += type_name
+    for value in strings:
+        if value is not None:
+            out += value
+    out += data
+
+
+def _encode_string(value):
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise TypeError(
+            f"Event metadata of type {type(value).__name__} is not a string"
+        )
+    encoded = value.encode("utf-8")
+    if len(encoded) >= _NONE_LENGTH:
+        raise ValueError(f"Event metadata of {len(encoded)} bytes is too long")
+    return encoded
+
+
+def _encode_lazy_event(event, out):
+    if event.raw is None:
+        _encode_event(event.get_event(), out)
+        return
+
+    # the network propagation flag is commonly cleared on events received from the network
+    flags = event.raw[_FLAGS_OFFSET]
+    if bool(flags & _NETWORK_PROPAGATE) == event._network_propagate:
+        out += event.raw
+    else:
+        out += event.raw[:_FLAGS_OFFSET]
+        out.append(flags ^ _NETWORK_PROPAGATE)
+        out += event.raw[_FLAGS_OFFSET + 1 :]
+
+
+def _decode_event(data, pos, lazy):
+    (
+        type_length,
+        generation_time,
+        priority,
+        flags,
+        source_length,
+        target_length,
+        correlation_length,
+        data_length,
+    ) = _EVENT_HEADER.unpack_from(data, pos)
+    start = pos
+    pos += _EVENT_HEADER.size
+
+    # the event class is only looked up once the event is deserialized, so that unknown event types can be decoded
+    event_type = bytes(data[pos : pos + type_length]).decode("utf-8")
+    pos += type_length
+
+    strings = []
+    for length in (source_length, target_length, correlation_length):
+        if length == _NONE_LENGTH:
+            strings.append(None)
+        else:
+            strings.append(bytes(data[pos : pos + length]).decode("utf-8"))
+            pos += length
+
+    end = pos + data_length
+    if end > len(data):
+        raise ValueError("truncated event record")
+
+    metadata = {
+        "event_type": event_type,
+        "generation_time": generation_time,
+        "priority": priority,
+        "propagate": bool(flags & _PROPAGATE),
+        "_network_propagate": bool(flags & _NETWORK_PROPAGATE),
+        "propagate_source": strings[0],
+        "propagate_target": strings[1],
+        "correlation_id": strings[2],
+    }
+
+    if lazy:
+        event = LazyEvent(
+            metadata,
+            raw_data=bytes(data[pos:end]),
+            decode_data=_decode_json_bytes,
+            raw=bytes(data[start:end]),
+        )
+        return event, end
+
+    metadata["event_data"] = _decode_json_bytes(data[pos:end])
+    return metadata, end
+
+
+def _decode_json_bytes(data):
+    return _decode_json(bytes(data).decode("utf-8"))
+
+
+def _replace_markers(value, events):
+    """Replaces the event markers in a decoded json value by the decoded events."""
+    if type(value) is dict:
+        if len(value) == 1 and EVENT_MARKER in value:
+            return events[value[EVENT_MARKER]]
+        for key, item in value.items():
+            if type(item) is dict or type(item) is list:
+                value[key] = _replace_markers(item, events)
+    elif type(value) is list:
+        for index, item in enumerate(value):
+            if type(item) is dict or type(item) is list:
+                value[index] = _replace_markers(item, events)
+    return value
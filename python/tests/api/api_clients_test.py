@@ -15,6 +15,8 @@ from msa.api.api_clients import (
     ApiResponse,
 )
 from msa.core.event import Event
+from msa.core.lazy_event import LazyEvent
+from msa.server import wire_codec
 from msa.server.server_response import ServerResponseJson, ServerResponseType
 
 
@@ -249,6 +251,47 @@ class RestClientTest(unittest.TestCase):
 
         run_aiohttp_client_test(self.get_application(), async_test_delete)
 
+    def test_binary_codec(self):
+        async def binary_test(request):
+            if request.content_type == wire_codec.MSA_CONTENT_TYPE:
+                payload = wire_codec.decode(await request.read())
+            else:
+                payload = await request.json()
+
+            data = {
+                "status": "success",
+                "text": request.content_type,
+                "payload": payload,
+            }
+            if wire_codec.accepts_binary(request.headers.get("Accept")):
+                return web.Response(
+                    body=wire_codec.encode(data),
+                    content_type=wire_codec.MSA_CONTENT_TYPE,
+                )
+            return web.json_response(data)
+
+        app = web.Application()
+        app.router.add_post("/binary", binary_test)
+
+        async def async_test_binary_codec(loop, client):
+            api_client = ApiRestClient(host="localhost", port=8080)
+            api_client.session = client
+            api_client.base_url = ""
+
+            payload = {"key": [1, 2.5, None]}
+
+            # the first request is sent as json, and the server answers with the binary codec
+            result = await api_client.post("/binary", payload=payload)
+            self.assertEqual(wire_codec.JSON_CONTENT_TYPE, result.text)
+            self.assertEqual(payload, result.json)
+            self.assertTrue(api_client.binary)
+
+            result = await api_client.post("/binary", payload=payload)
+            self.assertEqual(wire_codec.MSA_CONTENT_TYPE, result.text)
+            self.assertEqual(payload, result.json)
+
+        run_aiohttp_client_test(app, async_test_binary_codec)
+
 
 class WebsocketClientTest(unittest.TestCase):
     def get_application(self):
@@ -432,6 +475,245 @@ class WebsocketClientTest(unittest.TestCase):
 
         run_aiohttp_client_test(self.get_application(), async_test_delete)
 
+    @patch("aiohttp.ClientSession")
+    def test_binary_codec(self, session_client_factory_mock):
+        fake_event = NetworkPropDummyEvent().init({"prop_1": 1, "prop_2": "asdf"})
+        fake_event.network_propagate()
+
+        async def ws_handler(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+
+            codec = request.query.get("codec")
+            await ws.send_str(
+                json.dumps(
+                    {"type": "notify_id", "payload": {"id": "123", "codec": codec}}
+                )
+            )
+            await ws.send_bytes(
+                wire_codec.encode({"type": "event_propagate", "payload": fake_event})
+            )
+
+            async for msg in ws:
+                payload = wire_codec.decode(msg.data)
+                if payload.get("type", None) == "close":
+                    await ws.close()
+                    return ws
+
+                await ws.send_bytes(
+                    wire_codec.encode(
+                        {"type": "response", "payload": payload["payload"]}
+                    )
+                )
+
+        app = web.Application()
+        app.router.add_get("/ws", ws_handler)
+
+        results = []
+        propagated = []
+
+        async def interact():
+            try:
+                data = {"status": "success", "text": "is a payload"}
+                results.append(await self.api_client.post("/test", payload=data))
+            finally:
+                await self.api_client.ws.send_bytes(
+                    wire_codec.encode({"type": "close"})
+                )
+
+        async def propagate(queue):
+            propagated.append(await queue.get())
+
+        async def async_test_binary_codec(loop, client):
+            session_client_factory_mock.return_value = client
+
+            self.api_client = ApiWebsocketClient(
+                loop=loop,
+                interact=interact,
+                propagate=propagate,
+                host="localhost",
+                port=8080,
+            )
+            self.api_client.base_url = "/ws"
+            await self.api_client.connect()
+
+        run_aiohttp_client_test(app, async_test_binary_codec)
+
+        self.assertEqual(wire_codec.MSA_CONTENT_TYPE, self.api_client.codec)
+        self.assertEqual("is a payload", results[0].text)
+        # propagated events are decoded when used
+        self.assertIsInstance(propagated[0], LazyEvent)
+        self.assertFalse(propagated[0]._network_propagate)
+        self.assertEqual(fake_event.data, propagated[0].data)
+        self.assertEqual(
+            fake_event.generation_time, propagated[0].get_event().generation_time
+        )
+
+    @patch("aiohttp.ClientSession")
+    def test_binary_unknown_event_type(self, session_client_factory_mock):
+        fake_event = NetworkPropDummyEvent().init({"prop_1": 1, "prop_2": "asdf"})
+        fake_event.network_propagate()
+
+        async def ws_handler(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+
+            await ws.send_str(
+                json.dumps(
+                    {
+                        "type": "notify_id",
+                        "payload": {"id": "123", "codec": wire_codec.MSA_CONTENT_TYPE},
+                    }
+                )
+            )
+            # an event of a class only the server loads, and a message that cannot be decoded
+            with patch.dict(
+                wire_codec._type_names,
+                {NetworkPropDummyEvent: b"server_plugin.ServerEvent"},
+            ):
+                await ws.send_bytes(
+                    wire_codec.encode(
+                        {"type": "event_propagate", "payload": fake_event}
+                    )
+                )
+            await ws.send_bytes(b"\xff not a message")
+
+            async for msg in ws:
+                payload = wire_codec.decode(msg.data)
+                if payload.get("type", None) == "close":
+                    await ws.close()
+                    return ws
+
+                await ws.send_bytes(
+                    wire_codec.encode(
+                        {
+                            "type": "response",
+                            "id": payload["id"],
+                            "payload": payload["payload"],
+                        }
+                    )
+                )
+
+        app = web.Application()
+        app.router.add_get("/ws", ws_handler)
+
+        results = []
+        propagated = []
+
+        async def interact():
+            try:
+                propagated.append(
+                    await asyncio.wait_for(self.api_client.propagate_queue.get(), 5)
+                )
+                data = {"status": "success", "text": "still connected"}
+                results.append(await self.api_client.post("/test", payload=data))
+            finally:
+                await self.api_client.ws.send_bytes(
+                    wire_codec.encode({"type": "close"})
+                )
+
+        async def propagate(queue):
+            pass
+
+        async def async_test_binary_unknown_event_type(loop, client):
+            session_client_factory_mock.return_value = client
+
+            self.api_client = ApiWebsocketClient(
+                loop=loop,
+                interact=interact,
+                propagate=propagate,
+                host="localhost",
+                port=8080,
+            )
+            self.api_client.base_url = "/ws"
+            await self.api_client.connect()
+
+        run_aiohttp_client_test(app, async_test_binary_unknown_event_type)
+
+        self.assertEqual("server_plugin.ServerEvent", propagated[0].event_type)
+        self.assertEqual("still connected", results[0].text)
+
+    @patch("aiohttp.ClientSession")
+    def test_concurrent_requests(self, session_client_factory_mock):
+        async def ws_handler(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+
+            await ws.send_str(
+                json.dumps({"type": "notify_id", "payload": {"id": "123"}})
+            )
+
+            # answer both requests once both were received, in reverse order
+            requests = []
+            async for msg in ws:
+                payload = json.loads(msg.data)
+                if payload.get("type", None) == "close":
+                    await ws.close()
+                    return ws
+
+                requests.append(payload)
+                if len(requests) == 2:
+                    for payload in reversed(requests):
+                        await ws.send_str(
+                            json.dumps(
+                                {
+                                    "type": "response",
+                                    "id": payload["id"],
+                                    "payload": payload["payload"],
+                                }
+                            )
+                        )
+                    await ws.send_str(
+                        json.dumps(
+                            {
+                                "type": "error",
+                                "id": "unknown",
+                                "message": "not waited for",
+                            }
+                        )
+                    )
+
+        app = web.Application()
+        app.router.add_get("/ws", ws_handler)
+
+        results = []
+
+        async def interact():
+            try:
+                results.extend(
+                    await asyncio.gather(
+                        self.api_client.post(
+                            "/first", {"status": "success", "text": "1"}
+                        ),
+                        self.api_client.post(
+                            "/second", {"status": "success", "text": "2"}
+                        ),
+                    )
+                )
+            finally:
+                await self.api_client.ws.send_json({"type": "close"})
+
+        async def propagate(queue):
+            pass
+
+        async def async_test_concurrent_requests(loop, client):
+            session_client_factory_mock.return_value = client
+
+            self.api_client = ApiWebsocketClient(
+                loop=loop,
+                interact=interact,
+                propagate=propagate,
+                host="localhost",
+                port=8080,
+            )
+            self.api_client.base_url = "/ws"
+            await self.api_client.connect()
+
+        run_aiohttp_client_test(app, async_test_concurrent_requests)
+
+        self.assertEqual(["1", "2"], [result.text for result in results])
+        self.assertEqual({}, self.api_client.pending_requests)
+
 
 class NetworkPropDummyEvent(Event):
     def __init__(self):
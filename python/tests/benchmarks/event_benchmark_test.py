@@ -0,0 +1,133 @@
+import datetime
+import os
+import time
+import tracemalloc
+import unittest
+
+from schema import And, Or, Schema
+
+from msa.builtins.conversation.events import ConversationInputEvent
+from msa.builtins.scripting.events import GetScriptEvent
+from msa.core.event import Event
+
+CONSTRUCTED_EVENTS = 20000
+
+GET_SCRIPT_DATA = {
+    "id": 1,
+    "name": "benchmark",
+    "crontab": "0 * * * *",
+    "created": "2020-01-01 00:00:00",
+    "last_edited": "2020-01-01 00:00:00",
+    "last_run": None,
+    "scheduled_for": None,
+    "script_contents": 'print("hello world")',
+    "running": False,
+}
+
+
+@unittest.skipUnless(
+    os.environ.get("MSA_BENCHMARK"), "set MSA_BENCHMARK=1 to run benchmarks"
+)
+class EventBenchmark(unittest.TestCase):
+    def construction_time(self, event_type):
+        start = time.perf_counter()
+        for _ in range(CONSTRUCTED_EVENTS):
+            event_type()
+        return (time.perf_counter() - start) / CONSTRUCTED_EVENTS
+
+    def allocated_bytes(self, event_type):
+        tracemalloc.start()
+        events = [event_type() for _ in range(CONSTRUCTED_EVENTS)]
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del events
+        return allocated / CONSTRUCTED_EVENTS
+
+    def compare(self, legacy_type, event_type):
+        legacy_time = self.construction_time(legacy_type)
+        event_time = self.construction_time(event_type)
+        legacy_bytes = self.allocated_bytes(legacy_type)
+        event_bytes = self.allocated_bytes(event_type)
+
+        print(
+            f"\n{event_type.__name__} construction: "
+            f"per event schema {legacy_time * 1e6:.2f}us {legacy_bytes:.0f} bytes, "
+            f"class schema with slots {event_time * 1e6:.2f}us {event_bytes:.0f} bytes"
+        )
+
+        self.assertLess(event_time, legacy_time)
+        self.assertLess(event_bytes, legacy_bytes)
+
+    def test_conversation_input_event(self):
+        self.compare(LegacyConversationInputEvent, ConversationInputEvent)
+
+        # validating the data still works the same way for both
+        LegacyConversationInputEvent().init({"input": "hello"})
+        ConversationInputEvent().init({"input": "hello"})
+
+    def test_get_script_event(self):
+        self.compare(LegacyGetScriptEvent, GetScriptEvent)
+
+        LegacyGetScriptEvent().init(GET_SCRIPT_DATA)
+        GetScriptEvent().init(GET_SCRIPT_DATA)
+
+    def test_get_script_validation(self):
+        """Compares validating `GetScriptEvent` data with the schema library and with the compiled validator."""
+        legacy_event = LegacyGetScriptEvent()
+        event = GetScriptEvent()
+
+        start = time.perf_counter()
+        for _ in range(CONSTRUCTED_EVENTS):
+            legacy_event.validate(GET_SCRIPT_DATA)
+        legacy_time = (time.perf_counter() - start) / CONSTRUCTED_EVENTS
+
+        start = time.perf_counter()
+        for _ in range(CONSTRUCTED_EVENTS):
+            event.validate(GET_SCRIPT_DATA)
+        event_time = (time.perf_counter() - start) / CONSTRUCTED_EVENTS
+
+        print(
+            f"\nGetScriptEvent validation: schema library {legacy_time * 1e6:.2f}us, "
+            f"compiled {event_time * 1e6:.2f}us"
+        )
+
+        self.assertEqual(
+            legacy_event.validate(GET_SCRIPT_DATA), event.validate(GET_SCRIPT_DATA)
+        )
+        self.assertLess(event_time, legacy_time)
+
+
+class LegacyConversationInputEvent(Event):
+    """`ConversationInputEvent` as it was built before schemas were declared on the class: a schema per event, an
+    instance `__dict__`, and a `datetime` generation time."""
+
+    def __init__(self):
+        super().__init__(priority=50, schema=Schema({"input": And(str, len)}))
+        self.generation_time = datetime.datetime.now()
+
+
+class LegacyGetScriptEvent(Event):
+    """`GetScriptEvent` as it was built before schemas were declared on the class."""
+
+    def __init__(self):
+        super().__init__(
+            priority=50,
+            schema=Schema(
+                {
+                    "id": int,
+                    "name": And(str, len),
+                    "crontab": Or(And(str, len), None),
+                    "created": And(str, len),
+                    "last_edited": And(str, len),
+                    "last_run": Or(And(str, len), None),
+                    "scheduled_for": Or(And(str, len), None),
+                    "script_contents": And(str, len),
+                    "running": bool,
+                }
+            ),
+        )
+        self.generation_time = datetime.datetime.now()
+
+
+if __name__ == "__main__":
+    unittest.main()
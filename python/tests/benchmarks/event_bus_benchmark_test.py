@@ -0,0 +1,78 @@
+import asyncio
+import os
+import time
+import unittest
+
+from msa.core.event import Event
+from msa.core.event_bus import EventBus
+
+DISPATCHED_EVENTS = 20000
+
+
+@unittest.skipUnless(
+    os.environ.get("MSA_BENCHMARK"), "set MSA_BENCHMARK=1 to run benchmarks"
+)
+class EventBusBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def events_per_second(self, callbacks):
+        event_bus = EventBus(self.loop)
+        for callback in callbacks:
+            event_bus.subscribe(BenchmarkEvent, callback)
+
+        async def main():
+            await event_bus.fire_events(
+                BenchmarkEvent() for _ in range(DISPATCHED_EVENTS)
+            )
+            start = time.perf_counter()
+            await event_bus.listen(timeout=0.01)
+            # the final listen timeout is not dispatch time
+            return time.perf_counter() - start - 0.01
+
+        elapsed = self.loop.run_until_complete(main())
+        return DISPATCHED_EVENTS / elapsed
+
+    def test_sync_subscribers(self):
+        """Compares dispatch throughput with trivial subscribers written as coroutine functions, and with the same
+        subscribers written as plain functions that the bus calls inline."""
+        async_buffer = []
+        sync_buffer = []
+
+        async def async_append(event):
+            async_buffer.append(event)
+
+        async def async_ignore(event):
+            pass
+
+        def sync_append(event):
+            sync_buffer.append(event)
+
+        def sync_ignore(event):
+            pass
+
+        coroutines = self.events_per_second([async_append, async_ignore])
+        plain = self.events_per_second([sync_append, sync_ignore])
+
+        print(
+            f"\n{DISPATCHED_EVENTS} events dispatched to two subscribers: "
+            f"coroutine subscribers {coroutines:.0f} events/s, "
+            f"plain subscribers {plain:.0f} events/s, "
+            f"speedup {plain / coroutines:.1f}x"
+        )
+
+        self.assertEqual(DISPATCHED_EVENTS, len(async_buffer))
+        self.assertEqual(DISPATCHED_EVENTS, len(sync_buffer))
+        self.assertGreater(plain, coroutines)
+
+
+class BenchmarkEvent(Event):
+    def __init__(self):
+        super().__init__(priority=0, schema={})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import time
+import unittest
+
+from msa.builtins.scripting.events import GetScriptEvent
+from msa.server.event_propagate import EventPropagationRouter
+from msa.server.websocket_subscriptions import WebsocketSubscriptions
+from tests.benchmarks.wire_codec_benchmark_test import GET_SCRIPT_DATA
+
+CLIENT_COUNTS = (10, 100, 1000)
+# the time each client takes to receive a message
+SEND_LATENCY = 0.001
+EVENTS = 20
+
+
+class SlowWebsocket:
+    closed = False
+
+    async def send_str(self, data):
+        await asyncio.sleep(SEND_LATENCY)
+
+    async def send_bytes(self, data):
+        await asyncio.sleep(SEND_LATENCY)
+
+
+@unittest.skipUnless(
+    os.environ.get("MSA_BENCHMARK"), "set MSA_BENCHMARK=1 to run benchmarks"
+)
+class EventPropagateBenchmark(unittest.TestCase):
+    def fan_out_time(self, client_count):
+        loop = asyncio.get_event_loop()
+        router = EventPropagationRouter()
+        clients = [SlowWebsocket() for _ in range(client_count)]
+        subscriptions = WebsocketSubscriptions()
+        for index, ws in enumerate(clients):
+            subscriptions.connect(str(index), ws)
+        loop.run_until_complete(
+            router.app_start(
+                {
+                    "websockets": clients,
+                    "binary_websockets": set(clients[::2]),
+                    "websocket_subscriptions": subscriptions,
+                }
+            )
+        )
+        event = GetScriptEvent().init(GET_SCRIPT_DATA).network_propagate()
+
+        async def fan_out():
+            start = time.perf_counter()
+            for _ in range(EVENTS):
+                await router.handle_event_propagate(event)
+            return (time.perf_counter() - start) / EVENTS
+
+        # the first event creates the senders of the clients
+        loop.run_until_complete(fan_out())
+        fan_out_time = loop.run_until_complete(fan_out())
+        loop.run_until_complete(router.app_stop(None))
+        return fan_out_time
+
+    def test_fan_out(self):
+        """Measures the time the event bus spends propagating an event to clients that take 1ms to receive it, which
+        used to be at least 1ms per client as sends were awaited one after the other."""
+        times = {count: self.fan_out_time(count) for count in CLIENT_COUNTS}
+
+        print(
+            "\nPropagating a GetScriptEvent: "
+            + ", ".join(
+                f"{count} clients {fan_out_time * 1e6:.2f}us"
+                for count, fan_out_time in times.items()
+            )
+        )
+
+        for count, fan_out_time in times.items():
+            self.assertLess(fan_out_time, SEND_LATENCY * count / 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import asyncio
+import itertools
+import os
+import time
+import unittest
+
+from msa.core.event import Event
+from msa.core.event_queue import EventQueue, OverflowPolicy, PriorityLane
+
+QUEUED_EVENTS = 100000
+
+
+@unittest.skipUnless(
+    os.environ.get("MSA_BENCHMARK"), "set MSA_BENCHMARK=1 to run benchmarks"
+)
+class EventQueueBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        # a handful of priority levels, so most comparisons are ties
+        self.events = [
+            BenchmarkEvent(priority=(i % 4) * 10) for i in range(QUEUED_EVENTS)
+        ]
+
+    def tearDown(self):
+        self.loop.close()
+
+    def time_queue(self, make_queue):
+        """Returns the best time, over a few runs, to queue every event with `EventQueue.put_event_nowait` and then
+        dequeue the events left in the queue, per event queued."""
+        times = []
+        for _ in range(3):
+            queue = make_queue()
+            start = time.perf_counter()
+            for event in self.events:
+                queue.put_event_nowait((event.priority, event))
+            while not queue.empty():
+                queue.get_nowait()
+            times.append(time.perf_counter() - start)
+        return min(times) / QUEUED_EVENTS
+
+    def test_put_get(self):
+        """Reports the cost of queueing and dequeueing an event through the lanes of `EventQueue`, with a single lane,
+        with the default lanes, and with a bounded queue evicting an event for every event queued once it is full."""
+        single_lane = self.time_queue(
+            lambda: EventQueue(lanes=[PriorityLane("all")], loop=self.loop)
+        )
+        default_lanes = self.time_queue(lambda: EventQueue(loop=self.loop))
+        drop_oldest = self.time_queue(
+            lambda: EventQueue(
+                QUEUED_EVENTS // 10, OverflowPolicy.drop_oldest, loop=self.loop
+            )
+        )
+
+        print(
+            f"\n{QUEUED_EVENTS} events put + get per event: "
+            f"single lane {single_lane * 1e6:.2f}us, "
+            f"default lanes {default_lanes * 1e6:.2f}us, "
+            f"drop_oldest with {QUEUED_EVENTS // 10} queued {drop_oldest * 1e6:.2f}us"
+        )
+
+    def dequeues_until_served(self, queue):
+        """Queues a single low priority event behind a backlog of high priority events, and counts the dequeues until
+        it is served."""
+        low = BenchmarkEvent(priority=100)
+        for event in self.events[:10000]:
+            queue.put_nowait((0, event))
+        queue.put_nowait((low.priority, low))
+
+        for dequeues in itertools.count(1):
+            _, event = queue.get_nowait()
+            if event is low:
+                return dequeues
+
+    def test_starvation(self):
+        """Compares the worst case wait of a low priority event behind a stream of high priority events, with a single
+        lane and with the default lanes."""
+        single_lane = self.dequeues_until_served(
+            EventQueue(lanes=[PriorityLane("all")], loop=self.loop)
+        )
+        default_lanes = self.dequeues_until_served(EventQueue(loop=self.loop))
+
+        print(
+            f"\nlow priority event served after {single_lane} dequeues with a single lane, "
+            f"{default_lanes} dequeues with the default lanes"
+        )
+
+        self.assertLess(default_lanes, single_lane)
+
+
+class BenchmarkEvent(Event):
+    def __init__(self, priority):
+        super().__init__(priority=priority, schema={})
+
+
+if __name__ == "__main__":
+    unittest.main()
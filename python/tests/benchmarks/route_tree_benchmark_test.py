@@ -0,0 +1,50 @@
+import os
+import timeit
+import unittest
+
+from msa.server.route_tree import RouteTree
+from msa.server.url_param_parser import UrlParamParser
+
+ROUTE_COUNT = 500
+LOOKUPS = 20000
+
+
+@unittest.skipUnless(
+    os.environ.get("MSA_BENCHMARK"), "set MSA_BENCHMARK=1 to run benchmarks"
+)
+class RouteTreeBenchmark(unittest.TestCase):
+    def lookup_time(self, lookup):
+        return min(timeit.repeat(lookup, number=LOOKUPS // 5, repeat=5)) * 5 / LOOKUPS
+
+    def test_resolve(self):
+        """Compares resolving the last of 500 registered routes with the route tree and by matching the routes one by
+        one, as the route adapter used to."""
+        routes = [f"/resource{index}/{{name}}/action" for index in range(ROUTE_COUNT)]
+        tree = RouteTree()
+        for route in routes:
+            tree.add(route, route)
+        matchers = [UrlParamParser(route) for route in routes]
+        path = f"/resource{ROUTE_COUNT - 1}/hello/action"
+
+        def linear():
+            for matcher in matchers:
+                if matcher.match(path):
+                    return matcher.route, matcher.resolve_params(path)
+
+        def tree_lookup():
+            return tree.resolve(path)
+
+        linear_time = self.lookup_time(linear)
+        tree_time = self.lookup_time(tree_lookup)
+
+        print(
+            f"\nResolving a path among {ROUTE_COUNT} routes: "
+            f"linear {linear_time * 1e6:.2f}us, route tree {tree_time * 1e6:.2f}us"
+        )
+
+        self.assertEqual(linear(), tree_lookup())
+        self.assertLess(tree_time, linear_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
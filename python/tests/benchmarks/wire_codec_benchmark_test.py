@@ -0,0 +1,128 @@
+import json
+import os
+import timeit
+import unittest
+
+from msa.builtins.scripting.events import GetScriptEvent
+from msa.core.event import Event
+from msa.server import wire_codec
+
+ROUND_TRIPS = 20000
+
+GET_SCRIPT_DATA = {
+    "id": 1,
+    "name": "benchmark",
+    "crontab": "0 * * * *",
+    "created": "2020-01-01 00:00:00",
+    "last_edited": "2020-01-01 00:00:00",
+    "last_run": None,
+    "scheduled_for": None,
+    "script_contents": 'print("hello world")',
+    "running": False,
+}
+
+
+@unittest.skipUnless(
+    os.environ.get("MSA_BENCHMARK"), "set MSA_BENCHMARK=1 to run benchmarks"
+)
+class WireCodecBenchmark(unittest.TestCase):
+    def round_trip_time(self, round_trip):
+        # the best of a few runs, as the difference measured is small enough to drown in scheduling noise
+        return (
+            min(timeit.repeat(round_trip, number=ROUND_TRIPS // 5, repeat=5))
+            * 5
+            / ROUND_TRIPS
+        )
+
+    def test_event_propagation(self):
+        """Compares propagating an event to a client and deserializing it there, as a json message and as a binary
+        message."""
+        event = GetScriptEvent().init(GET_SCRIPT_DATA).network_propagate().correlate()
+
+        def json_round_trip():
+            message = json.dumps(
+                {"type": "event_propagate", "payload": event.get_metadata()}
+            )
+            return Event.deserialize(json.loads(message)["payload"])
+
+        def binary_round_trip():
+            message = wire_codec.encode({"type": "event_propagate", "payload": event})
+            return Event.deserialize(wire_codec.decode(message)["payload"])
+
+        json_time = self.round_trip_time(json_round_trip)
+        binary_time = self.round_trip_time(binary_round_trip)
+        json_bytes = len(
+            json.dumps(
+                {"type": "event_propagate", "payload": event.get_metadata()}
+            ).encode("utf-8")
+        )
+        binary_bytes = len(
+            wire_codec.encode({"type": "event_propagate", "payload": event})
+        )
+
+        print(
+            f"\nGetScriptEvent propagation round trip: "
+            f"json {json_time * 1e6:.2f}us {json_bytes} bytes, "
+            f"binary {binary_time * 1e6:.2f}us {binary_bytes} bytes"
+        )
+
+        self.assertEqual(json_round_trip(), binary_round_trip())
+        self.assertLess(binary_time, json_time)
+        self.assertLess(binary_bytes, json_bytes)
+
+    def test_pass_through(self):
+        """Compares routing propagated events on their target, for events targeted at other clients, decoding them
+        fully and decoding them lazily."""
+        event = GetScriptEvent().init(GET_SCRIPT_DATA).network_propagate()
+        event.target("other client")
+        message = wire_codec.encode({"type": "event_propagate", "payload": event})
+
+        def eager():
+            metadata = wire_codec.decode(message)["payload"]
+            return Event.deserialize(metadata).propagate_target == "client"
+
+        def lazy():
+            lazy_event = wire_codec.decode(message, lazy=True)["payload"]
+            return lazy_event.propagate_target == "client"
+
+        eager_time = self.round_trip_time(eager)
+        lazy_time = self.round_trip_time(lazy)
+
+        print(
+            f"\nRouting a propagated GetScriptEvent: "
+            f"decoded {eager_time * 1e6:.2f}us, lazily decoded {lazy_time * 1e6:.2f}us"
+        )
+
+        self.assertEqual(eager(), lazy())
+        self.assertLess(lazy_time, eager_time)
+
+    def test_api_response(self):
+        """Compares encoding and decoding an api response without events, which the binary codec carries as compact
+        json, for reference."""
+        response = {
+            "type": "response",
+            "payload": {
+                "status": "success",
+                "payload": {"scripts": [GET_SCRIPT_DATA] * 10},
+            },
+        }
+
+        json_time = self.round_trip_time(lambda: json.loads(json.dumps(response)))
+        binary_time = self.round_trip_time(
+            lambda: wire_codec.decode(wire_codec.encode(response))
+        )
+        json_bytes = len(json.dumps(response).encode("utf-8"))
+        binary_bytes = len(wire_codec.encode(response))
+
+        print(
+            f"\nApi response round trip: "
+            f"json {json_time * 1e6:.2f}us {json_bytes} bytes, "
+            f"binary {binary_time * 1e6:.2f}us {binary_bytes} bytes"
+        )
+
+        self.assertEqual(response, wire_codec.decode(wire_codec.encode(response)))
+        self.assertLess(binary_bytes, json_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,24 +9,21 @@ from schema import Schema
 
 
 class MyEvent(Event):
+    __module__ = "my_module"
+
     def __init__(self):
         super().__init__(priority=50, schema=Schema({"prop_1": 1, "prop_2": "2"}))
 
 
 class IntentToEventHandlerTest(unittest.TestCase):
     @patch("msa.core.supervisor_instance")
-    @patch("msa.builtins.intents.handlers.Event.__subclasses__")
-    def test_converting_intent_to_event(self, Event_subclass_mock, SupervisorMock):
+    def test_converting_intent_to_event(self, SupervisorMock):
 
         loop = asyncio.get_event_loop()
         event_bus_mock = MagicMock()
         logger_mock = MagicMock()
         handler = IntentToEventHandler(loop, event_bus_mock, logger_mock)
 
-        MyEvent.__module__ = "my_module"
-
-        Event_subclass_mock.return_value = [MyEvent]
-
         incoming_event = IntentEvent().init(
             {"type": "my_module.MyEvent", "context": {"prop_1": 1, "prop_2": "2"}}
         )
@@ -42,18 +39,13 @@ class IntentToEventHandlerTest(unittest.TestCase):
         self.assertEqual("2", fired_event.data["prop_2"])
 
     @patch("msa.core.supervisor_instance")
-    @patch("msa.builtins.intents.handlers.Event.__subclasses__")
-    def test_class_not_found(self, Event_subclass_mock, SupervisorMock):
+    def test_class_not_found(self, SupervisorMock):
 
         loop = asyncio.get_event_loop()
         event_bus_mock = MagicMock()
         logger_mock = MagicMock()
         handler = IntentToEventHandler(loop, event_bus_mock, logger_mock)
 
-        MyEvent.__module__ = "my_module"
-
-        Event_subclass_mock.return_value = [MyEvent]
-
         incoming_event = IntentEvent().init(
             {"type": "my_module.MyOther", "context": {"prop_1": 1, "prop_2": "2"}}
         )
@@ -67,20 +59,13 @@ class IntentToEventHandlerTest(unittest.TestCase):
         )
 
     @patch("msa.core.supervisor_instance")
-    @patch("msa.builtins.intents.handlers.Event.__subclasses__")
-    def test_converted_event_fails_to_validate(
-        self, Event_subclass_mock, SupervisorMock
-    ):
+    def test_converted_event_fails_to_validate(self, SupervisorMock):
 
         loop = asyncio.get_event_loop()
         event_bus_mock = MagicMock()
         logger_mock = MagicMock()
         handler = IntentToEventHandler(loop, event_bus_mock, logger_mock)
 
-        MyEvent.__module__ = "my_module"
-
-        Event_subclass_mock.return_value = [MyEvent]
-
         incoming_event = IntentEvent().init(
             {"type": "my_module.MyEvent", "context": {"prop_1": 1, "prop_2": 2}}
         )
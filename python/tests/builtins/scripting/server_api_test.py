@@ -0,0 +1,58 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from msa.builtins.scripting import server_api
+from msa.builtins.scripting.events import TriggerGetScriptEvent
+from msa.core.event import Event
+from msa.core.event_bus import EventBus
+from msa.core.event_queue import OverflowPolicy
+from msa.core.supervisor import Supervisor
+from msa.server.server_request import SeverRequest
+from msa.server.server_response import ServerResponseType
+from tests.async_test_util import async_run
+
+
+class ServerApiTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.supervisor = Supervisor()
+        self.supervisor.loop = self.loop
+        self.supervisor.logger = mock.MagicMock()
+        self.supervisor.event_bus = EventBus(
+            self.loop, max_queue_size=1, overflow_policy=OverflowPolicy.reject
+        )
+        # stands in for the scripting handler
+        self.supervisor.event_bus.subscribe(Event, lambda event: None)
+
+        supervisor_patch = mock.patch(
+            "msa.builtins.scripting.server_api.get_supervisor",
+            return_value=self.supervisor,
+        )
+        supervisor_patch.start()
+        self.addCleanup(supervisor_patch.stop)
+
+    def tearDown(self):
+        self.supervisor.executor.shutdown()
+        self.loop.close()
+
+    def test_request_rejected_when_queue_full(self):
+        async def main():
+            assert await self.supervisor.fire_event(
+                TriggerGetScriptEvent().init({"name": "script"})
+            )
+            return await server_api.list_scripts(
+                SeverRequest("rest", "get", "/scripting/script", None, {})
+            )
+
+        response = async_run(self.loop, main())
+
+        self.assertEqual(
+            ServerResponseType.failure.value, response.get_data()["status"]
+        )
+        self.assertIn("full", response.get_data()["text"])
+        self.assertEqual(1, self.supervisor.event_bus.queue.counters["rejected"])
+
+
+if __name__ == "__main__":
+    unittest.main()
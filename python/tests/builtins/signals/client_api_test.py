@@ -0,0 +1,99 @@
+import json
+import unittest
+from unittest.mock import MagicMock, AsyncMock, patch
+
+from schema import Schema
+
+from msa.api.api_clients import ApiResponse
+from msa.builtins.signals import client_api, server_api
+from msa.builtins.signals.events import DisburseEventsToNetworkEvent
+from msa.core.event import Event
+from msa.server import wire_codec
+from msa.server.server_request import SeverRequest
+from msa.utils.asyncio_utils import run_async
+
+
+class ClientApiTest(unittest.TestCase):
+    def setUp(self):
+        supervisor_patch = patch("msa.builtins.signals.server_api.get_supervisor")
+        self.supervisor = supervisor_patch.start().return_value
+        self.addCleanup(supervisor_patch.stop)
+
+    def serve(self, route, verb, payload=None, query=None, binary=True):
+        """Runs a route like the route adapter does, carrying the request and the response in the binary encoding
+        or as json."""
+        if binary:
+            codec_encode, codec_decode = wire_codec.encode, wire_codec.decode
+        else:
+            codec_encode, codec_decode = wire_codec.encode_json, json.loads
+
+        if payload is not None:
+            payload = codec_decode(codec_encode(payload))
+        response = run_async(route(SeverRequest("rest", verb, "", payload, {}, query)))
+        return ApiResponse(codec_decode(codec_encode(response.get_data())))
+
+    def test_get_events(self):
+        events = [NetworkEvent().init({"value": value}) for value in (1, 2)]
+        reply = DisburseEventsToNetworkEvent().init(
+            {"events": events, "seq": 2, "missed": False}
+        )
+        self.supervisor.request = AsyncMock(return_value=reply)
+
+        for binary in (True, False):
+            with self.subTest(binary=binary):
+                slf = MagicMock()
+                slf.get.return_value = 0
+                slf.client.get = AsyncMock(
+                    return_value=self.serve(
+                        server_api.get_events,
+                        "get",
+                        query={"after": "0"},
+                        binary=binary,
+                    )
+                )
+
+                received = run_async(client_api.get_events(slf))
+
+                slf.client.get.assert_called_once_with("/signals/events?after=0")
+                self.assertEqual(events, received)
+                self.assertEqual(
+                    [event.generation_time for event in events],
+                    [event.generation_time for event in received],
+                )
+                self.assertEqual(2, slf.signals_seq)
+
+    def test_trigger_event(self):
+        event = NetworkEvent().init({"value": 1}).network_propagate()
+        self.supervisor.fire_event = AsyncMock()
+
+        for binary in (True, False):
+            with self.subTest(binary=binary):
+                slf = MagicMock()
+                slf.client.post = AsyncMock(return_value=None)
+                run_async(client_api.trigger_event(slf, event))
+
+                # the client posts the event itself, left to the codec to encode
+                slf.client.post.assert_called_once_with(
+                    "/signals/trigger_event", payload=event
+                )
+                response = self.serve(
+                    server_api.trigger_event, "post", payload=event, binary=binary
+                )
+
+                self.assertEqual("success", response.status)
+                fired = self.supervisor.fire_event.call_args[0][0]
+                self.assertEqual(event, fired)
+                self.assertEqual(event.generation_time, fired.generation_time)
+                self.assertTrue(fired._network_propagate)
+
+
+class NetworkEvent(Event):
+    __slots__ = ()
+    schema = Schema({"value": int})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
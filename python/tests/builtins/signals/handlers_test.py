@@ -0,0 +1,129 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from schema import Schema
+
+from msa.builtins.signals.events import (
+    DisburseEventsToNetworkEvent,
+    RequestDisburseEventsToNetworkEvent,
+)
+from msa.builtins.signals.handlers import NetworkPropagateEventHandler
+from msa.core.event import Event
+
+
+class NetworkPropagateEventHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.get_event_loop()
+        self.replies = []
+
+        supervisor_patch = patch("msa.builtins.signals.handlers.get_supervisor")
+        get_supervisor_mock = supervisor_patch.start()
+        get_supervisor_mock.return_value.fire_event = self.replies.append
+        self.addCleanup(supervisor_patch.stop)
+
+    def make_handler(self, config=None):
+        return NetworkPropagateEventHandler(self.loop, MagicMock(), MagicMock(), config)
+
+    def propagate(self, handler, *values):
+        for value in values:
+            handler.handle(NetworkEvent().init({"value": value}).network_propagate())
+        # not propagated to the network, so not buffered
+        handler.handle(NetworkEvent().init({"value": -1}))
+
+    def poll(self, handler, after=None):
+        data = {} if after is None else {"after": after}
+        request = RequestDisburseEventsToNetworkEvent().init(data).correlate()
+        handler.handle(request)
+        return request
+
+    def reply_values(self, reply):
+        return [event.data["value"] for event in reply.data["events"]]
+
+    def test_poll_answered_with_newer_events(self):
+        handler = self.make_handler()
+        self.propagate(handler, 1, 2, 3)
+
+        request = self.poll(handler, after=1)
+
+        (reply,) = self.replies
+        self.assertIsInstance(reply, DisburseEventsToNetworkEvent)
+        self.assertEqual(request.correlation_id, reply.correlation_id)
+        self.assertEqual([2, 3], self.reply_values(reply))
+        self.assertEqual(3, reply.data["seq"])
+        self.assertFalse(reply.data["missed"])
+
+        # polling again does not lose events for other clients
+        self.poll(handler)
+        self.assertEqual([1, 2, 3], self.reply_values(self.replies[1]))
+
+    def test_poll_waits_for_next_event(self):
+        handler = self.make_handler()
+        self.propagate(handler, 1)
+
+        self.poll(handler, after=1)
+        self.poll(handler, after=1)
+        self.assertEqual([], self.replies)
+
+        self.propagate(handler, 2)
+        self.assertEqual(2, len(self.replies))
+        for reply in self.replies:
+            self.assertEqual([2], self.reply_values(reply))
+            self.assertEqual(2, reply.data["seq"])
+        self.assertEqual([], handler.waiting_polls)
+
+    def test_poll_timeout(self):
+        handler = self.make_handler({"poll_timeout": 0.01})
+
+        self.poll(handler)
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+
+        (reply,) = self.replies
+        self.assertEqual([], reply.data["events"])
+        self.assertEqual(0, reply.data["seq"])
+        self.assertEqual([], handler.waiting_polls)
+
+    def test_poll_missed_events(self):
+        handler = self.make_handler({"buffer_size": 2})
+        self.propagate(handler, 1, 2, 3)
+
+        self.poll(handler, after=0)
+        self.poll(handler, after=1)
+        # a sequence number handed out before a restart
+        self.poll(handler, after=10)
+
+        self.assertEqual(
+            [([2, 3], True), ([2, 3], False), ([2, 3], True)],
+            [
+                (self.reply_values(reply), reply.data["missed"])
+                for reply in self.replies
+            ],
+        )
+
+    def test_reply_metadata(self):
+        handler = self.make_handler()
+        self.propagate(handler, 1)
+        self.poll(handler)
+
+        (reply,) = self.replies
+        metadata = json.loads(json.dumps(reply.get_metadata()))
+        self.assertEqual(
+            [reply.data["events"][0].get_metadata()], metadata["event_data"]["events"]
+        )
+
+        # as replayed from the journal
+        replayed = Event.deserialize(metadata)
+        self.assertEqual(metadata["event_data"], replayed.data)
+
+
+class NetworkEvent(Event):
+    __slots__ = ()
+    schema = Schema({"value": int})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
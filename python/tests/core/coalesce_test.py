@@ -0,0 +1,84 @@
+import time
+import unittest
+
+from schema import Schema
+
+from msa.core.coalesce import CoalesceIndex, COALESCE_REPLY_TIMEOUT
+from msa.core.event import Event
+
+
+class CoalesceIndexTest(unittest.TestCase):
+    def test_not_coalescable(self):
+        index = CoalesceIndex()
+
+        self.assertIsNone(index.merge(PlainEvent()))
+        self.assertIsNone(index.merge(PlainEvent()))
+        self.assertEqual({}, index.by_key)
+
+    def test_merge_adopts_correlation_id(self):
+        index = CoalesceIndex()
+        primary = FakeEvent().init({"key": 1})
+        duplicate = FakeEvent().init({"key": 1}).correlate()
+
+        self.assertIsNone(index.merge(primary))
+        record = index.merge(duplicate)
+
+        self.assertIs(primary, record.event)
+        self.assertEqual(duplicate.correlation_id, primary.correlation_id)
+        self.assertEqual([], record.aliases)
+
+    def test_replied(self):
+        index = CoalesceIndex()
+        primary = FakeEvent().init({"key": 1}).correlate()
+        duplicate = FakeEvent().init({"key": 1}).correlate()
+        index.merge(primary)
+        index.merge(duplicate)
+
+        reply = FakeEvent().init({"key": 2}).reply_to(primary)
+
+        self.assertEqual((), index.replied(primary))
+        self.assertEqual([duplicate.correlation_id], index.replied(reply))
+
+    def test_sweep(self):
+        index = CoalesceIndex()
+        unanswered = FakeEvent().init({"key": 1}).correlate()
+        answered = FakeEvent().init({"key": 2}).correlate()
+        index.merge(unanswered)
+        index.merge(answered)
+        index.dispatched(unanswered)
+        index.dispatched(answered)
+        index.replied(FakeEvent().init({"key": 3}).reply_to(answered))
+
+        index.sweep(time.monotonic() + FakeEvent.coalesce_window + 1)
+
+        self.assertEqual({}, index.by_key)
+        # an unanswered event keeps forwarding late replies for a while
+        self.assertEqual([unanswered.correlation_id], list(index.by_correlation))
+
+        index.sweep(
+            time.monotonic() + FakeEvent.coalesce_window + COALESCE_REPLY_TIMEOUT + 1
+        )
+
+        self.assertEqual({}, index.by_correlation)
+
+    def test_discard(self):
+        index = CoalesceIndex()
+        event = FakeEvent().init({"key": 1}).correlate()
+        index.merge(event)
+
+        index.discard(event)
+
+        self.assertEqual({}, index.by_key)
+        self.assertEqual({}, index.by_correlation)
+
+
+class FakeEvent(Event):
+    coalesce_window = 1
+
+    def __init__(self):
+        super().__init__(priority=0, schema=Schema({"key": int}))
+
+
+class PlainEvent(Event):
+    def __init__(self):
+        super().__init__(priority=0, schema=Schema(None))
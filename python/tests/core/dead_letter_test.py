@@ -0,0 +1,89 @@
+import functools
+import unittest
+
+from schema import Schema
+
+from msa.core.dead_letter import DeadLetterReason, DeadLetterStore, RetryPolicy
+from msa.core.event import Event
+
+
+class DeadLetterStoreTest(unittest.TestCase):
+    def test_bounded(self):
+        store = DeadLetterStore(max_size=2)
+
+        events = [DeadLetterEvent().init({"value": i}) for i in range(3)]
+        for event in events:
+            store.add(event, DeadLetterReason.unroutable)
+
+        self.assertEqual([events[1], events[2]], [l.event for l in store.letters])
+        self.assertEqual(1, store.discarded)
+        self.assertEqual(3, store.counters["unroutable"])
+
+    def test_pop(self):
+        store = DeadLetterStore()
+        first = store.add(
+            DeadLetterEvent().init({"value": 1}), DeadLetterReason.unroutable
+        )
+        second = store.add(
+            DeadLetterEvent().init({"value": 2}),
+            DeadLetterReason.failed,
+            fake_callback,
+            ValueError("failure"),
+            1,
+        )
+
+        self.assertIs(second, store.pop(second.id))
+        self.assertIsNone(store.pop(second.id))
+        self.assertEqual([first], store.pop_all())
+        self.assertEqual(0, len(store.letters))
+
+    def test_get_data(self):
+        store = DeadLetterStore()
+        store.add(
+            DeadLetterEvent().init({"value": 1}),
+            DeadLetterReason.failed,
+            fake_callback,
+            ValueError("failure"),
+            3,
+        )
+
+        data = store.get_data()[0]
+
+        self.assertEqual("failed", data["reason"])
+        self.assertEqual("DeadLetterEvent", data["event"]["event_type"])
+        self.assertEqual(
+            "tests.core.dead_letter_test.fake_callback", data["subscriber"]
+        )
+        self.assertEqual("ValueError('failure')", data["error"])
+        self.assertEqual(3, data["attempts"])
+
+    def test_get_data_partial_subscriber(self):
+        store = DeadLetterStore()
+        store.add(
+            DeadLetterEvent().init({"value": 1}),
+            DeadLetterReason.failed,
+            functools.partial(fake_callback),
+        )
+
+        self.assertEqual(
+            "tests.core.dead_letter_test.fake_callback",
+            store.get_data()[0]["subscriber"],
+        )
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_get_delay(self):
+        policy = RetryPolicy(max_attempts=4, delay=0.5, backoff=2)
+
+        self.assertEqual(
+            [0.5, 1.0, 2.0], [policy.get_delay(attempt) for attempt in range(1, 4)]
+        )
+
+
+class DeadLetterEvent(Event):
+    def __init__(self):
+        super().__init__(priority=0, schema=Schema({"value": int}))
+
+
+async def fake_callback(event):
+    pass
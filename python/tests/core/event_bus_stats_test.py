@@ -0,0 +1,110 @@
+import functools
+import unittest
+
+from msa.core.event_bus_stats import LatencyHistogram, EventBusStats
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_empty(self):
+        histogram = LatencyHistogram()
+
+        self.assertEqual(
+            {"count": 0, "mean": 0.0, "max": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0},
+            histogram.get_data(),
+        )
+
+    def test_record(self):
+        histogram = LatencyHistogram()
+
+        for _ in range(90):
+            histogram.record(0.0001)
+        for _ in range(10):
+            histogram.record(0.5)
+
+        data = histogram.get_data()
+
+        self.assertEqual(100, data["count"])
+        self.assertEqual(0.5, data["max"])
+        self.assertAlmostEqual(0.05009, data["mean"])
+        # percentiles are bucket upper bounds, within a factor of two of the recorded values
+        self.assertTrue(0.0001 <= data["p50"] < 0.0002)
+        self.assertTrue(0.0001 <= data["p90"] < 0.0002)
+        self.assertEqual(0.5, data["p99"])
+
+    def test_fixed_size(self):
+        histogram = LatencyHistogram()
+
+        histogram.record(0)
+        histogram.record(3600)
+
+        self.assertEqual(LatencyHistogram.BUCKETS, len(histogram.buckets))
+        self.assertEqual(1, histogram.buckets[0])
+        self.assertEqual(1, histogram.buckets[-1])
+
+
+class EventBusStatsTest(unittest.TestCase):
+    def test_event_type_depth(self):
+        stats = EventBusStats()
+
+        stats.record_enqueue(FakeEventType)
+        stats.record_enqueue(FakeEventType)
+        stats.record_enqueue(FakeEventType)
+        stats.record_dequeue(FakeEventType, 0.001)
+        stats.record_drop(FakeEventType)
+
+        data = stats.get_data()["event_types"][
+            "tests.core.event_bus_stats_test.FakeEventType"
+        ]
+
+        self.assertEqual(3, data["enqueued"])
+        self.assertEqual(1, data["depth"])
+        self.assertEqual(1, data["queue_wait"]["count"])
+
+    def test_subscribers(self):
+        stats = EventBusStats()
+
+        stats.record_subscriber(fake_callback, 0.01)
+        stats.record_subscriber(fake_callback, 0.03)
+
+        data = stats.get_data()["subscribers"][
+            "tests.core.event_bus_stats_test.fake_callback"
+        ]
+
+        self.assertEqual(2, data["count"])
+        self.assertEqual(0.03, data["max"])
+
+    def test_subscriber_names(self):
+        stats = EventBusStats()
+        callable_instance = FakeCallable()
+
+        stats.record_subscriber(functools.partial(fake_callback), 0.01)
+        stats.record_subscriber(callable_instance, 0.01)
+        stats.record_subscriber_error(functools.partial(fake_callback))
+
+        data = stats.get_data()
+
+        self.assertEqual(
+            {"tests.core.event_bus_stats_test.fake_callback", repr(callable_instance)},
+            set(data["subscribers"]),
+        )
+        self.assertEqual(
+            {"tests.core.event_bus_stats_test.fake_callback": 1},
+            data["subscriber_errors"],
+        )
+
+
+class FakeEventType:
+    pass
+
+
+async def fake_callback(event):
+    pass
+
+
+class FakeCallable:
+    async def __call__(self, event):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
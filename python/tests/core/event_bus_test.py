@@ -1,9 +1,15 @@
 import asyncio
+import tempfile
 import unittest
+from functools import partial
 from unittest import mock
 
-from msa.core.event_bus import EventBus
+from msa.core.event_bus import EventBus, DispatchMode
+from msa.core.dead_letter import DeadLetterReason, RetryPolicy
+from msa.core.event_journal import EventJournal
+from msa.core.event_queue import OverflowPolicy, EventQueueFullException
 from msa.core.event import Event
+from schema import Schema
 from tests.async_test_util import AsyncMock, async_run
 
 
@@ -234,6 +240,17 @@ class EventBusTest(unittest.TestCase):
         assert fake_handler_2.callback_called
         assert fake_handler_2.event == new_event_a
 
+    def test_unsubscribe_unknown_pattern(self):
+
+        fake_handler_1 = FakeHandler()
+        self.event_bus.subscribe(".*A", fake_handler_1.callback)
+
+        self.event_bus.unsubscribe(".*B", fake_handler_1.callback)
+
+        self.assertEqual(
+            {fake_handler_1.callback}, set(self.event_bus._get_subscribers(FakeEventA))
+        )
+
     def test_complex_unsubscribe(self):
 
         fake_handler_1 = FakeHandler()
@@ -268,6 +285,267 @@ class EventBusTest(unittest.TestCase):
         assert fake_handler_2.callback_called
         assert fake_handler_2.event == new_event_b
 
+    def test_concurrent_subscriber_does_not_block_bus(self):
+
+        slow_handler = SlowHandler(self.loop)
+        self.event_bus.subscribe(
+            FakeEventA, slow_handler.callback, dispatch=DispatchMode.concurrent
+        )
+
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventB, fake_handler.callback)
+
+        new_event_a = FakeEventA()
+        new_event_b = FakeEventB()
+
+        async def main():
+            await self.event_bus.fire_event(new_event_a)
+            await self.event_bus.fire_event(new_event_b)
+            await self.event_bus.listen(timeout=0.1)
+
+            # the slow subscriber is still blocked, but the bus has moved on to the next event
+            assert slow_handler.started
+            assert slow_handler.events == []
+            assert fake_handler.callback_called
+
+            slow_handler.release.set()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            await self.event_bus.stop_workers()
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert slow_handler.events == [new_event_a]
+        assert fake_handler.event == new_event_b
+
+    def test_unsubscribe_stops_concurrent_worker(self):
+
+        slow_handler = SlowHandler(self.loop)
+        self.event_bus.subscribe(
+            FakeEventA, slow_handler.callback, dispatch=DispatchMode.concurrent
+        )
+
+        new_event_a = FakeEventA()
+
+        async def main():
+            await self.event_bus.fire_event(new_event_a)
+            await self.event_bus.listen(timeout=0.1)
+            worker = self.event_bus.subscriber_workers[slow_handler.callback]
+            task = worker.task
+
+            self.event_bus.unsubscribe(FakeEventA, slow_handler.callback)
+            assert slow_handler.callback not in self.event_bus.subscriber_workers
+
+            # the event already handed to the worker is still handled
+            slow_handler.release.set()
+            await asyncio.sleep(0.01)
+            assert task.done()
+            assert worker.task is None
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert slow_handler.events == [new_event_a]
+
+    def test_unsubscribe_stops_group_worker_after_last_member(self):
+        async def callback_1(event):
+            pass
+
+        async def callback_2(event):
+            pass
+
+        async def callback_3(events):
+            pass
+
+        self.event_bus.subscribe(
+            FakeEventA, callback_1, dispatch=DispatchMode.concurrent, group="group"
+        )
+        self.event_bus.subscribe(
+            FakeEventB, callback_2, dispatch=DispatchMode.concurrent, group="group"
+        )
+        self.event_bus.subscribe(FakeEventA, callback_3, batch_size=2)
+
+        async def main():
+            await self.event_bus.fire_events([FakeEventA(), FakeEventB()])
+            await self.event_bus.listen(timeout=0.1)
+            group_worker = self.event_bus.group_workers["group"]
+            batch_worker = self.event_bus.subscriber_workers[callback_3]
+
+            self.event_bus.unsubscribe(FakeEventA, callback_1)
+            self.event_bus.unsubscribe(FakeEventA, callback_3)
+            await asyncio.sleep(0)
+            assert self.event_bus.group_workers == {"group": group_worker}
+            assert not group_worker.closing
+            assert batch_worker.closing and batch_worker.task is None
+
+            self.event_bus.unsubscribe(FakeEventB, callback_2)
+            await asyncio.sleep(0)
+            assert self.event_bus.group_workers == {}
+            assert self.event_bus.subscriber_workers == {}
+            assert group_worker.task is None
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+    def test_concurrent_subscription_group_preserves_order(self):
+
+        received = []
+
+        async def callback_1(event):
+            await asyncio.sleep(0.01)
+            received.append(("callback_1", event))
+
+        async def callback_2(event):
+            received.append(("callback_2", event))
+
+        self.event_bus.subscribe(
+            FakeEventA, callback_1, dispatch=DispatchMode.concurrent, group="group"
+        )
+        self.event_bus.subscribe(
+            FakeEventB, callback_2, dispatch=DispatchMode.concurrent, group="group"
+        )
+
+        new_event_a = FakeEventA()
+        new_event_b = FakeEventB()
+
+        async def main():
+            await self.event_bus.fire_event(new_event_a)
+            await self.event_bus.fire_event(new_event_b)
+            await self.event_bus.listen(timeout=0.1)
+
+            await self.event_bus.stop_workers()
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert self.event_bus.subscriber_workers[callback_1] is (
+            self.event_bus.subscriber_workers[callback_2]
+        )
+        assert received == [("callback_1", new_event_a), ("callback_2", new_event_b)]
+
+    def test_subscriber_resolution_is_cached(self):
+
+        fake_handler_1 = FakeHandler()
+        fake_handler_2 = FakeHandler()
+
+        self.event_bus.subscribe(FakeEventA, fake_handler_1.callback)
+        self.event_bus.subscribe(".*A", fake_handler_2.callback)
+
+        subs = self.event_bus._get_subscribers(FakeEventA)
+
+        self.assertEqual({fake_handler_1.callback, fake_handler_2.callback}, set(subs))
+        self.assertIs(subs, self.event_bus._get_subscribers(FakeEventA))
+        self.assertEqual((), self.event_bus._get_subscribers(FakeEventB))
+
+        self.loop.close()
+
+    def test_subscriber_cache_invalidated_on_subscription_change(self):
+
+        fake_handler_1 = FakeHandler()
+        fake_handler_2 = FakeHandler()
+
+        self.event_bus.subscribe(FakeEventA, fake_handler_1.callback)
+        self.assertEqual(
+            (fake_handler_1.callback,), self.event_bus._get_subscribers(FakeEventA)
+        )
+
+        self.event_bus.subscribe(".*A", fake_handler_2.callback)
+        self.assertEqual(
+            {fake_handler_1.callback, fake_handler_2.callback},
+            set(self.event_bus._get_subscribers(FakeEventA)),
+        )
+
+        self.event_bus.unsubscribe(".*A", fake_handler_2.callback)
+        self.assertEqual(
+            (fake_handler_1.callback,), self.event_bus._get_subscribers(FakeEventA)
+        )
+        self.assertNotIn(".*A", self.event_bus.compiled_subscriptions)
+
+        self.event_bus.unsubscribe(FakeEventA, fake_handler_1.callback)
+        self.assertEqual((), self.event_bus._get_subscribers(FakeEventA))
+
+        self.loop.close()
+
+    def test_subscribe_to_base_class(self):
+
+        base_handler = FakeHandler()
+        sub_handler = FakeHandler()
+
+        self.event_bus.subscribe(FakeEventA, base_handler.callback)
+        self.event_bus.subscribe(FakeSubEventA, sub_handler.callback)
+
+        self.assertEqual(
+            {base_handler.callback, sub_handler.callback},
+            set(self.event_bus._get_subscribers(FakeSubEventA)),
+        )
+        self.assertEqual(
+            (base_handler.callback,), self.event_bus._get_subscribers(FakeEventA)
+        )
+        self.assertEqual((), self.event_bus._get_subscribers(FakeEventB))
+
+        async def main():
+            await self.event_bus.fire_event(FakeSubEventA())
+            await self.event_bus.listen(timeout=0.1)
+
+        self.loop.run_until_complete(main())
+
+        self.assertIsInstance(base_handler.event, FakeSubEventA)
+        self.assertIsInstance(sub_handler.event, FakeSubEventA)
+
+        self.loop.close()
+
+    def test_subscriber_cache_refreshed_for_subclasses(self):
+
+        fake_handler_1 = FakeHandler()
+        fake_handler_2 = FakeHandler()
+
+        self.event_bus.subscribe(FakeEventB, fake_handler_2.callback)
+        self.assertEqual(
+            3,
+            self.event_bus.warm_subscriber_cache(
+                [FakeEventA, FakeSubEventA, FakeEventB]
+            ),
+        )
+        b_subs = self.event_bus._get_subscribers(FakeEventB)
+
+        self.event_bus.subscribe(Event, fake_handler_1.callback)
+        self.assertEqual(
+            (fake_handler_1.callback,), self.event_bus._get_subscribers(FakeSubEventA)
+        )
+        self.assertEqual(
+            {fake_handler_1.callback, fake_handler_2.callback},
+            set(self.event_bus._get_subscribers(FakeEventB)),
+        )
+
+        self.event_bus.unsubscribe(Event, fake_handler_1.callback)
+        self.assertEqual((), self.event_bus._get_subscribers(FakeSubEventA))
+        self.assertEqual(b_subs, self.event_bus._get_subscribers(FakeEventB))
+
+        self.loop.close()
+
+    def test_warm_subscriber_cache(self):
+
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, fake_handler.callback)
+
+        self.assertGreater(self.event_bus.warm_subscriber_cache(), 0)
+        self.assertEqual(
+            (fake_handler.callback,), self.event_bus.subscriber_cache[FakeSubEventA]
+        )
+        self.assertEqual((), self.event_bus.subscriber_cache[FakeEventC])
+
+        self.loop.close()
+
     def test_listen_for_result(self):
 
         new_event = FakeEventA()
@@ -387,6 +665,592 @@ class EventBusTest(unittest.TestCase):
 
         assert result == None
 
+    def test_listen_for_result_by_correlation_id(self):
+
+        event_1 = FakeEventA().correlate("request-1")
+        event_2 = FakeEventA().correlate("request-2")
+
+        async def main():
+            def insert():
+                self.event_bus.queue.put_nowait((event_2.priority, event_2))
+                self.event_bus.queue.put_nowait((event_1.priority, event_1))
+
+            self.loop.call_soon(insert)
+
+            task_results = await asyncio.gather(
+                self.event_bus.listen_for_result(
+                    FakeEventA, correlation_id="request-1"
+                ),
+                self.event_bus.listen_for_result(
+                    FakeEventA, correlation_id="request-2"
+                ),
+                self.event_bus.listen(timeout=0.1),
+            )
+
+            return task_results[0], task_results[1]
+
+        result_1, result_2 = async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert result_1 is event_1
+        assert result_2 is event_2
+        assert self.event_bus.result_listeners == {}
+
+    def test_listen_for_result_timeout_frees_listener(self):
+        async def main():
+            return await self.event_bus.listen_for_result(
+                FakeEventA, timeout=0.01, correlation_id="request-1"
+            )
+
+        result = async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert result is None
+        assert self.event_bus.result_listeners == {}
+
+    def test_fire_event_with_result_listener_and_no_subscriber(self):
+
+        new_event = FakeEventA().correlate("request-1")
+
+        async def main():
+            future = self.event_bus.expect_result(FakeEventA, "request-1")
+            await self.event_bus.fire_event(new_event)
+            await self.event_bus.listen(timeout=0.1)
+            return await self.event_bus.wait_for_result(future, timeout=0.1)
+
+        result = async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert result is new_event
+
+    def test_fire_event_rejected_when_queue_full(self):
+
+        self.event_bus = EventBus(
+            self.loop, max_queue_size=1, overflow_policy=OverflowPolicy.reject
+        )
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, fake_handler.callback)
+
+        async def main():
+            assert await self.event_bus.fire_event(FakeEventA())
+            await self.event_bus.fire_event(FakeEventA())
+
+        with self.assertRaises(EventQueueFullException):
+            async_run(self.loop, main())
+
+        self.loop.close()
+
+        self.assertEqual(1, self.event_bus.queue.qsize())
+        self.assertEqual(1, self.event_bus.queue.counters["rejected"])
+
+    def test_fire_event_nowait(self):
+
+        self.event_bus = EventBus(self.loop, max_queue_size=1)
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, fake_handler.callback)
+
+        new_event = FakeEventA()
+
+        with mock.patch("builtins.print"):
+            assert not self.event_bus.fire_event_nowait(FakeEventB())
+        assert self.event_bus.fire_event_nowait(new_event)
+
+        # the bus would have to wait for room, so the event is left to the caller
+        with self.assertRaises(asyncio.QueueFull):
+            self.event_bus.fire_event_nowait(FakeEventA())
+
+        async def main():
+            await self.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert fake_handler.event is new_event
+        self.assertEqual(1, self.event_bus.queue.counters["enqueued"])
+        self.assertEqual(1, self.event_bus.dead_letters.counters["unroutable"])
+
+    def test_fire_events(self):
+
+        fake_handler_1 = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, fake_handler_1.callback)
+
+        fake_handler_2 = FakeHandler()
+        self.event_bus.subscribe(FakeEventB, fake_handler_2.callback)
+
+        new_event_a = FakeEventA()
+        new_event_b = FakeEventB()
+        unsubscribed_event = FakeEventC()
+
+        async def main():
+            queued = await self.event_bus.fire_events(
+                [new_event_a, new_event_b, unsubscribed_event]
+            )
+            await self.event_bus.listen(timeout=0.1)
+            return queued
+
+        queued = async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert queued == 2
+        assert fake_handler_1.event == new_event_a
+        assert fake_handler_2.event == new_event_b
+
+    def test_batch_subscriber(self):
+
+        batches = []
+
+        async def callback(events):
+            batches.append(events)
+
+        self.event_bus.subscribe(FakeEventA, callback, batch_size=3, batch_timeout=0.05)
+
+        new_events = [FakeEventA() for _ in range(5)]
+
+        async def main():
+            await self.event_bus.fire_events(new_events)
+            await self.event_bus.listen(timeout=0.1)
+            await self.event_bus.stop_workers()
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        # the first batch fills up, the remainder is flushed when the batch timeout expires
+        assert [len(batch) for batch in batches] == [3, 2]
+        assert [event for batch in batches for event in batch] == new_events
+
+    def test_stats(self):
+
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, fake_handler.callback)
+
+        async def main():
+            await self.event_bus.fire_events([FakeEventA(), FakeEventA()])
+            await self.event_bus.fire_event(FakeEventB())
+            await self.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        stats = self.event_bus.get_stats()
+
+        self.assertEqual(0, stats["queue"]["depth"])
+        self.assertEqual(2, stats["queue"]["counters"]["enqueued"])
+        self.assertEqual(2, stats["queue"]["lanes"]["high"]["dequeued"])
+
+        event_a_stats = stats["event_types"]["tests.core.event_bus_test.FakeEventA"]
+        self.assertEqual(2, event_a_stats["enqueued"])
+        self.assertEqual(0, event_a_stats["depth"])
+        self.assertEqual(2, event_a_stats["queue_wait"]["count"])
+        self.assertEqual(2, event_a_stats["dispatch_latency"]["count"])
+
+        subscriber_stats = stats["subscribers"][
+            "tests.core.event_bus_test.FakeHandler.callback"
+        ]
+        self.assertEqual(2, subscriber_stats["count"])
+
+    def test_sync_subscriber_called_inline(self):
+
+        sync_handler = SyncHandler()
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, sync_handler.callback)
+        self.event_bus.subscribe(FakeEventA, fake_handler.callback)
+
+        assert sync_handler.callback in self.event_bus.sync_subscribers
+        assert fake_handler.callback not in self.event_bus.sync_subscribers
+
+        new_event = FakeEventA()
+
+        async def main():
+            await self.event_bus.fire_event(new_event)
+            with mock.patch("asyncio.gather", wraps=asyncio.gather) as gather:
+                await self.event_bus.listen(timeout=0.1)
+            # only the coroutine subscriber is gathered
+            gather.assert_called_once()
+            self.assertEqual(1, len(gather.call_args[0]))
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert sync_handler.events == [new_event]
+        assert fake_handler.event is new_event
+
+    def test_unsubscribe_forgets_sync_subscriber(self):
+
+        sync_handler = SyncHandler()
+        self.event_bus.subscribe(FakeEventA, sync_handler.callback)
+        self.event_bus.subscribe(".*B", sync_handler.callback)
+
+        self.event_bus.unsubscribe(FakeEventA, sync_handler.callback)
+        self.assertIn(sync_handler.callback, self.event_bus.sync_subscribers)
+
+        self.event_bus.unsubscribe(".*B", sync_handler.callback)
+        self.assertEqual(set(), self.event_bus.sync_subscribers)
+
+        self.loop.close()
+
+    def test_sync_subscriber_without_coroutine_subscribers(self):
+
+        sync_handler = SyncHandler()
+        self.event_bus.subscribe(FakeEventA, sync_handler.callback)
+
+        async def main():
+            await self.event_bus.fire_events([FakeEventA(), FakeEventA()])
+            with mock.patch("asyncio.gather") as gather:
+                await self.event_bus.listen(timeout=0.1)
+            gather.assert_not_called()
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert len(sync_handler.events) == 2
+        stats = self.event_bus.get_stats()
+        self.assertEqual(
+            2,
+            stats["subscribers"]["tests.core.event_bus_test.SyncHandler.callback"][
+                "count"
+            ],
+        )
+
+    def test_sync_subscriber_retry_and_dead_letter(self):
+        self.event_bus = EventBus(
+            self.loop, retry_policy=RetryPolicy(max_attempts=2, delay=0)
+        )
+
+        flaky_handler = SyncFailingHandler(failures=1)
+        failing_handler = SyncFailingHandler(failures=100)
+        self.event_bus.subscribe(FakeEventA, flaky_handler.callback)
+        self.event_bus.subscribe(FakeEventB, failing_handler.callback)
+
+        new_event = FakeEventB()
+
+        async def main():
+            await self.event_bus.fire_event(FakeEventA())
+            await self.event_bus.fire_event(new_event)
+            with mock.patch("traceback.print_exc"):
+                await self.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert flaky_handler.calls == 2
+        assert failing_handler.calls == 2
+
+        letters = self.event_bus.dead_letters.letters
+        assert len(letters) == 1
+        assert letters[0].event is new_event
+        assert letters[0].attempts == 2
+
+    def test_sync_subscriber_dispatched_concurrently(self):
+
+        sync_handler = SyncHandler()
+        self.event_bus.subscribe(
+            FakeEventA, sync_handler.callback, dispatch=DispatchMode.concurrent
+        )
+
+        new_event = FakeEventA()
+
+        async def main():
+            await self.event_bus.fire_event(new_event)
+            await self.event_bus.listen(timeout=0.1)
+            await self.event_bus.stop_workers()
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert sync_handler.events == [new_event]
+
+    def test_sync_subscriber_returning_coroutine_is_awaited(self):
+        self.event_bus = EventBus(
+            self.loop, retry_policy=RetryPolicy(max_attempts=2, delay=0)
+        )
+
+        fake_handler = FakeHandler()
+        failing_handler = FailingHandler(failures=100)
+        # plain functions handing back coroutines, as a lambda wrapping a coroutine function does
+        self.event_bus.subscribe(FakeEventA, lambda event: fake_handler.callback(event))
+        self.event_bus.subscribe(
+            FakeEventB, lambda event: failing_handler.callback(event)
+        )
+
+        new_event = FakeEventA()
+        failed_event = FakeEventB()
+
+        async def main():
+            await self.event_bus.fire_event(new_event)
+            await self.event_bus.fire_event(failed_event)
+            with mock.patch("traceback.print_exc"):
+                await self.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert fake_handler.event is new_event
+        assert failing_handler.calls == 2
+        letters = self.event_bus.dead_letters.letters
+        assert len(letters) == 1
+        assert letters[0].event is failed_event
+        assert letters[0].attempts == 2
+
+    def test_partial_of_coroutine_function_is_not_sync(self):
+
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, partial(fake_handler.callback))
+
+        self.assertEqual(set(), self.event_bus.sync_subscribers)
+
+        self.loop.close()
+
+    def test_failing_subscriber_is_isolated(self):
+
+        failing_handler = FailingHandler(failures=100)
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, failing_handler.callback)
+        self.event_bus.subscribe(FakeEventA, fake_handler.callback)
+
+        new_event = FakeEventA()
+
+        async def main():
+            await self.event_bus.fire_event(new_event)
+            await self.event_bus.fire_event(FakeEventA())
+            with mock.patch("traceback.print_exc"):
+                await self.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        # the bus kept dispatching after the first failure
+        assert failing_handler.calls == 2
+        assert fake_handler.callback_called
+
+        letters = self.event_bus.dead_letters.letters
+        assert len(letters) == 2
+        assert letters[0].event is new_event
+        assert letters[0].reason == DeadLetterReason.failed
+        assert letters[0].callback == failing_handler.callback
+
+        stats = self.event_bus.get_stats()
+        self.assertEqual(
+            2,
+            stats["subscriber_errors"][
+                "tests.core.event_bus_test.FailingHandler.callback"
+            ],
+        )
+        self.assertEqual(2, stats["dead_letters"]["counters"]["failed"])
+
+    def test_retry_policy(self):
+        self.event_bus = EventBus(
+            self.loop, retry_policy=RetryPolicy(max_attempts=3, delay=0)
+        )
+
+        failing_handler = FailingHandler(failures=2)
+        self.event_bus.subscribe(FakeEventA, failing_handler.callback)
+
+        async def main():
+            await self.event_bus.fire_event(FakeEventA())
+            await self.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert failing_handler.calls == 3
+        assert len(self.event_bus.dead_letters.letters) == 0
+
+    def test_unroutable_event_is_dead_lettered(self):
+
+        new_event = FakeEventB()
+
+        async def main():
+            return await self.event_bus.fire_event(new_event)
+
+        result = async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert result is False
+        letter = self.event_bus.dead_letters.letters[0]
+        assert letter.event is new_event
+        assert letter.reason == DeadLetterReason.unroutable
+
+    def test_replay_dead_letter(self):
+
+        failing_handler = FailingHandler(failures=1)
+        fake_handler = FakeHandler()
+        self.event_bus.subscribe(FakeEventA, failing_handler.callback)
+        self.event_bus.subscribe(FakeEventA, fake_handler.callback)
+
+        new_event = FakeEventA()
+
+        async def main():
+            await self.event_bus.fire_event(new_event)
+            with mock.patch("traceback.print_exc"):
+                await self.event_bus.listen(timeout=0.1)
+
+            fake_handler.callback_called = False
+            letter_id = self.event_bus.get_dead_letters()[0]["id"]
+            replayed = await self.event_bus.replay_dead_letter(letter_id)
+            missing = await self.event_bus.replay_dead_letter(letter_id)
+            return replayed, missing
+
+        replayed, missing = async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert replayed
+        assert not missing
+        # only the subscriber that failed receives the replayed event
+        assert failing_handler.calls == 2
+        assert not fake_handler.callback_called
+        assert len(self.event_bus.dead_letters.letters) == 0
+
+    def test_coalesce_queued_duplicates(self):
+
+        fake_handler = CountingHandler()
+        self.event_bus.subscribe(CoalescedEvent, fake_handler.callback)
+
+        async def main():
+            await self.event_bus.fire_event(CoalescedEvent().init({"key": 1}))
+            await self.event_bus.fire_event(CoalescedEvent().init({"key": 1}))
+            await self.event_bus.fire_event(CoalescedEvent().init({"key": 2}))
+            await self.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert [event.data["key"] for event in fake_handler.events] == [1, 2]
+        event_stats = self.event_bus.get_stats()["event_types"][
+            "tests.core.event_bus_test.CoalescedEvent"
+        ]
+        self.assertEqual(1, event_stats["coalesced"])
+
+    def test_coalesced_requesters_share_reply(self):
+
+        replier = ReplyingHandler(self.event_bus)
+        self.event_bus.subscribe(CoalescedEvent, replier.callback)
+
+        async def main():
+            requests = [CoalescedEvent().init({"key": 1}).correlate() for _ in range(3)]
+            futures = [
+                self.event_bus.expect_result(FakeEventC, request.correlation_id)
+                for request in requests
+            ]
+
+            await self.event_bus.fire_event(requests[0])
+            await self.event_bus.fire_event(requests[1])
+            await self.event_bus.listen(timeout=0.01)
+
+            # arrives after the reply, but within the coalescing window
+            await self.event_bus.fire_event(requests[2])
+
+            return [
+                await self.event_bus.wait_for_result(future, 0.1) for future in futures
+            ]
+
+        replies = async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert replier.calls == 1
+        assert replies[0] is not None
+        assert replies[0] is replies[1] is replies[2]
+
+    def test_coalesce_window_expires(self):
+
+        fake_handler = CountingHandler()
+        self.event_bus.subscribe(CoalescedEvent, fake_handler.callback)
+
+        async def main():
+            await self.event_bus.fire_event(CoalescedEvent().init({"key": 1}))
+            await self.event_bus.listen(timeout=0.01)
+            await asyncio.sleep(CoalescedEvent.coalesce_window)
+            await self.event_bus.fire_event(CoalescedEvent().init({"key": 1}))
+            await self.event_bus.listen(timeout=0.01)
+
+        async_run(self.loop, main())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert len(fake_handler.events) == 2
+
+    def test_journal_replay(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        journal = EventJournal(self.loop, directory.name)
+        journal.open()
+        self.event_bus = EventBus(self.loop, journal=journal)
+        self.event_bus.subscribe(JournaledEvent, FakeHandler().callback)
+
+        async def fire_and_die():
+            await self.event_bus.fire_event(
+                JournaledEvent().init(None).correlate("dispatched")
+            )
+            await self.event_bus.listen(timeout=0.01)
+            # queued, but the daemon stops before it is dispatched
+            await self.event_bus.fire_event(
+                JournaledEvent().init(None).correlate("queued")
+            )
+            await journal.close()
+
+        async_run(self.loop, fire_and_die())
+
+        journal = EventJournal(self.loop, directory.name)
+        journal.open()
+        self.event_bus = EventBus(self.loop, journal=journal)
+        fake_handler = CountingHandler()
+        self.event_bus.subscribe(JournaledEvent, fake_handler.callback)
+
+        async def restart():
+            replayed = await self.event_bus.replay_journal()
+            await self.event_bus.listen(timeout=0.01)
+            await journal.close()
+            return replayed
+
+        replayed = async_run(self.loop, restart())
+
+        self.loop.stop()
+        self.loop.close()
+
+        assert replayed == 1
+        assert [event.correlation_id for event in fake_handler.events] == ["queued"]
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        assert EventJournal(loop, directory.name).open() == []
+
 
 ### Helpers
 
@@ -396,11 +1260,20 @@ class FakeEventA(Event):
         super().__init__(priority=0, schema={})
 
 
+class FakeSubEventA(FakeEventA):
+    pass
+
+
 class FakeEventB(Event):
     def __init__(self):
         super().__init__(priority=0, schema={})
 
 
+class FakeEventC(Event):
+    def __init__(self):
+        super().__init__(priority=0, schema={})
+
+
 class FakeHandler:
     def __init__(self):
         self.event = None
@@ -412,5 +1285,73 @@ class FakeHandler:
         return "callback result"
 
 
+class CoalescedEvent(Event):
+    coalesce_window = 0.2
+
+    def __init__(self):
+        super().__init__(priority=0, schema=Schema({"key": int}))
+
+
+class JournaledEvent(Event):
+    def __init__(self):
+        super().__init__(priority=0, schema=Schema(None))
+
+
+class CountingHandler:
+    def __init__(self):
+        self.events = []
+
+    async def callback(self, event):
+        self.events.append(event)
+
+
+class ReplyingHandler:
+    def __init__(self, event_bus):
+        self.event_bus = event_bus
+        self.calls = 0
+
+    async def callback(self, event):
+        self.calls += 1
+        await self.event_bus.fire_event(FakeEventC().reply_to(event))
+
+
+class FailingHandler:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    async def callback(self, event):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ValueError("handler failure")
+
+
+class SyncHandler:
+    def __init__(self):
+        self.events = []
+
+    def callback(self, event):
+        self.events.append(event)
+
+
+class SyncFailingHandler(FailingHandler):
+    def callback(self, event):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ValueError("handler failure")
+
+
+class SlowHandler:
+    def __init__(self, loop):
+        self.release = asyncio.Event(loop=loop)
+        self.started = False
+        self.events = []
+
+    async def callback(self, event):
+        self.started = True
+        await self.release.wait()
+        self.events.append(event)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from schema import Schema
+
+from msa.core.event import Event
+from msa.core.event_journal import EventJournal
+from tests.async_test_util import async_run
+
+
+class EventJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.loop.close()
+        self.directory.cleanup()
+
+    def open_journal(self, **kwargs):
+        journal = EventJournal(self.loop, self.directory.name, **kwargs)
+        journal.open()
+        return journal
+
+    def segment_files(self):
+        return sorted(os.listdir(self.directory.name))
+
+    def test_recover_unacknowledged(self):
+        journal = self.open_journal()
+        events = [FakeEvent().init({"value": i}) for i in range(3)]
+
+        async def main():
+            ids = [journal.append(event) for event in events]
+            journal.ack(ids[1])
+            await journal.close()
+
+        async_run(self.loop, main())
+
+        recovered = self.open_journal().recovered
+
+        self.assertEqual([1, 3], [record_id for record_id, _ in recovered])
+        self.assertEqual(
+            [0, 2], [metadata["event_data"]["value"] for _, metadata in recovered]
+        )
+
+    def test_ids_continue_after_recovery(self):
+        journal = self.open_journal()
+
+        async def main():
+            journal.append(FakeEvent().init({"value": 1}))
+            await journal.close()
+
+        async_run(self.loop, main())
+
+        reopened = self.open_journal()
+        self.assertEqual(2, reopened.append(FakeEvent().init({"value": 2})))
+        async_run(self.loop, reopened.close())
+
+    def test_torn_record_is_skipped(self):
+        journal = self.open_journal()
+
+        async def main():
+            journal.append(FakeEvent().init({"value": 1}))
+            journal.file.write('{"op": "event", "id": 2, "ev')
+            await journal.close()
+
+        async_run(self.loop, main())
+
+        recovered = self.open_journal().recovered
+        self.assertEqual([1], [record_id for record_id, _ in recovered])
+
+    def test_group_commit(self):
+        journal = self.open_journal(sync_interval=0.01)
+
+        async def main():
+            for i in range(100):
+                journal.append(FakeEvent().init({"value": i}))
+            await asyncio.sleep(0.05)
+            await journal.close()
+
+        async_run(self.loop, main())
+
+        # one commit for the whole group, and one on close
+        self.assertEqual(2, journal.counters["commits"])
+
+    def test_compaction(self):
+        journal = self.open_journal(segment_size=200)
+
+        async def main():
+            ids = [journal.append(FakeEvent().init({"value": i})) for i in range(10)]
+            segments = self.segment_files()
+            for record_id in ids[:-1]:
+                journal.ack(record_id)
+            await journal.close()
+            return segments
+
+        segments_before = async_run(self.loop, main())
+
+        self.assertGreater(len(segments_before), 3)
+        # only the segment holding the unacknowledged event, and those after it, remain
+        remaining = self.segment_files()
+        self.assertLess(len(remaining), len(segments_before))
+        self.assertEqual(
+            [10], [record_id for record_id, _ in self.open_journal().recovered]
+        )
+
+    def test_unserializable_event_is_not_journaled(self):
+        journal = self.open_journal()
+
+        record_id = journal.append(FakeEvent().init({"value": object()}))
+
+        self.assertIsNone(record_id)
+        self.assertEqual(0, journal.counters["appended"])
+        async_run(self.loop, journal.close())
+
+
+class FakeEvent(Event):
+    def __init__(self):
+        super().__init__(priority=0, schema=Schema({"value": object}))
@@ -0,0 +1,265 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from msa.core.event import Event
+from msa.core.event_queue import (
+    EventQueue,
+    OverflowPolicy,
+    EventQueueFullException,
+    PriorityLane,
+)
+from tests.async_test_util import async_run
+
+
+class EventQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def drain(self, queue):
+        events = []
+        while not queue.empty():
+            _, event = queue.get_nowait()
+            events.append(event)
+        return events
+
+    def test_unbounded(self):
+        queue = EventQueue(loop=self.loop)
+
+        async def main():
+            for _ in range(100):
+                event = FakeEvent(10)
+                assert await queue.put_event((event.priority, event))
+
+        async_run(self.loop, main())
+
+        self.assertEqual(100, queue.qsize())
+        self.assertEqual(100, queue.counters["enqueued"])
+
+    def test_fifo_within_priority(self):
+        queue = EventQueue(lanes=[PriorityLane("all")], loop=self.loop)
+        low = [FakeEvent(100) for _ in range(50)]
+        high = [FakeEvent(0) for _ in range(50)]
+
+        for low_event, high_event in zip(low, high):
+            queue.put_nowait((low_event.priority, low_event))
+            queue.put_nowait((high_event.priority, high_event))
+
+        drained = self.drain(queue)
+
+        self.assertEqual(high + low, drained)
+        for expected, actual in zip(high + low, drained):
+            self.assertIs(expected, actual)
+
+    def test_entries_never_compare_events(self):
+        queue = EventQueue(loop=self.loop)
+        events = [UncomparableEvent() for _ in range(20)]
+
+        for event in events:
+            queue.put_nowait((event.priority, event))
+
+        self.assertEqual(events, self.drain(queue))
+
+    def test_put_event_nowait_does_not_block(self):
+        queue = EventQueue(1, OverflowPolicy.block, loop=self.loop)
+        event_1 = FakeEvent(10)
+        event_2 = FakeEvent(10)
+
+        assert not queue.would_block()
+        assert queue.put_event_nowait((event_1.priority, event_1))
+        assert queue.would_block()
+
+        with self.assertRaises(asyncio.QueueFull):
+            queue.put_event_nowait((event_2.priority, event_2))
+
+        self.assertEqual([event_1], self.drain(queue))
+        self.assertEqual(0, queue.counters["blocked"])
+
+    def test_block(self):
+        queue = EventQueue(1, OverflowPolicy.block, loop=self.loop)
+        event_1 = FakeEvent(10)
+        event_2 = FakeEvent(10)
+
+        async def main():
+            await queue.put_event((event_1.priority, event_1))
+            put_task = self.loop.create_task(
+                queue.put_event((event_2.priority, event_2))
+            )
+
+            await asyncio.sleep(0)
+            assert not put_task.done()
+
+            _, first = await queue.get()
+            await put_task
+            _, second = await queue.get()
+            return first, second
+
+        first, second = async_run(self.loop, main())
+
+        self.assertIs(event_1, first)
+        self.assertIs(event_2, second)
+        self.assertEqual(1, queue.counters["blocked"])
+        self.assertEqual(2, queue.counters["enqueued"])
+
+    def test_drop_newest(self):
+        queue = EventQueue(1, OverflowPolicy.drop_newest, loop=self.loop)
+        event_1 = FakeEvent(10)
+        event_2 = FakeEvent(0)
+
+        async def main():
+            assert await queue.put_event((event_1.priority, event_1))
+            assert not await queue.put_event((event_2.priority, event_2))
+
+        async_run(self.loop, main())
+
+        self.assertEqual([event_1], self.drain(queue))
+        self.assertEqual(1, queue.counters["dropped_newest"])
+
+    def test_drop_oldest_evicts_oldest_lowest_priority(self):
+        queue = EventQueue(3, OverflowPolicy.drop_oldest, loop=self.loop)
+        high = FakeEvent(0)
+        low_old = FakeEvent(100)
+        low_new = FakeEvent(100)
+        incoming = FakeEvent(50)
+
+        async def main():
+            for event in [low_old, high, low_new]:
+                await queue.put_event((event.priority, event))
+            assert await queue.put_event((incoming.priority, incoming))
+
+        async_run(self.loop, main())
+
+        self.assertEqual([high, incoming, low_new], self.drain(queue))
+        self.assertEqual(1, queue.counters["dropped_oldest"])
+
+    def test_drop_oldest_drops_incoming_lower_priority_event(self):
+        queue = EventQueue(1, OverflowPolicy.drop_oldest, loop=self.loop)
+        queued = FakeEvent(10)
+        incoming = FakeEvent(100)
+
+        async def main():
+            await queue.put_event((queued.priority, queued))
+            assert not await queue.put_event((incoming.priority, incoming))
+
+        async_run(self.loop, main())
+
+        self.assertEqual([queued], self.drain(queue))
+        self.assertEqual(1, queue.counters["dropped_newest"])
+
+    def test_reject(self):
+        queue = EventQueue(1, OverflowPolicy.reject, loop=self.loop)
+        event_1 = FakeEvent(10)
+        event_2 = FakeEvent(10)
+
+        async def main():
+            await queue.put_event((event_1.priority, event_1))
+            await queue.put_event((event_2.priority, event_2))
+
+        with self.assertRaises(EventQueueFullException):
+            async_run(self.loop, main())
+
+        self.assertEqual([event_1], self.drain(queue))
+        self.assertEqual(1, queue.counters["rejected"])
+
+    def test_drop_oldest_after_dequeues(self):
+        queue = EventQueue(4, OverflowPolicy.drop_oldest, loop=self.loop)
+        dropped = []
+        queue.on_drop = dropped.append
+        low = [FakeEvent(100) for _ in range(3)]
+        normal = [FakeEvent(60) for _ in range(3)]
+        high = [FakeEvent(0) for _ in range(3)]
+
+        for event in [low[0], normal[0], low[1], normal[1], high[0]]:
+            queue.put_event_nowait((event.priority, event))
+        # entries dequeued after the first eviction are skipped when looking for the next one
+        self.assertIs(high[0], queue.get_nowait()[1])
+        queue.put_event_nowait((low[2].priority, low[2]))
+        self.assertIs(normal[0], queue.get_nowait()[1])
+        for event in [normal[2], high[1], high[2], FakeEvent(50)]:
+            queue.put_event_nowait((event.priority, event))
+
+        self.assertEqual([low[0], low[1], low[2], normal[1]], dropped)
+
+        # the eviction heap does not keep the entries that left the lane
+        for _ in range(100):
+            event = FakeEvent(100)
+            queue.put_event_nowait((event.priority, event))
+            queue.get_nowait()
+        self.assertLess(len(queue._queue.get_lane(100).eviction_heap), 30)
+
+    def test_lane_assignment(self):
+        queue = EventQueue(loop=self.loop)
+        lanes = queue._queue
+
+        self.assertEqual("high", lanes.get_lane(0).name)
+        self.assertEqual("normal", lanes.get_lane(40).name)
+        self.assertEqual("normal", lanes.get_lane(50).name)
+        self.assertEqual("low", lanes.get_lane(100).name)
+
+    def test_weighted_fair_dequeue(self):
+        queue = EventQueue(
+            lanes=[
+                PriorityLane("high", max_priority=10, weight=3),
+                PriorityLane("low", weight=1),
+            ],
+            loop=self.loop,
+        )
+        high = [FakeEvent(0) for _ in range(20)]
+        low = [FakeEvent(100) for _ in range(20)]
+
+        for event in high + low:
+            queue.put_nowait((event.priority, event))
+
+        drained = [event.priority for event in self.drain(queue)]
+
+        # the low lane is served once every four dequeues while both lanes are waiting
+        for start in range(0, 24, 4):
+            self.assertEqual(1, drained[start : start + 4].count(100))
+        self.assertEqual([100] * 14, drained[26:])
+
+        lane_stats = queue.get_lane_stats()
+        self.assertEqual(20, lane_stats["high"]["dequeued"])
+        self.assertEqual(20, lane_stats["low"]["wait"]["count"])
+
+    def test_aging_promotes_overdue_event(self):
+        queue = EventQueue(
+            lanes=[
+                PriorityLane("high", max_priority=10, weight=100),
+                PriorityLane("low", weight=1, max_wait=5),
+            ],
+            loop=self.loop,
+        )
+        low = FakeEvent(100)
+        high = [FakeEvent(0) for _ in range(3)]
+
+        with mock.patch("time.monotonic", return_value=0):
+            queue.put_nowait((low.priority, low))
+        with mock.patch("time.monotonic", return_value=10):
+            for event in high:
+                queue.put_nowait((event.priority, event))
+            drained = self.drain(queue)
+
+        self.assertIs(low, drained[0])
+        self.assertEqual(1, queue.get_lane_stats()["low"]["promoted"])
+
+
+class FakeEvent(Event):
+    def __init__(self, priority):
+        super().__init__(priority=priority, schema={})
+
+
+class UncomparableEvent(Event):
+    def __init__(self):
+        super().__init__(priority=10, schema={})
+
+    def __lt__(self, other):
+        raise AssertionError("queue entries should not compare events")
+
+    __le__ = __gt__ = __ge__ = __lt__
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+from schema import Schema
+
+from msa.core.event import Event
+from msa.core.event_registry import (
+    AmbiguousEventTypeException,
+    EventRegistry,
+    EventTypeNotFoundException,
+    event_registry,
+)
+
+
+class EventRegistryTest(unittest.TestCase):
+    def test_get(self):
+        registry = EventRegistry()
+        registry.register(PluginAEvent)
+
+        self.assertIs(PluginAEvent, registry.get("plugin_a.PluginEvent"))
+        self.assertIs(PluginAEvent, registry.get("PluginEvent"))
+        self.assertEqual("PluginEvent", registry.get_serialized_name(PluginAEvent))
+
+        with self.assertRaises(EventTypeNotFoundException):
+            registry.get("plugin_b.PluginEvent")
+
+    def test_ambiguous_short_name(self):
+        registry = EventRegistry()
+        registry.register(PluginAEvent)
+        registry.register(PluginBEvent)
+
+        self.assertIs(PluginAEvent, registry.get("plugin_a.PluginEvent"))
+        self.assertIs(PluginBEvent, registry.get("plugin_b.PluginEvent"))
+        with self.assertRaises(AmbiguousEventTypeException):
+            registry.get("PluginEvent")
+
+        self.assertEqual(
+            "plugin_b.PluginEvent", registry.get_serialized_name(PluginBEvent)
+        )
+        self.assertEqual(
+            {"PluginEvent": ["plugin_a.PluginEvent", "plugin_b.PluginEvent"]},
+            registry.get_ambiguous_names(),
+        )
+
+    def test_register_again(self):
+        registry = EventRegistry()
+        registry.register(PluginAEvent)
+
+        # a class redefined under the same name replaces the old one
+        PluginEvent = make_plugin_event("plugin_a")
+        registry.register(PluginEvent)
+
+        self.assertIs(PluginEvent, registry.get("PluginEvent"))
+        self.assertEqual({}, registry.get_ambiguous_names())
+
+    def test_event_subclasses_are_registered(self):
+        self.assertIs(
+            NestedEvent,
+            event_registry.get("tests.core.event_registry_test.NestedEvent"),
+        )
+
+        nested = NestedEvent().init({})
+        self.assertEqual(nested, Event.deserialize(nested.get_metadata()))
+
+        # events with ambiguous short names round trip under their full names
+        plugin_event = PluginBEvent().init({})
+        self.assertEqual(
+            "plugin_b.PluginEvent", plugin_event.get_metadata()["event_type"]
+        )
+        self.assertEqual(plugin_event, Event.deserialize(plugin_event.get_metadata()))
+
+
+def make_plugin_event(module):
+    """Defines an event class named `PluginEvent` in a plugin module."""
+
+    def __init__(self):
+        Event.__init__(self, priority=10)
+
+    return type(
+        "PluginEvent",
+        (Event,),
+        {
+            "__module__": module,
+            "__slots__": (),
+            "schema": Schema({}),
+            "__init__": __init__,
+        },
+    )
+
+
+PluginAEvent = make_plugin_event("plugin_a")
+PluginBEvent = make_plugin_event("plugin_b")
+
+
+class BaseEvent(Event):
+    __slots__ = ()
+    schema = Schema({})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+class NestedEvent(BaseEvent):
+    """Not a direct subclass of `Event`."""
+
+    __slots__ = ()
+
+
+if __name__ == "__main__":
+    unittest.main()
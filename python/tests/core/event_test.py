@@ -1,3 +1,4 @@
+import datetime
 import unittest
 
 import schema
@@ -134,6 +135,76 @@ class EventTest(unittest.TestCase):
 
         self.assertEqual(dummy_event, deserialized)
 
+    def test_correlate_and_reply_to(self):
+        request = DummyEvent().init({"prop_1": 1, "prop_2": "hello"})
+        assert request.correlation_id is None
+
+        request_instance = request.correlate()
+        assert request_instance is request
+        assert request.correlation_id is not None
+
+        reply = FakeA().init({"key": 1}).reply_to(request)
+        assert reply.correlation_id == request.correlation_id
+
+        deserialized = Event.deserialize(reply.get_metadata())
+        self.assertEqual(request.correlation_id, deserialized.correlation_id)
+
+    def test_serialize_deserialized_event(self):
+        dummy_event = DummyEvent().init({"prop_1": 1, "prop_2": "hello"})
+        metadata = dummy_event.get_metadata()
+
+        deserialized = Event.deserialize(metadata)
+
+        self.assertEqual(dummy_event.generation_time, deserialized.generation_time)
+        self.assertEqual(metadata, deserialized.get_metadata())
+
+    def test_slotted_event_with_class_schema(self):
+        slotted = SlottedEvent().init({"key": 1})
+
+        assert not hasattr(slotted, "__dict__")
+        assert slotted.schema is SlottedEvent.schema
+        assert SlottedEvent().schema is slotted.schema
+
+        with self.assertRaises(schema.SchemaError):
+            SlottedEvent().init({"key": "1"})
+
+        deserialized = Event.deserialize(slotted.get_metadata())
+        self.assertEqual(slotted, deserialized)
+        self.assertEqual(slotted.generation_time, deserialized.generation_time)
+
+    def test_trusted_event_skips_validation(self):
+        # trusted events are only validated when asked to
+        trusted = TrustedEvent().init({"key": "1"})
+        self.assertEqual({"key": "1"}, trusted.data)
+
+        with self.assertRaises(schema.SchemaError):
+            TrustedEvent().init({"key": "1"}, validate=True)
+
+        with self.assertRaises(schema.SchemaError):
+            SlottedEvent().init({"key": "1"}, validate=True)
+
+        # data from outside the process is always validated
+        with self.assertRaises(schema.SchemaError):
+            Event.deserialize(trusted.get_metadata())
+
+    def test_generation_time(self):
+        before = datetime.datetime.now().replace(microsecond=0)
+        new_event = FakeB()
+        after = datetime.datetime.now()
+
+        assert isinstance(new_event.generation_time, int)
+        formatted = datetime.datetime.strptime(
+            new_event.get_metadata()["generation_time"], "%Y-%m-%d %H:%M:%S.%f"
+        )
+        assert before <= formatted <= after
+
+        # events deserialized from an older format carry a datetime
+        new_event.set_metadata({"generation_time": formatted, "event_data": {}})
+        self.assertEqual(
+            formatted.strftime("%Y-%m-%d %H:%M:%S.%f"),
+            new_event.format_generation_time(),
+        )
+
     def test_deserialize_no_event_type(self):
         with self.assertRaises(Exception):
             Event.deserialize({})
@@ -162,6 +233,23 @@ class FakeA(Event):
         super().__init__(priority=10, schema=Schema({"key": int}))
 
 
+class SlottedEvent(Event):
+    __slots__ = ()
+    schema = Schema({"key": int})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+class TrustedEvent(Event):
+    __slots__ = ()
+    schema = Schema({"key": int})
+    trusted = True
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
 class FakeB(Event):
     def __init__(self):
         super().__init__(priority=10, schema=Schema({}))
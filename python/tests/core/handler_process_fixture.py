@@ -0,0 +1,76 @@
+"""A handler module run in a worker process by `tests.core.handler_process_test`."""
+import os
+
+from schema import Schema
+
+from msa.core import get_supervisor
+from msa.core.event import Event
+from msa.core.event_bus import DispatchMode
+from msa.core.event_handler import EventHandler
+
+
+class PingEvent(Event):
+    def __init__(self):
+        super().__init__(priority=50, schema=Schema({"value": int}))
+
+
+class PongEvent(Event):
+    def __init__(self):
+        super().__init__(priority=50, schema=Schema({"value": int, "pid": int}))
+
+
+class QuestionEvent(Event):
+    def __init__(self):
+        super().__init__(priority=50, schema=Schema({"value": int}))
+
+
+class AnswerEvent(Event):
+    def __init__(self):
+        super().__init__(priority=50, schema=Schema({"value": int}))
+
+
+class AskEvent(Event):
+    def __init__(self):
+        super().__init__(priority=50, schema=Schema({"value": int}))
+
+
+class AskedEvent(Event):
+    def __init__(self):
+        super().__init__(priority=50, schema=Schema({"answer": int, "pid": int}))
+
+
+class PingHandler(EventHandler):
+    async def init(self):
+        if self.config is not None and self.config.get("fail_init"):
+            raise Exception("Failed to initialize.")
+        self.event_bus.subscribe(PingEvent, self.handle)
+
+    async def handle(self, event):
+        get_supervisor().fire_event(
+            PongEvent()
+            .init({"value": event.data["value"] + 1, "pid": os.getpid()})
+            .reply_to(event)
+        )
+
+
+class AskHandler(EventHandler):
+    """Asks the main process a question, through the supervisor of the worker."""
+
+    async def init(self):
+        # awaits a reply while handling an event, so it must not hold up the event bus
+        self.event_bus.subscribe(AskEvent, self.handle, DispatchMode.concurrent)
+
+    async def handle(self, event):
+        supervisor = get_supervisor()
+        answer = await supervisor.request(
+            QuestionEvent().init({"value": event.data["value"]}), AnswerEvent, 10
+        )
+        pid = await supervisor.loop.run_in_executor(supervisor.executor, os.getpid)
+        supervisor.fire_event(
+            AskedEvent()
+            .init({"answer": answer.data["value"], "pid": pid})
+            .reply_to(event)
+        )
+
+
+handler_factories = [PingHandler, AskHandler]
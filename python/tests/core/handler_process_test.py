@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import os
+import unittest
+
+from msa.core.event_bus import EventBus
+from msa.core.handler_process import HandlerProcess, HandlerProcessException
+from tests.async_test_util import async_run
+from tests.core.handler_process_fixture import (
+    AnswerEvent,
+    AskedEvent,
+    AskEvent,
+    PingEvent,
+    PongEvent,
+    QuestionEvent,
+)
+
+
+class HandlerProcessTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.event_bus = EventBus(self.loop)
+        self.handler_process = HandlerProcess(
+            self.loop,
+            self.event_bus,
+            logging.getLogger("msa.test"),
+            "tests.core.handler_process_fixture",
+            None,
+        )
+
+    def tearDown(self):
+        if self.handler_process.process.is_alive():
+            self.handler_process.process.terminate()
+        self.loop.close()
+
+    def test_round_trip(self):
+        async def main():
+            await self.handler_process.start()
+            listener = self.loop.create_task(self.event_bus.listen())
+
+            request = PingEvent().init({"value": 1}).correlate()
+            future = self.event_bus.expect_result(PongEvent, request.correlation_id)
+            await self.event_bus.fire_event(request)
+            reply = await self.event_bus.wait_for_result(future, 10)
+
+            listener.cancel()
+            await self.handler_process.stop()
+            return reply
+
+        reply = async_run(self.loop, main())
+
+        self.assertIsInstance(reply, PongEvent)
+        self.assertEqual(reply.data["value"], 2)
+        self.assertNotEqual(reply.data["pid"], os.getpid())
+        self.assertFalse(self.handler_process.process.is_alive())
+
+    def test_worker_request(self):
+        def answer(question):
+            self.loop.create_task(
+                self.event_bus.fire_event(
+                    AnswerEvent()
+                    .init({"value": question.data["value"] * 10})
+                    .reply_to(question)
+                )
+            )
+
+        self.event_bus.subscribe(QuestionEvent, answer)
+
+        async def main():
+            await self.handler_process.start()
+            listener = self.loop.create_task(self.event_bus.listen())
+
+            request = AskEvent().init({"value": 4}).correlate()
+            future = self.event_bus.expect_result(AskedEvent, request.correlation_id)
+            await self.event_bus.fire_event(request)
+            reply = await self.event_bus.wait_for_result(future, 10)
+            # the worker stops listening for answers once it has its answer
+            await asyncio.sleep(0.5)
+            subscribers = self.event_bus._get_subscribers(AnswerEvent)
+
+            listener.cancel()
+            await self.handler_process.stop()
+            return reply, subscribers
+
+        reply, subscribers = async_run(self.loop, main())
+
+        self.assertIsInstance(reply, AskedEvent)
+        self.assertEqual(40, reply.data["answer"])
+        self.assertNotEqual(os.getpid(), reply.data["pid"])
+        self.assertEqual((), subscribers)
+
+    def test_worker_failing_to_start(self):
+        self.handler_process = HandlerProcess(
+            self.loop,
+            self.event_bus,
+            logging.getLogger("msa.test"),
+            "tests.core.handler_process_fixture",
+            {"fail_init": True},
+        )
+
+        async def main():
+            start = self.loop.time()
+            with self.assertRaises(HandlerProcessException):
+                await self.handler_process.start()
+            await self.handler_process.stop()
+            return self.loop.time() - start
+
+        # fails once the worker exits rather than after the start timeout
+        self.assertLess(async_run(self.loop, main()), 10)
+
+    def test_mirrors_worker_subscriptions(self):
+        async def main():
+            await self.handler_process.start()
+            subscribers = self.event_bus._get_subscribers(PingEvent)
+            await self.handler_process.stop()
+            return subscribers
+
+        subscribers = async_run(self.loop, main())
+
+        self.assertEqual(subscribers, (self.handler_process.forward,))
+        self.assertEqual(self.event_bus._get_subscribers(PingEvent), ())
@@ -0,0 +1,65 @@
+import json
+import unittest
+
+import schema
+from schema import And, Schema
+
+from msa.core.event import Event
+from msa.core.lazy_event import LazyEvent
+
+
+class LazyEventTest(unittest.TestCase):
+    def test_metadata_without_data(self):
+        metadata = LazyPayloadEvent().init({"value": 1}).target("client").get_metadata()
+        metadata["event_data"] = {"value": "invalid"}
+
+        lazy_event = LazyEvent(metadata)
+
+        # reading the metadata does not validate the data
+        self.assertEqual(metadata["event_type"], lazy_event.event_type)
+        self.assertEqual("client", lazy_event.propagate_target)
+        self.assertEqual(10, lazy_event.priority)
+        self.assertIs(metadata, lazy_event.get_metadata())
+
+        with self.assertRaises(schema.SchemaError):
+            lazy_event.data
+
+    def test_decode_data_on_first_access(self):
+        event = LazyPayloadEvent().init({"value": 1}).correlate()
+        metadata = event.get_metadata()
+        raw_data = json.dumps(metadata.pop("event_data")).encode("utf-8")
+        decoded = []
+
+        def decode_data(data):
+            decoded.append(data)
+            return json.loads(data)
+
+        lazy_event = LazyEvent(metadata, raw_data=raw_data, decode_data=decode_data)
+        self.assertEqual(event.correlation_id, lazy_event.correlation_id)
+        self.assertEqual([], decoded)
+
+        self.assertEqual({"value": 1}, lazy_event.data)
+        self.assertEqual(event, lazy_event.get_event())
+        self.assertIs(lazy_event.get_event(), lazy_event.get_event())
+        self.assertEqual([raw_data], decoded)
+
+    def test_network_propagate(self):
+        lazy_event = LazyEvent(
+            LazyPayloadEvent().init({"value": 1}).network_propagate().get_metadata()
+        )
+        self.assertTrue(lazy_event._network_propagate)
+
+        lazy_event._network_propagate = False
+        self.assertFalse(lazy_event.get_event()._network_propagate)
+
+
+class LazyPayloadEvent(Event):
+    __slots__ = ()
+    schema = Schema({"value": And(int, lambda value: value > 0)})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+
+from schema import (
+    And,
+    Optional,
+    Or,
+    Regex,
+    Schema,
+    SchemaError,
+    SchemaMissingKeyError,
+    SchemaWrongKeyError,
+    Use,
+)
+
+from msa.builtins.scripting.events import AddScriptEvent, GetScriptEvent
+from msa.core.config_manager import CONFIG_SCHEMA
+from msa.core.schema_compiler import compile_schema
+
+SCRIPT = {
+    "id": 1,
+    "name": "script",
+    "crontab": None,
+    "created": "2020-01-01 00:00:00",
+    "last_edited": "2020-01-01 00:00:00",
+    "last_run": None,
+    "scheduled_for": None,
+    "script_contents": 'print("hello world")',
+    "running": False,
+}
+
+
+class SchemaCompilerTest(unittest.TestCase):
+    def assertSameAsSchema(self, schema, values):
+        """Asserts that the compiled schema accepts and rejects the same values as the schema library, and returns the
+        same validated data."""
+        validator = compile_schema(schema)
+        for value in values:
+            with self.subTest(schema=schema, value=value):
+                try:
+                    expected = schema.validate(value)
+                except SchemaError:
+                    with self.assertRaises(SchemaError):
+                        validator(value)
+                else:
+                    self.assertEqual(expected, validator(value))
+
+    def test_types_and_literals(self):
+        values = [None, 0, 1, True, 1.5, "", "a", [], {}]
+        self.assertSameAsSchema(Schema(int), values)
+        self.assertSameAsSchema(Schema(str), values)
+        self.assertSameAsSchema(Schema(None), values)
+        self.assertSameAsSchema(Schema("a"), values)
+
+    def test_and_or_use(self):
+        values = [None, 0, "", "a", "a b", "12", ["a"]]
+        self.assertSameAsSchema(Schema(And(str, len)), values)
+        self.assertSameAsSchema(Schema(Or(None, And(str, len))), values)
+        self.assertSameAsSchema(Schema(And(str, lambda s: " " not in s)), values)
+        self.assertSameAsSchema(Schema(Use(int)), values)
+        self.assertSameAsSchema(Schema(Or(Use(int), str)), values)
+
+    def test_iterables(self):
+        values = [None, [], [1], [1, "a"], [None], (1,), ("a", 2), {1}]
+        self.assertSameAsSchema(Schema([int]), values)
+        self.assertSameAsSchema(Schema([int, str]), values)
+        self.assertSameAsSchema(Schema((int,)), values)
+        self.assertSameAsSchema(Schema([dict]), [[{}], [{"a": 1}], [1]])
+
+    def test_dicts(self):
+        schema = Schema(
+            {
+                "name": And(str, len),
+                Optional("tag"): str,
+                Optional("count", default=1): int,
+                Optional(str): object,
+            }
+        )
+        values = [
+            None,
+            {},
+            {"name": "a"},
+            {"name": ""},
+            {"name": "a", "tag": "b", "count": 2},
+            {"name": "a", "tag": 1},
+            {"name": "a", "other": [1]},
+            {"name": "a", 1: 2},
+        ]
+        self.assertSameAsSchema(schema, values)
+        self.assertSameAsSchema(Schema({}), values)
+        self.assertSameAsSchema(Schema({str: int}), [{}, {"a": 1}, {"a": "1"}, {1: 1}])
+        self.assertSameAsSchema(
+            Schema({"nested": {"value": int}}),
+            [{"nested": {"value": 1}}, {"nested": {"value": "1"}}, {"nested": {}}],
+        )
+
+    def test_dict_errors(self):
+        validator = compile_schema(Schema({"name": str, Optional("tag"): str}))
+
+        with self.assertRaises(SchemaMissingKeyError):
+            validator({"tag": "a"})
+
+        with self.assertRaises(SchemaWrongKeyError):
+            validator({"name": "a", "other": 1})
+
+        with self.assertRaisesRegex(SchemaError, "Key 'name' error"):
+            validator({"name": 1})
+
+    def test_library_constructs(self):
+        self.assertSameAsSchema(Schema(Regex("^[a-z]+$")), ["abc", "ABC", 1])
+        self.assertSameAsSchema(
+            Schema({"value": Schema({"a": int}, ignore_extra_keys=True)}),
+            [{"value": {"a": 1, "b": 2}}, {"value": {"b": 2}}],
+        )
+        self.assertSameAsSchema(
+            Schema({"value": int}, ignore_extra_keys=True),
+            [{"value": 1, "other": 2}, {"other": 2}],
+        )
+
+    def test_event_schemas(self):
+        self.assertSameAsSchema(
+            GetScriptEvent.schema,
+            [SCRIPT, {**SCRIPT, "id": True}, {**SCRIPT, "crontab": ""}, {}],
+        )
+        self.assertSameAsSchema(
+            AddScriptEvent.schema,
+            [
+                {"name": "script", "script_contents": "pass"},
+                {"name": "a script", "script_contents": "pass"},
+                {"name": "script", "script_contents": "pass", "crontab": "* * * * *"},
+                {"name": "script", "script_contents": "pass", "crontab": "bad"},
+            ],
+        )
+
+    def test_config_schema(self):
+        config = {
+            "agent": {"name": "msa", "user_title": "user"},
+            "plugin_modules": ["msa.plugins.rss_feed"],
+            "module_config": {},
+            "logging": {
+                "global_log_level": "info",
+                "log_file_location": "msa.log",
+                "granular_log_levels": [{"namespace": "msa", "level": "debug"}],
+                "truncate_log_file": False,
+            },
+            "event_bus": {
+                "overflow_policy": "reject",
+                "lanes": [{"name": "all", "max_priority": None}],
+            },
+        }
+        # the compiled schema converts values the same way
+        self.assertEqual(
+            CONFIG_SCHEMA.validate(config), compile_schema(CONFIG_SCHEMA)(config)
+        )
+        self.assertSameAsSchema(
+            CONFIG_SCHEMA,
+            [config, {**config, "plugin_modules": [1]}, {**config, "extra": 1}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import gc
+import threading
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from msa.core.event import Event
+from msa.core.event_bus import EventBus
+from msa.core.event_queue import EventQueueFullException, OverflowPolicy
+from msa.core.supervisor import Supervisor
+from tests.async_test_util import async_run
+
+
+class SupervisorFireEventTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.supervisor = Supervisor()
+        self.supervisor.loop = self.loop
+        self.supervisor.logger = mock.MagicMock()
+        self.supervisor.event_bus = EventBus(self.loop)
+
+        self.events = []
+        self.supervisor.event_bus.subscribe(FakeEvent, self.events.append)
+
+    def tearDown(self):
+        self.supervisor.executor.shutdown()
+        self.loop.close()
+
+    def test_fire_event_on_loop_thread_queues_directly(self):
+
+        new_event = FakeEvent()
+
+        async def main():
+            fired = self.supervisor.fire_event(new_event)
+            # queued without waiting for the loop to run a callback or task
+            assert self.supervisor.event_bus.queue.qsize() == 1
+            assert await fired
+            await self.supervisor.event_bus.listen(timeout=0.1)
+
+        async_run(self.loop, main())
+
+        self.assertEqual([new_event], self.events)
+
+    def test_fire_event_waits_for_room(self):
+        self.supervisor.event_bus = EventBus(self.loop, max_queue_size=1)
+        self.supervisor.event_bus.subscribe(FakeEvent, self.events.append)
+
+        async def main():
+            assert await self.supervisor.fire_event(FakeEvent())
+            fired = self.supervisor.fire_event(FakeEvent())
+
+            await asyncio.sleep(0)
+            assert not fired.done()
+
+            await self.supervisor.event_bus.listen(timeout=0.1)
+            assert await fired
+
+        async_run(self.loop, main())
+
+        self.assertEqual(2, len(self.events))
+        self.assertEqual(1, self.supervisor.event_bus.queue.counters["blocked"])
+
+    def test_fire_event_rejected(self):
+        self.supervisor.event_bus = EventBus(
+            self.loop, max_queue_size=1, overflow_policy=OverflowPolicy.reject
+        )
+        self.supervisor.event_bus.subscribe(FakeEvent, self.events.append)
+
+        async def main():
+            assert await self.supervisor.fire_event(FakeEvent())
+            await self.supervisor.fire_event(FakeEvent())
+
+        with self.assertRaises(EventQueueFullException):
+            async_run(self.loop, main())
+
+    def test_fire_event_rejected_without_awaiting(self):
+        self.supervisor.event_bus = EventBus(
+            self.loop, max_queue_size=1, overflow_policy=OverflowPolicy.reject
+        )
+        self.supervisor.event_bus.subscribe(FakeEvent, self.events.append)
+        errors = []
+        self.loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+        async def main():
+            assert await self.supervisor.fire_event(FakeEvent())
+            # fired and forgotten, as handlers do
+            self.supervisor.fire_event(FakeEvent())
+            await asyncio.sleep(0)
+
+        async_run(self.loop, main())
+        gc.collect()
+
+        self.supervisor.logger.warning.assert_called_once()
+        self.assertEqual([], errors)
+
+    def test_fire_event_from_another_thread(self):
+
+        new_events = [FakeEvent(), FakeEvent()]
+
+        def fire_from_thread():
+            fired = self.supervisor.fire_event(new_events[0])
+            fired_many = self.supervisor.fire_events(new_events[1:])
+            assert isinstance(fired, Future)
+            return fired.result(timeout=1), fired_many.result(timeout=1)
+
+        async def main():
+            results = await self.loop.run_in_executor(
+                self.supervisor.executor, fire_from_thread
+            )
+            await self.supervisor.event_bus.listen(timeout=0.1)
+            return results
+
+        self.assertEqual((True, 1), async_run(self.loop, main()))
+        self.assertEqual(new_events, self.events)
+
+    def test_fire_event_from_thread_without_loop_running(self):
+
+        fired = []
+        thread = threading.Thread(
+            target=lambda: fired.append(self.supervisor.fire_event(FakeEvent()))
+        )
+        thread.start()
+        thread.join()
+
+        # the loop is not running, so the event is queued straight away
+        self.assertTrue(fired[0].result())
+        self.assertEqual(1, self.supervisor.event_bus.queue.qsize())
+
+
+class FakeEvent(Event):
+    def __init__(self):
+        super().__init__(priority=0, schema={})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from schema import Schema
+
+from msa.core.event import Event
+from msa.server import event_propagate, wire_codec
+from msa.server.event_propagate import EventPropagationRouter, WebsocketSender
+from msa.server.websocket_subscriptions import WebsocketSubscriptions
+
+
+class FakeWebsocket:
+    def __init__(self, blocked=False):
+        self.closed = False
+        self.sent = []
+        self.unblocked = asyncio.Event()
+        if not blocked:
+            self.unblocked.set()
+
+    async def send_str(self, data):
+        await self.unblocked.wait()
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        await self.unblocked.wait()
+        self.sent.append(data)
+
+    async def close(self, message=b""):
+        self.closed = True
+
+
+class EventPropagationRouterTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.get_event_loop()
+        self.router = EventPropagationRouter()
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.router.app_stop(None))
+
+    def propagate(self, *websockets, binary=(), event=None, subscriptions=None):
+        if subscriptions is None:
+            subscriptions = WebsocketSubscriptions()
+            for index, ws in enumerate(websockets):
+                subscriptions.connect(f"client {index}", ws)
+        app = {
+            "websockets": list(websockets),
+            "binary_websockets": set(binary),
+            "websocket_subscriptions": subscriptions,
+        }
+        self.loop.run_until_complete(self.router.app_start(app))
+
+        if event is None:
+            event = PropagatedEvent().init({"value": 1}).network_propagate()
+        self.loop.run_until_complete(self.router.handle_event_propagate(event))
+        # let the writer tasks run
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        return event
+
+    def test_frames_encoded_once(self):
+        json_clients = [FakeWebsocket(), FakeWebsocket()]
+        binary_clients = [FakeWebsocket(), FakeWebsocket()]
+
+        with patch.object(wire_codec, "encode", wraps=wire_codec.encode) as encode_mock:
+            event = self.propagate(
+                *json_clients, *binary_clients, binary=binary_clients
+            )
+
+        encode_mock.assert_called_once()
+        self.assertIs(json_clients[0].sent[0], json_clients[1].sent[0])
+        self.assertIs(binary_clients[0].sent[0], binary_clients[1].sent[0])
+        self.assertEqual(
+            event.data,
+            wire_codec.decode(binary_clients[0].sent[0])["payload"]["event_data"],
+        )
+
+    def test_slow_client_does_not_block_others(self):
+        slow_client = FakeWebsocket(blocked=True)
+        fast_client = FakeWebsocket()
+
+        self.propagate(slow_client, fast_client)
+
+        self.assertEqual([], slow_client.sent)
+        self.assertEqual(1, len(fast_client.sent))
+
+        slow_client.unblocked.set()
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertEqual(fast_client.sent, slow_client.sent)
+
+    def test_closed_clients_are_forgotten(self):
+        client = FakeWebsocket()
+        self.propagate(client)
+        self.assertIn(client, self.router.senders)
+
+        self.propagate()
+        self.assertEqual({}, self.router.senders)
+
+    def test_targeted_event_sent_to_target_only(self):
+        clients = [FakeWebsocket(), FakeWebsocket()]
+        subscriptions = WebsocketSubscriptions()
+        subscriptions.connect("alice", clients[0])
+        subscriptions.connect("bob", clients[1])
+        # targeted events are sent whatever the subscriptions of the target
+        subscriptions.subscribe("bob", ["Other"])
+
+        event = PropagatedEvent().init({"value": 1}).network_propagate()
+        event.target("bob")
+        self.propagate(*clients, event=event, subscriptions=subscriptions)
+
+        self.assertEqual([], clients[0].sent)
+        self.assertEqual(1, len(clients[1].sent))
+
+    def test_untargeted_event_sent_to_subscribers(self):
+        clients = [FakeWebsocket(), FakeWebsocket(), FakeWebsocket()]
+        subscriptions = WebsocketSubscriptions()
+        for client_id, ws in zip(["all events", "subscribed", "other"], clients):
+            subscriptions.connect(client_id, ws)
+        subscriptions.subscribe("subscribed", ["Other", "Propagated"])
+        subscriptions.subscribe("other", ["Other"])
+
+        self.propagate(*clients, subscriptions=subscriptions)
+
+        self.assertEqual([1, 1, 0], [len(ws.sent) for ws in clients])
+
+
+class WebsocketSenderTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.get_event_loop()
+
+    def test_drops_lowest_priority_events(self):
+        async def run():
+            ws = FakeWebsocket(blocked=True)
+            sender = WebsocketSender(ws, max_queued=3)
+            queued = [
+                sender.send(priority, frame)
+                for priority, frame in [
+                    (10, "a"),
+                    (50, "b"),
+                    (50, "c"),
+                    # evicts the oldest of the lowest priority events
+                    (10, "d"),
+                    # lower priority than any queued event
+                    (100, "e"),
+                ]
+            ]
+            ws.unblocked.set()
+            await asyncio.sleep(0.01)
+            sender.close()
+            return queued, sender, ws
+
+        queued, sender, ws = self.loop.run_until_complete(run())
+
+        self.assertEqual([True, True, True, True, False], queued)
+        self.assertEqual(2, sender.dropped)
+        self.assertEqual(["a", "c", "d"], ws.sent)
+
+    def test_disconnects_slow_client(self):
+        async def run():
+            ws = FakeWebsocket(blocked=True)
+            sender = WebsocketSender(ws)
+            sender.send(10, "a")
+            await asyncio.sleep(0.05)
+            return sender, ws
+
+        with patch.object(event_propagate, "SEND_TIMEOUT", 0.01):
+            sender, ws = self.loop.run_until_complete(run())
+
+        self.assertTrue(ws.closed)
+        self.assertTrue(sender.writer.done())
+        self.assertFalse(sender.send(10, "b"))
+
+
+class PropagatedEvent(Event):
+    schema = Schema({"value": int})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from msa.server.default_routes import register_default_routes
+from msa.server.route_adapter import RouteAdapter
+from msa.server.server_response import ServerResponseText, ServerResponseType
+
+
+class RouteAdapterWebsocketTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.get_event_loop()
+        self.adapter = RouteAdapter()
+        self.slow_route_release = asyncio.Event()
+
+        async def slow_route(request):
+            await self.slow_route_release.wait()
+            return ServerResponseText(ServerResponseType.success, "slow")
+
+        async def fast_route(request):
+            return ServerResponseText(ServerResponseType.success, "fast")
+
+        self.adapter.get("/slow")(slow_route)
+        self.adapter.get("/fast")(fast_route)
+        register_default_routes(self.adapter)
+
+        app = web.Application()
+        self.adapter.register_app(app)
+        app.add_routes(self.adapter.get_route_table())
+
+        async def get_client():
+            return TestClient(TestServer(app), loop=self.loop)
+
+        self.client = self.loop.run_until_complete(get_client())
+        self.loop.run_until_complete(self.client.start_server())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+
+    def request(self, route, request_id=None):
+        payload = {"verb": "get", "route": route, "payload": None}
+        if request_id is not None:
+            payload["id"] = request_id
+        return payload
+
+    def test_requests_with_ids_run_concurrently(self):
+        async def run():
+            ws = await self.client.ws_connect("/ws")
+            notify_id = await ws.receive_json()
+            self.assertEqual("notify_id", notify_id["type"])
+
+            await ws.send_json(self.request("/slow", request_id=1))
+            await ws.send_json(self.request("/fast", request_id=2))
+
+            # the fast request is not held up by the slow one
+            fast = await ws.receive_json(timeout=5)
+            self.slow_route_release.set()
+            slow = await ws.receive_json(timeout=5)
+            await ws.close()
+            return fast, slow
+
+        fast, slow = self.loop.run_until_complete(run())
+
+        self.assertEqual(2, fast["id"])
+        self.assertEqual("fast", fast["payload"]["text"])
+        self.assertEqual(1, slow["id"])
+        self.assertEqual("slow", slow["payload"]["text"])
+
+    def test_requests_without_ids_are_answered_in_order(self):
+        async def run():
+            ws = await self.client.ws_connect("/ws")
+            await ws.receive_json()
+
+            await ws.send_json(self.request("/slow"))
+            await ws.send_json(self.request("/fast"))
+            await ws.send_json(self.request("/missing", request_id="missing"))
+            self.loop.call_later(0.05, self.slow_route_release.set)
+
+            responses = [await ws.receive_json(timeout=5) for _ in range(3)]
+            await ws.close()
+            return responses
+
+        slow, fast, missing = self.loop.run_until_complete(run())
+
+        self.assertEqual("slow", slow["payload"]["text"])
+        self.assertNotIn("id", slow)
+        self.assertEqual("fast", fast["payload"]["text"])
+        self.assertEqual("error", missing["type"])
+        self.assertEqual("missing", missing["id"])
+
+    def test_subscribe_to_propagated_events(self):
+        subscriptions = self.adapter.app["websocket_subscriptions"]
+
+        async def run():
+            ws = await self.client.ws_connect("/ws")
+            client_id = (await ws.receive_json())["payload"]["id"]
+            self.assertIn(client_id, subscriptions.clients)
+
+            await ws.send_json(
+                {
+                    "id": 1,
+                    "verb": "put",
+                    "route": "/core/propagation/subscriptions",
+                    "payload": {"patterns": ["Script.*"]},
+                }
+            )
+            response = await ws.receive_json(timeout=5)
+            patterns = subscriptions.patterns[client_id]
+            await ws.close()
+            return client_id, response, patterns
+
+        client_id, response, patterns = self.loop.run_until_complete(run())
+
+        self.assertEqual("success", response["payload"]["status"])
+        self.assertEqual(["Script.*"], [pattern.pattern for pattern in patterns])
+        self.assertNotIn(client_id, subscriptions.clients)
+
+
+if __name__ == "__main__":
+    unittest.main()
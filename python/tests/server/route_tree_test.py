@@ -0,0 +1,81 @@
+import unittest
+
+from msa.server.route_adapter import RouteAdapter
+from msa.server.route_tree import RouteTree
+
+
+class RouteTreeTest(unittest.TestCase):
+    def setUp(self):
+        self.tree = RouteTree()
+        self.tree.add("/script", "list")
+        self.tree.add("/script/{name}", "get")
+        self.tree.add("/script/{name}/run", "run")
+        self.tree.add("/script/new", "new")
+        self.tree.add("/api/v{version}/{resource}", "versioned")
+
+    def test_static_route(self):
+        self.assertEqual(("list", {}), self.tree.resolve("/script"))
+
+    def test_static_route_trailing_slash(self):
+        self.assertEqual(("list", {}), self.tree.resolve("/script/"))
+
+    def test_params(self):
+        self.assertEqual(("get", {"name": "hello"}), self.tree.resolve("/script/hello"))
+        self.assertEqual(
+            ("run", {"name": "hello"}), self.tree.resolve("/script/hello/run/")
+        )
+
+    def test_static_segment_precedes_param(self):
+        self.assertEqual(("new", {}), self.tree.resolve("/script/new"))
+        self.assertEqual(("run", {"name": "new"}), self.tree.resolve("/script/new/run"))
+
+    def test_mixed_segment(self):
+        self.assertEqual(
+            ("versioned", {"version": "2", "resource": "script"}),
+            self.tree.resolve("/api/v2/script"),
+        )
+
+    def test_no_match(self):
+        self.assertIsNone(self.tree.resolve("/scripts"))
+        self.assertIsNone(self.tree.resolve("/script/hello/stop"))
+        self.assertIsNone(self.tree.resolve("/script/hello world"))
+        self.assertIsNone(self.tree.resolve("/api/2/script"))
+
+    def test_conflicting_routes(self):
+        with self.assertRaises(Exception):
+            self.tree.add("/script/{id}", "get by id")
+
+    def test_route_adapter_resolves_registered_routes(self):
+        adapter = RouteAdapter()
+
+        def get_script(request):
+            pass
+
+        adapter.get("/script/{name}")(get_script)
+
+        # routes resolve as soon as they are registered, without building the aiohttp route table
+        self.assertEqual(
+            (get_script, {"name": "hello"}),
+            adapter.lookup_route_and_resolve_url_params("get", "/script/hello"),
+        )
+        with self.assertRaises(Exception):
+            adapter.lookup_route_and_resolve_url_params("post", "/script/hello")
+
+    def test_route_adapter_rejects_conflicting_routes(self):
+        adapter = RouteAdapter()
+
+        def get_script(request):
+            pass
+
+        adapter.post("/script/{name}")(get_script)
+
+        with self.assertRaisesRegex(Exception, "Route POST /script/{name}"):
+            adapter.post("/script/{name}")
+        with self.assertRaises(Exception):
+            adapter.post("/script/{id}")(get_script)
+
+        self.assertEqual({"/script/{name}": get_script}, adapter.routes["post"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from msa.server.url_param_parser import UrlParamParser
+from msa.server.url_param_parser import UrlParamParser, split_query
 
 
 class UrlParamParserTest(unittest.TestCase):
@@ -121,3 +121,10 @@ class UrlParamParserTest(unittest.TestCase):
     def test_missing_params_too_long_does_not_parse(self):
         parser = UrlParamParser("/fake_route/{resource}/{action}")
         self.assertEqual({}, parser.resolve_params("/fake_route/moe/test/extra"))
+
+    def test_split_query(self):
+        self.assertEqual(("/fake_route", {}), split_query("/fake_route"))
+        self.assertEqual(
+            ("/fake_route/", {"after": "2", "codec": "json"}),
+            split_query("/fake_route/?after=1&codec=json&after=2"),
+        )
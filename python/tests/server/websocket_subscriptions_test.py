@@ -0,0 +1,57 @@
+import re
+import unittest
+
+from schema import Schema
+
+from msa.core.event import Event
+from msa.server.websocket_subscriptions import WebsocketSubscriptions
+
+
+class WebsocketSubscriptionsTest(unittest.TestCase):
+    def setUp(self):
+        self.subscriptions = WebsocketSubscriptions()
+        self.subscriptions.connect("alice", "alice ws")
+        self.subscriptions.connect("bob", "bob ws")
+
+    def test_recipients_of_targeted_event(self):
+        self.assertEqual(("bob ws",), self.subscriptions.get_recipients(event("bob")))
+        self.assertEqual((), self.subscriptions.get_recipients(event("carol")))
+
+    def test_recipients_of_untargeted_event(self):
+        self.assertEqual(
+            ["alice ws", "bob ws"], self.subscriptions.get_recipients(event("all"))
+        )
+
+        self.subscriptions.subscribe("bob", ["Script.*"])
+        self.assertEqual(["alice ws"], self.subscriptions.get_recipients(event("all")))
+
+        self.subscriptions.subscribe("bob", ["Subscription"])
+        self.assertEqual(
+            ["alice ws", "bob ws"], self.subscriptions.get_recipients(event("all"))
+        )
+
+        self.subscriptions.subscribe("bob", None)
+        self.subscriptions.disconnect("alice")
+        self.assertEqual(["bob ws"], self.subscriptions.get_recipients(event("all")))
+
+    def test_subscribe_errors(self):
+        with self.assertRaises(KeyError):
+            self.subscriptions.subscribe("carol", ["Script.*"])
+
+        with self.assertRaises(re.error):
+            self.subscriptions.subscribe("bob", ["Script("])
+
+
+def event(target):
+    return SubscriptionEvent().init({"value": 1}).target(target)
+
+
+class SubscriptionEvent(Event):
+    schema = Schema({"value": int})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import json
+import unittest
+from unittest.mock import patch
+
+from schema import And, Schema
+
+from msa.core.event import Event
+from msa.core.event_registry import EventTypeNotFoundException
+from msa.core.lazy_event import LazyEvent
+from msa.server import wire_codec
+from msa.server.wire_codec import WireCodecException
+
+
+class WireCodecTest(unittest.TestCase):
+    def test_values(self):
+        values = [
+            None,
+            True,
+            False,
+            0,
+            -1,
+            127,
+            -128,
+            300,
+            -(2 ** 40),
+            2 ** 70,
+            1.5,
+            "",
+            "text",
+            "ü" * 300,
+            [],
+            [1, "a", None],
+            {},
+            {"nested": {"list": [1, 2.5, {"key": False}]}},
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(value, wire_codec.decode(wire_codec.encode(value)))
+
+        # values are carried like json
+        self.assertEqual([1, 2], wire_codec.decode(wire_codec.encode((1, 2))))
+        self.assertEqual({"1": 1}, wire_codec.decode(wire_codec.encode({1: 1})))
+
+    def test_event(self):
+        event = (
+            CodecEvent()
+            .init({"prop_1": 1, "prop_2": "text"})
+            .network_propagate()
+            .target("client")
+            .correlate()
+        )
+
+        encoded = wire_codec.encode({"type": "event_propagate", "payload": event})
+        decoded = wire_codec.decode(encoded)["payload"]
+
+        self.assertEqual(
+            {**event.get_metadata(), "generation_time": event.generation_time},
+            {**decoded, "event_type": event.get_metadata()["event_type"]},
+        )
+
+        deserialized = Event.deserialize(decoded)
+        self.assertEqual(event, deserialized)
+        self.assertEqual(event.generation_time, deserialized.generation_time)
+        self.assertEqual(event.correlation_id, deserialized.correlation_id)
+        self.assertEqual("client", deserialized.propagate_target)
+
+        self.assertEqual(
+            "tests.server.wire_codec_test.CodecEvent", decoded["event_type"]
+        )
+        self.assertLess(
+            len(encoded),
+            len(
+                json.dumps({"type": "event_propagate", "payload": event.get_metadata()})
+            ),
+        )
+
+    def test_lazy_event(self):
+        event = CodecEvent().init({"prop_1": 1, "prop_2": "text"}).network_propagate()
+        encoded = wire_codec.encode({"type": "event_propagate", "payload": event})
+
+        lazy_event = wire_codec.decode(encoded, lazy=True)["payload"]
+        self.assertIsInstance(lazy_event, LazyEvent)
+        self.assertEqual("all", lazy_event.propagate_target)
+        self.assertEqual(event, lazy_event.get_event())
+
+        # forwarded as received
+        self.assertEqual(
+            encoded,
+            wire_codec.encode({"type": "event_propagate", "payload": lazy_event}),
+        )
+
+        lazy_event._network_propagate = False
+        forwarded = wire_codec.decode(wire_codec.encode(lazy_event))
+        self.assertFalse(forwarded["_network_propagate"])
+        self.assertEqual(event.data, forwarded["event_data"])
+
+    def test_unknown_event_type(self):
+        event = CodecEvent().init({"prop_1": 1, "prop_2": "text"}).target("client")
+
+        # as sent by a peer that loads an event class the receiver does not
+        with patch.dict(
+            wire_codec._type_names, {CodecEvent: b"unknown_plugin.UnknownEvent"}
+        ):
+            encoded = wire_codec.encode({"type": "event_propagate", "payload": event})
+
+        self.assertEqual(
+            "unknown_plugin.UnknownEvent",
+            wire_codec.decode(encoded)["payload"]["event_type"],
+        )
+
+        lazy_event = wire_codec.decode(encoded, lazy=True)["payload"]
+        self.assertEqual("unknown_plugin.UnknownEvent", lazy_event.event_type)
+        self.assertEqual("client", lazy_event.propagate_target)
+        with self.assertRaises(EventTypeNotFoundException):
+            lazy_event.get_event()
+
+        # forwarded as received
+        self.assertEqual(
+            encoded,
+            wire_codec.encode({"type": "event_propagate", "payload": lazy_event}),
+        )
+
+    def test_malformed_data(self):
+        encoded = wire_codec.encode({"key": [1, 2, 3]})
+
+        for data in [
+            b"",
+            bytes([wire_codec.VERSION + 1]) + encoded[1:],
+            encoded[:-1],
+            encoded + b"\x00",
+        ]:
+            with self.subTest(data=data):
+                with self.assertRaises(WireCodecException):
+                    wire_codec.decode(data)
+
+        with self.assertRaises(WireCodecException):
+            wire_codec.encode({"key": object()})
+
+        with self.assertRaises(WireCodecException):
+            wire_codec.encode(
+                CodecEvent().init({"prop_1": 1, "prop_2": "text"}).target(1)
+            )
+
+        # events are only carried as records outside of event data
+        with self.assertRaises(WireCodecException):
+            wire_codec.encode(
+                CodecEvent().init({"prop_1": 1, "prop_2": CodecEvent()}, validate=False)
+            )
+
+    def test_accepts_binary(self):
+        self.assertTrue(
+            wire_codec.accepts_binary("application/x-msa, application/json")
+        )
+        self.assertFalse(wire_codec.accepts_binary("application/json"))
+        self.assertFalse(wire_codec.accepts_binary(None))
+
+
+class CodecEvent(Event):
+    __slots__ = ()
+    schema = Schema({"prop_1": int, "prop_2": And(str, len)})
+
+    def __init__(self):
+        super().__init__(priority=10)
+
+
+if __name__ == "__main__":
+    unittest.main()